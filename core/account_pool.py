@@ -0,0 +1,442 @@
+import os
+import time
+import uuid
+import sqlite3
+import logging
+import threading
+from contextlib import closing
+
+from core.utils import generate_random_email
+
+logger = logging.getLogger(__name__)
+
+
+class Account:
+    """
+    가입과 이메일 인증이 완료된 테스트 계정
+    """
+
+    def __init__(self, email, password, nickname, wid, lease_id=None):
+        self.email = email
+        self.password = password
+        self.nickname = nickname
+        self.wid = wid
+        self.lease_id = lease_id  # 대여 식별자 (반환/폐기 시 대여자 확인에 사용)
+
+    def __repr__(self):
+        return f"Account(email={self.email!r}, wid={self.wid!r})"
+
+
+class AccountStore:
+    """
+    계정 정보를 저장하는 로컬 SQLite 저장소 (병렬 워커 프로세스가 같은 파일을 공유)
+
+    - 계정 상태: provisioning(가입 중) → available(대여 가능) → leased(대여 중) → available(반환) 또는 retired(폐기).
+    - 대여와 가입 예약은 BEGIN IMMEDIATE 트랜잭션으로 처리하여 여러 프로세스가 같은 계정을 대여하거나
+      목표 수보다 많은 계정을 동시에 가입하지 않도록 함.
+    - 대여마다 고유한 대여 식별자(lease_owner)를 기록하고, 반환/폐기는 그 식별자를 가진 대여자만 할 수 있음.
+    - 로그인에 필요한 비밀번호가 평문으로 저장되므로 DB 파일은 소유자만 읽을 수 있도록(0600) 생성.
+    """
+
+    def __init__(self, path):
+        """
+        AccountStore 클래스의 생성자.
+
+        Args:
+            path (str): SQLite 파일 경로.
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+        if not os.path.exists(path):
+            # SQLite는 저널 파일도 DB 파일과 같은 권한으로 만듦
+            os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o600))
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS accounts ("
+                " email TEXT PRIMARY KEY, password TEXT NOT NULL, nickname TEXT, wid TEXT,"
+                " base_url TEXT NOT NULL, state TEXT NOT NULL DEFAULT 'available',"
+                " created_at REAL NOT NULL, leased_at REAL, lease_owner TEXT)"
+            )
+
+    def _connect(self):
+        # 자동 커밋 모드로 열고 필요한 곳에서만 명시적으로 트랜잭션 사용
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    @staticmethod
+    def new_lease_id(owner):
+        """
+        대여자 이름(워커 ID 등)에 고유 값을 붙인 대여 식별자를 생성.
+        """
+        return f"{owner}:{uuid.uuid4().hex[:12]}"
+
+    def add(self, account, base_url, state="available"):
+        """
+        계정을 추가.
+
+        Args:
+            account (Account): 추가할 계정.
+            base_url (str): 계정을 가입한 서비스 주소 (다른 환경의 계정을 대여하지 않도록 구분).
+            state (str, optional): 초기 상태. 기본값 "available".
+        """
+        leased_at = time.time() if state == "leased" else None
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO accounts (email, password, nickname, wid, base_url, state, created_at, leased_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (account.email, account.password, account.nickname, account.wid, base_url, state, time.time(), leased_at),
+            )
+
+    def lease(self, base_url, owner, lease_timeout):
+        """
+        대여 가능한 계정 하나를 대여 상태로 바꾸고 반환. 대여 시간이 lease_timeout을 넘은 계정은 다시 대여 가능.
+
+        Args:
+            base_url (str): 서비스 주소.
+            owner (str): 대여자 (워커 ID 등).
+            lease_timeout (float): 반환되지 않은 대여를 회수하기까지의 시간 (초).
+
+        Returns:
+            Account or None: 대여한 계정 (lease_id 포함). 대여 가능한 계정이 없으면 None.
+        """
+        now = time.time()
+        lease_id = self.new_lease_id(owner)
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT email, password, nickname, wid FROM accounts"
+                    " WHERE base_url = ? AND (state = 'available' OR (state = 'leased' AND leased_at < ?))"
+                    " ORDER BY created_at LIMIT 1",
+                    (base_url, now - lease_timeout),
+                ).fetchone()
+                if row:
+                    conn.execute(
+                        "UPDATE accounts SET state = 'leased', leased_at = ?, lease_owner = ? WHERE email = ?",
+                        (now, lease_id, row[0]),
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return Account(*row, lease_id=lease_id) if row else None
+
+    def reserve(self, account, base_url, target_size, stale_after):
+        """
+        대여 가능한 계정과 가입 중인 계정의 합이 target_size보다 작으면 가입 중(provisioning) 계정을 예약.
+
+        - 모든 워커 프로세스의 가입 중인 계정을 함께 세므로 워커 수만큼 초과 생산하지 않음.
+        - stale_after초가 지나도록 완료되지 않은 예약(중단된 프로세스)은 삭제.
+
+        Args:
+            account (Account): 가입할 계정 (wid 없음).
+            base_url (str): 서비스 주소.
+            target_size (int): 유지할 대여 가능 계정 수.
+            stale_after (float): 완료되지 않은 예약을 버리기까지의 시간 (초).
+
+        Returns:
+            bool: 예약했으면 True, 이미 충분하면 False.
+        """
+        now = time.time()
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute(
+                    "DELETE FROM accounts WHERE state = 'provisioning' AND leased_at < ?", (now - stale_after,))
+                count = conn.execute(
+                    "SELECT COUNT(*) FROM accounts WHERE base_url = ? AND state IN ('available', 'provisioning')",
+                    (base_url,),
+                ).fetchone()[0]
+                reserved = count < target_size
+                if reserved:
+                    conn.execute(
+                        "INSERT INTO accounts (email, password, nickname, wid, base_url, state, created_at, leased_at)"
+                        " VALUES (?, ?, ?, NULL, ?, 'provisioning', ?, ?)",
+                        (account.email, account.password, account.nickname, base_url, now, now),
+                    )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return reserved
+
+    def complete(self, email, wid, state="available", lease_id=None):
+        """
+        가입 중인 계정의 wid를 기록하고 상태를 바꿈 (state가 "leased"이면 lease_id로 대여).
+        """
+        now = time.time()
+        leased = state == "leased"
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "UPDATE accounts SET wid = ?, state = ?, created_at = ?, leased_at = ?, lease_owner = ? WHERE email = ?",
+                (wid, state, now, now if leased else None, lease_id if leased else None, email),
+            )
+
+    def remove(self, email):
+        """
+        계정을 삭제 (가입에 실패한 예약 등).
+        """
+        with closing(self._connect()) as conn:
+            conn.execute("DELETE FROM accounts WHERE email = ?", (email,))
+
+    def end_lease(self, email, lease_id, state):
+        """
+        대여를 끝내고 계정 상태를 바꿈. 해당 대여 식별자로 대여 중인 계정만 변경.
+
+        Args:
+            email (str): 계정 이메일 주소.
+            lease_id (str): lease로 받은 대여 식별자.
+            state (str): 변경할 상태 ("available" 또는 "retired").
+
+        Returns:
+            bool: 변경했으면 True. 대여 중이 아니거나 다른 대여자의 계정이면 False.
+        """
+        with closing(self._connect()) as conn:
+            cursor = conn.execute(
+                "UPDATE accounts SET state = ?, leased_at = NULL, lease_owner = NULL"
+                " WHERE email = ? AND state = 'leased' AND lease_owner = ?",
+                (state, email, lease_id),
+            )
+            return cursor.rowcount == 1
+
+    def count(self, base_url, state="available"):
+        """
+        상태별 계정 수를 반환.
+        """
+        with closing(self._connect()) as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM accounts WHERE base_url = ? AND state = ?", (base_url, state)
+            ).fetchone()[0]
+
+
+class AccountPool:
+    """
+    가입/인증이 끝난 계정을 미리 만들어 두는 계정 풀 (생산자/소비자)
+
+    - start() 이후 백그라운드 생산자 스레드가 대여 가능한 계정 수를 TARGET_SIZE로 유지하도록 회원가입을 미리 수행
+      (conftest는 account 픽스처가 처음 요청될 때 시작).
+      가입 중인 계정은 저장소에 예약되므로 여러 워커 프로세스가 함께 생산해도 목표 수를 넘지 않음.
+    - 테스트는 lease()로 계정을 즉시 대여하고, 끝나면 release()로 반환하거나 retire()로 폐기.
+    - 계정 정보(이메일, 비밀번호, 닉네임, wid)는 AccountStore(SQLite)에 저장되어 실행 간에도 재사용.
+    """
+
+    ENABLED = os.getenv("ACCOUNT_POOL", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+    DB_PATH = os.getenv("ACCOUNT_POOL_DB", ".account_pool/accounts.sqlite3")
+    TARGET_SIZE = int(os.getenv("ACCOUNT_POOL_SIZE", "3"))  # 유지할 대여 가능 계정 수
+    PRODUCERS = int(os.getenv("ACCOUNT_POOL_PRODUCERS", "1"))  # 동시에 회원가입을 수행할 생산자 수
+    LEASE_TIMEOUT = float(os.getenv("ACCOUNT_POOL_LEASE_TIMEOUT", "1800"))  # 반환되지 않은 대여 회수 시간 (초)
+    PROVISION_TIMEOUT = float(os.getenv("ACCOUNT_POOL_PROVISION_TIMEOUT", "600"))  # 완료되지 않은 가입 예약을 버리는 시간 (초)
+    NICKNAME = os.getenv("ACCOUNT_POOL_NICKNAME", "아보카도")
+
+    def __init__(self, provision, base_url, store=None, target_size=None, producers=None, owner="main"):
+        """
+        AccountPool 클래스의 생성자.
+
+        Args:
+            provision (callable): (email, password, nickname)을 받아 가입/인증 후 wid를 반환하는 함수.
+            base_url (str): 계정을 가입할 서비스 주소.
+            store (AccountStore, optional): 계정 저장소. 기본값은 DB_PATH의 AccountStore.
+            target_size (int, optional): 유지할 대여 가능 계정 수. 기본값은 TARGET_SIZE.
+            producers (int, optional): 생산자 스레드 수. 기본값은 PRODUCERS.
+            owner (str, optional): 대여자 이름 (워커 ID 등).
+        """
+        self.provision = provision
+        self.base_url = base_url
+        self.store = store or AccountStore(AccountPool.DB_PATH)
+        self.target_size = target_size if target_size is not None else AccountPool.TARGET_SIZE
+        self.producers = producers if producers is not None else AccountPool.PRODUCERS
+        self.owner = owner
+        self._demand = threading.Condition()
+        self._stopped = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """
+        생산자 스레드를 시작.
+
+        Returns:
+            AccountPool: 자기 자신.
+        """
+        for index in range(self.producers):
+            thread = threading.Thread(target=self._produce, name=f"account-producer-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self, timeout=None):
+        """
+        생산자 스레드를 중지하고 종료될 때까지 대기 (진행 중인 회원가입은 끝까지 수행하여 브라우저를 정리).
+
+        Args:
+            timeout (float, optional): 생산자별 최대 대기 시간 (초). 기본값은 끝날 때까지 대기.
+        """
+        self._stopped.set()
+        with self._demand:
+            self._demand.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+            if thread.is_alive():
+                logger.warning(f"계정 생산자가 {timeout}초 안에 종료되지 않았습니다: {thread.name}")
+
+    def lease(self, timeout=120):
+        """
+        대여 가능한 계정을 대여. 없으면 생산자가 계정을 만들 때까지 대기 (생산자가 없으면 직접 가입).
+
+        Args:
+            timeout (float, optional): 최대 대기 시간 (초). 기본값 120초.
+
+        Returns:
+            Account: 대여한 계정.
+
+        Raises:
+            TimeoutError: 시간 내에 계정을 대여하지 못한 경우 발생.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            account = self.store.lease(self.base_url, self.owner, AccountPool.LEASE_TIMEOUT)
+            # 대여로 줄어든 만큼 생산자가 보충하도록 알림
+            with self._demand:
+                self._demand.notify_all()
+            if account:
+                return account
+
+            if not self._threads:
+                return self._provision_one(state="leased")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"{timeout}초 안에 대여 가능한 계정을 받지 못했습니다.")
+            with self._demand:
+                self._demand.wait(min(remaining, 1.0))
+
+    def release(self, account):
+        """
+        계정을 풀에 반환하여 다른 테스트가 다시 대여할 수 있도록 함.
+        """
+        self._end_lease(account, "available")
+
+    def retire(self, account):
+        """
+        계정을 폐기 (상태가 변경되어 재사용할 수 없는 경우).
+        """
+        self._end_lease(account, "retired")
+
+    def _end_lease(self, account, state):
+        # 대여 시간이 지나 회수된 계정이나 다른 대여자의 계정은 변경하지 않음
+        if not self.store.end_lease(account.email, account.lease_id, state):
+            logger.warning(f"대여 중인 계정이 아니므로 상태를 바꾸지 않습니다 ({state}): {account}")
+            return
+        with self._demand:
+            self._demand.notify_all()
+
+    def _produce(self):
+        while not self._stopped.is_set():
+            account = self._new_account()
+            if not self.store.reserve(account, self.base_url, self.target_size, AccountPool.PROVISION_TIMEOUT):
+                with self._demand:
+                    self._demand.wait(5)
+                continue
+            try:
+                self._provision(account)
+            except Exception as e:
+                logger.warning(f"계정 생성 중 오류가 발생했습니다: {str(e)}")
+                self._stopped.wait(5)
+            finally:
+                with self._demand:
+                    self._demand.notify_all()
+
+    def _provision_one(self, state="available"):
+        account = self._new_account()
+        self.store.add(account, self.base_url, "provisioning")
+        return self._provision(account, state)
+
+    @staticmethod
+    def _new_account():
+        email = generate_random_email()
+        password = os.getenv("USER_PASSWORD") or f"Pw!{os.urandom(6).hex()}"
+        return Account(email, password, AccountPool.NICKNAME, None)
+
+    def _provision(self, account, state="available"):
+        # 예약된(provisioning) 계정을 가입/인증하고, 실패하면 예약을 삭제
+        try:
+            account.wid = self.provision(account.email, account.password, account.nickname)
+        except Exception:
+            self.store.remove(account.email)
+            raise
+        if state == "leased":
+            account.lease_id = AccountStore.new_lease_id(self.owner)
+        self.store.complete(account.email, account.wid, state, account.lease_id)
+        logger.info(f"계정 풀에 계정을 추가했습니다: {account}")
+        return account
+
+
+def provision_with_browser(email, password, nickname):
+    """
+    새 브라우저 세션으로 회원가입/이메일 인증을 수행하고 wid를 반환하는 기본 생산 함수.
+
+    Args:
+        email (str): 가입할 이메일 주소.
+        password (str): 비밀번호.
+        nickname (str): 닉네임.
+
+    Returns:
+        str: 가입한 계정의 wid.
+    """
+    from core.driver import Driver
+    from core.slack_poller import create_verification_source
+    from pages.flows import signup_and_verify
+
+    driver = Driver.get_driver()
+    try:
+        return signup_and_verify(driver, email, password, nickname, create_verification_source())
+    finally:
+        driver.quit()
+
+
+def provision_via_standin_api(email, password, nickname):
+    """
+    브라우저 없이 대역 서버(standin.weverse_server)에 HTTP로 회원가입/이메일 인증을 수행하고 wid를 반환하는 생산 함수.
+
+    - 대역 서버 전용 (--standin 실행). 실제 Weverse에는 browser 방식을 사용.
+
+    Args:
+        email (str): 가입할 이메일 주소.
+        password (str): 비밀번호.
+        nickname (str): 닉네임.
+
+    Returns:
+        str: 가입한 계정의 wid.
+    """
+    from core.driver import Driver
+    from core.slack_poller import create_verification_source
+    from standin.api_client import StandInApiClient
+
+    client = StandInApiClient(Driver.BASE_URL, Driver.API_HOST)
+    client.signup(email, password, nickname)
+    verification_url = create_verification_source().wait_for_verification_url(email)
+    if not verification_url:
+        raise Exception(f"인증 URL을 가져오지 못했습니다: {email}")
+    client.verify(verification_url)
+    return client.users_me()["wid"]
+
+
+# ACCOUNT_POOL_PROVISION 환경 변수로 선택하는 계정 생산 방식
+PROVISIONERS = {"browser": provision_with_browser, "standin-api": provision_via_standin_api}
+
+
+def get_provisioner(name=None):
+    """
+    이름으로 계정 생산 함수를 찾는 함수.
+
+    Args:
+        name (str, optional): "browser" 또는 "standin-api" (대역 서버 전용). 기본값은 ACCOUNT_POOL_PROVISION 환경 변수.
+
+    Returns:
+        callable: 계정 생산 함수.
+
+    Raises:
+        ValueError: 등록되지 않은 이름인 경우 발생.
+    """
+    name = name or os.getenv("ACCOUNT_POOL_PROVISION", "browser")
+    if name not in PROVISIONERS:
+        raise ValueError(f"알 수 없는 계정 생산 방식입니다: {name} (사용 가능: {', '.join(PROVISIONERS)})")
+    return PROVISIONERS[name]
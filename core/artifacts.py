@@ -0,0 +1,153 @@
+import os
+import gzip
+import json
+import queue
+import base64
+import logging
+import threading
+from datetime import datetime
+
+from core.utils import get_worker_id, safe_filename
+
+logger = logging.getLogger(__name__)
+
+
+class ArtifactWriter:
+    """
+    실패 아티팩트의 인코딩, 압축, 디스크 쓰기를 처리하는 백그라운드 쓰기 스레드
+
+    - 테스트 스레드는 브라우저에서 원본 데이터만 받아 큐에 넣고 바로 다음 테스트로 진행.
+    - 프로세스당 하나의 쓰기 스레드를 사용하며, 세션 종료 시 flush로 남은 작업을 모두 기록.
+    """
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def get(cls):
+        """
+        프로세스 공용 ArtifactWriter를 반환.
+
+        Returns:
+            ArtifactWriter: 쓰기 스레드.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def submit(self, path, produce):
+        """
+        파일 쓰기 작업을 큐에 추가.
+
+        Args:
+            path (str): 저장할 파일 경로.
+            produce (callable): 파일 내용(bytes)을 만드는 함수. 쓰기 스레드에서 호출됨.
+        """
+        self._queue.put((path, produce))
+
+    def run_after(self, callback):
+        """
+        앞서 추가된 작업이 모두 끝난 뒤 쓰기 스레드에서 callback을 실행.
+
+        Args:
+            callback (callable): 실행할 함수.
+        """
+        self._queue.put((None, callback))
+
+    def flush(self, timeout=None):
+        """
+        큐에 남은 작업이 모두 기록될 때까지 대기.
+
+        Args:
+            timeout (float, optional): 최대 대기 시간 (초). 없으면 끝날 때까지 대기.
+        """
+        done = threading.Event()
+        self.run_after(done.set)
+        done.wait(timeout)
+
+    def _run(self):
+        while True:
+            path, produce = self._queue.get()
+            if path is None:
+                try:
+                    produce()
+                except Exception as e:
+                    logger.warning(f"아티팩트 쓰기 스레드 작업 중 오류가 발생했습니다: {str(e)}")
+                continue
+            try:
+                data = produce()
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(data)
+            except Exception as e:
+                logger.warning(f"아티팩트 저장 중 오류가 발생했습니다 ({path}): {str(e)}")
+
+
+def get_artifact_dir(nodeid):
+    """
+    테스트별 아티팩트 디렉토리 경로를 반환하는 함수 (워커별, 테스트별로 분리).
+
+    Args:
+        nodeid (str): pytest 노드 ID.
+
+    Returns:
+        str: <ARTIFACT_DIR>/<워커ID>/<노드ID>_<타임스탬프> 형식의 경로.
+    """
+    base_dir = os.getenv("ARTIFACT_DIR", os.path.join(os.getenv("REPORT_DIR", "reports"), "artifacts"))
+    name = safe_filename(nodeid)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return os.path.join(base_dir, get_worker_id(), f"{name}_{timestamp}")
+
+
+def capture_failure(driver, nodeid, recorder=None):
+    """
+    실패한 테스트의 스크린샷, DOM, 콘솔 로그, 현재 URL(및 네트워크 HAR)을 수집하는 함수.
+
+    - 브라우저에서 원본 데이터를 받는 것까지만 테스트 스레드에서 수행하고,
+      디코딩/압축/파일 쓰기는 ArtifactWriter에 맡김.
+    - HAR는 요청 목록만 테스트 스레드에서 복사하고, 응답 본문 조회(시간 예산 적용)와 변환은 쓰기 스레드에서 수행.
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+        nodeid (str): pytest 노드 ID.
+        recorder (NetworkRecorder, optional): 테스트에 연결된 네트워크 레코더.
+
+    Returns:
+        str: 아티팩트가 저장될 디렉토리 경로.
+    """
+    writer = ArtifactWriter.get()
+    artifact_dir = get_artifact_dir(nodeid)
+    meta = {"nodeid": nodeid, "worker": get_worker_id(), "captured_at": datetime.now().isoformat()}
+
+    def collect(name, fetch):
+        try:
+            return fetch()
+        except Exception as e:
+            meta.setdefault("errors", {})[name] = str(e)
+            return None
+
+    meta["url"] = collect("url", lambda: driver.current_url)
+    screenshot = collect("screenshot", driver.get_screenshot_as_base64)
+    dom = collect("dom", lambda: driver.page_source)
+    console = collect("console", lambda: driver.get_log("browser"))
+    har_entries = collect("har", recorder.snapshot) if recorder is not None else None
+
+    if screenshot:
+        writer.submit(os.path.join(artifact_dir, "screenshot.png"), lambda: base64.b64decode(screenshot))
+    if dom is not None:
+        writer.submit(os.path.join(artifact_dir, "dom.html.gz"), lambda: gzip.compress(dom.encode("utf-8")))
+    if console is not None:
+        writer.submit(os.path.join(artifact_dir, "console.json"),
+                      lambda: json.dumps(console, ensure_ascii=False, indent=2).encode("utf-8"))
+    if har_entries is not None:
+        writer.submit(os.path.join(artifact_dir, "network.har.gz"),
+                      lambda: gzip.compress(json.dumps(recorder.to_har(entries=har_entries), ensure_ascii=False).encode("utf-8")))
+    writer.submit(os.path.join(artifact_dir, "meta.json"),
+                  lambda: json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8"))
+    return artifact_dir
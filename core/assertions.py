@@ -0,0 +1,311 @@
+import time
+from selenium.common.exceptions import WebDriverException
+
+from core.wait import LOCATOR_SCRIPT, NAVIGATION_ERRORS
+from core.timing import waiting
+
+# 여러 검증 조건을 브라우저 안에서 함께 평가하고, 모두 충족되거나 시간이 초과될 때까지 대기하는 비동기 스크립트
+# - page_source 전체를 전송하지 않고, 조건별 성공 여부와 실패한 조건의 짧은 진단 값(actual)만 반환.
+# - 텍스트는 렌더링된 텍스트(innerText) 기준이므로 숨겨진 요소나 스크립트 안의 문자열은 일치하지 않음.
+# - DOM 변경(MutationObserver)과 프레임(requestAnimationFrame)마다 재평가하되, innerText 계산은 프레임당 한 번으로 제한.
+# arguments: [specs, timeoutMs, callback]
+# 반환값: {ok: bool, results: [{ok: bool, actual: str}], timeout: bool}
+ASSERT_SCRIPT = """
+var specs = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+var SNIPPET = 160;
+""" + LOCATOR_SCRIPT + """
+function snippet(text) {
+    text = (text || '').replace(/\\s+/g, ' ').trim();
+    return text.length > SNIPPET ? text.slice(0, SNIPPET) + '…' : text;
+}
+
+function matches(actual, expected, mode) {
+    if (actual === null || actual === undefined) return false;
+    if (mode === 'equals') return String(actual).trim() === expected;
+    if (mode === 'regex') return new RegExp(expected).test(String(actual));
+    return String(actual).indexOf(expected) >= 0;
+}
+
+function scopeText(spec) {
+    // 검색 범위의 렌더링된 텍스트 (요소가 없으면 null)
+    if (!spec.by) return document.body ? document.body.innerText : '';
+    var el = locate(spec.by, spec.selector);
+    return el ? el.innerText || el.textContent : null;
+}
+
+function checkOne(spec) {
+    switch (spec.kind) {
+        case 'text':
+        case 'no_text':
+            var text = scopeText(spec);
+            if (text === null) return {ok: spec.kind === 'no_text', actual: 'not_found'};
+            var found = matches(text, spec.value, spec.match);
+            return {ok: spec.kind === 'text' ? found : !found, actual: snippet(text)};
+        case 'url':
+            return {ok: matches(location.href, spec.value, spec.match), actual: location.href};
+        case 'title':
+            return {ok: matches(document.title, spec.value, spec.match), actual: document.title};
+    }
+
+    var el = locate(spec.by, spec.selector);
+    if (spec.kind === 'absent') return el && isVisible(el) ? {ok: false, actual: 'visible'} : {ok: true};
+    if (!el) return {ok: false, actual: 'not_found'};
+    if (spec.kind === 'visible' && !isVisible(el)) return {ok: false, actual: 'not_visible'};
+    if (spec.kind === 'attribute') {
+        var value = spec.name in el && typeof el[spec.name] !== 'object' ? el[spec.name] : el.getAttribute(spec.name);
+        return {ok: matches(value, spec.value, spec.match), actual: value === null ? 'null' : snippet(String(value))};
+    }
+    return {ok: true};
+}
+
+function checkAll() {
+    var results = [], ok = true;
+    for (var i = 0; i < specs.length; i++) {
+        var result;
+        try {
+            result = checkOne(specs[i]);
+        } catch (e) {
+            result = {ok: false, actual: 'error: ' + e.message};
+        }
+        // 성공한 조건은 진단 값을 보내지 않음
+        if (result.ok) result = {ok: true};
+        ok = ok && result.ok;
+        results.push(result);
+    }
+    return {ok: ok, results: results};
+}
+
+var finished = false, scheduled = false, observer = null, timer = null, last = null;
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done(result);
+}
+
+function evaluate() {
+    scheduled = false;
+    if (finished) return;
+    last = checkAll();
+    if (last.ok) finish(last);
+}
+
+function schedule() {
+    if (!scheduled && !finished) {
+        scheduled = true;
+        requestAnimationFrame(evaluate);
+    }
+}
+
+function onFrame() {
+    schedule();
+    if (!finished) requestAnimationFrame(onFrame);
+}
+
+evaluate();
+if (!finished) {
+    timer = setTimeout(function () {
+        last = checkAll();
+        last.timeout = !last.ok;
+        finish(last);
+    }, timeoutMs);
+    observer = new MutationObserver(schedule);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    requestAnimationFrame(onFrame);
+}
+"""
+
+
+class Expectation:
+    """
+    브라우저 안에서 평가되는 검증 조건
+    """
+
+    def __init__(self, kind, locator=None, value=None, name=None, match="contains"):
+        """
+        Expectation 클래스의 생성자.
+
+        Args:
+            kind (str): 조건 종류 (text, no_text, present, visible, absent, attribute, url, title).
+            locator (tuple, optional): (By, 값) 형식의 요소 위치 (요소 조건 또는 텍스트 검색 범위).
+            value (str, optional): 비교할 값 (텍스트, 속성 값, URL, 제목).
+            name (str, optional): 속성 이름 (attribute 조건인 경우).
+            match (str, optional): 비교 방식 ("contains", "equals", "regex"). 기본값 "contains".
+        """
+        self.kind = kind
+        self.locator = locator
+        self.value = value
+        self.name = name
+        self.match = match
+
+    def spec(self):
+        by, selector = self.locator if self.locator else (None, None)
+        return {"kind": self.kind, "by": by, "selector": selector, "value": self.value, "name": self.name,
+                "match": self.match}
+
+    def describe(self):
+        target = f"{self.locator[1]} " if self.locator else ""
+        if self.kind in ("text", "no_text", "url", "title"):
+            prefix = "텍스트 없음" if self.kind == "no_text" else {"text": "텍스트", "url": "URL", "title": "제목"}.get(self.kind)
+            return f"{target}{prefix} {self.match} {self.value!r}"
+        if self.kind == "attribute":
+            return f"{target}[{self.name}] {self.match} {self.value!r}"
+        return f"{target}{self.kind}"
+
+    def __repr__(self):
+        return f"Expectation({self.describe()})"
+
+
+def has_text(text, locator=None, match="contains"):
+    """
+    페이지(또는 locator 요소)의 렌더링된 텍스트에 문자열이 포함.
+    """
+    return Expectation("text", locator, text, match=match)
+
+
+def has_no_text(text, locator=None, match="contains"):
+    """
+    페이지(또는 locator 요소)의 렌더링된 텍스트에 문자열이 없음.
+    """
+    return Expectation("no_text", locator, text, match=match)
+
+
+def element_present(locator):
+    """
+    요소가 DOM에 존재.
+    """
+    return Expectation("present", locator)
+
+
+def element_visible(locator):
+    """
+    요소가 DOM에 존재하고 화면에 노출.
+    """
+    return Expectation("visible", locator)
+
+
+def element_absent(locator):
+    """
+    요소가 없거나 화면에 노출되지 않음.
+    """
+    return Expectation("absent", locator)
+
+
+def attribute_is(locator, name, value, match="equals"):
+    """
+    요소의 속성(또는 value, checked 등 프로퍼티) 값이 일치.
+    """
+    return Expectation("attribute", locator, value, name=name, match=match)
+
+
+def url_matches(url, match="contains"):
+    """
+    현재 URL이 값과 일치 (기본값은 포함 여부).
+    """
+    return Expectation("url", value=url, match=match)
+
+
+def title_matches(title, match="contains"):
+    """
+    문서 제목이 값과 일치 (기본값은 포함 여부).
+    """
+    return Expectation("title", value=title, match=match)
+
+
+class PageAssert:
+    """
+    page_source를 전송하는 대신 브라우저 안에서 검증하는 검증 엔진
+
+    - 여러 조건을 한 번의 스크립트 호출로 평가하고, 모두 충족될 때까지 브라우저 안에서 대기 (렌더링 전 검증으로 인한 간헐적 실패 방지).
+    - 브라우저에서는 조건별 성공 여부와 실패한 조건의 짧은 진단 값만 반환.
+    - 실패 시 AssertionError를 발생시키므로 pytest의 assert와 같이 보고됨.
+    """
+
+    TIMEOUT = 10  # 기본 대기 시간 (초)
+    SCRIPT_TIMEOUT_MARGIN = 5  # 세션 스크립트 타임아웃 여유 시간 (초)
+
+    def __init__(self, driver, timeout=None):
+        """
+        PageAssert 클래스의 생성자.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값은 클래스의 TIMEOUT.
+        """
+        self.driver = driver
+        self.timeout = timeout if timeout is not None else self.TIMEOUT
+
+    def check(self, *expectations, timeout=None):
+        """
+        조건이 모두 충족될 때까지 대기한 뒤 결과를 반환 (예외를 발생시키지 않음).
+
+        Args:
+            *expectations (Expectation): 검증 조건.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값은 self.timeout.
+
+        Returns:
+            dict: {"ok": bool, "results": [{"ok": bool, "actual": str}], "timeout": bool}.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        specs = [expectation.spec() for expectation in expectations]
+        deadline = time.monotonic() + timeout
+        with waiting():
+            while True:
+                remaining = max(deadline - time.monotonic(), 0)
+                self._ensure_script_timeout(remaining)
+                try:
+                    return self.driver.execute_async_script(ASSERT_SCRIPT, specs, int(remaining * 1000))
+                except WebDriverException as e:
+                    # 대기 중 페이지가 이동하면 새 문서에서 남은 시간만큼 다시 평가
+                    if any(error in str(e).lower() for error in NAVIGATION_ERRORS) and time.monotonic() < deadline:
+                        continue
+                    raise
+
+    def all(self, *expectations, message="", timeout=None):
+        """
+        조건이 모두 충족되는지 검증.
+
+        Args:
+            *expectations (Expectation): 검증 조건.
+            message (str, optional): 실패 시 예외 메시지.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값은 self.timeout.
+
+        Raises:
+            AssertionError: 시간 내에 조건이 모두 충족되지 않은 경우 발생 (실패한 조건과 진단 값 포함).
+        """
+        result = self.check(*expectations, timeout=timeout)
+        if result and result.get("ok"):
+            return
+
+        timeout = self.timeout if timeout is None else timeout
+        failures = [
+            f"- {expectation.describe()}: {outcome.get('actual')}"
+            for expectation, outcome in zip(expectations, (result or {}).get("results", []))
+            if not outcome.get("ok")
+        ]
+        summary = message or "페이지 검증에 실패했습니다."
+        raise AssertionError(f"{summary} ({timeout}초 대기)\n" + "\n".join(failures))
+
+    def shows_text(self, text, locator=None, message="", timeout=None):
+        """
+        페이지(또는 locator 요소)에 텍스트가 표시되는지 검증.
+
+        Args:
+            text (str): 표시되어야 하는 텍스트.
+            locator (tuple, optional): 검색 범위 요소의 (By, 값).
+            message (str, optional): 실패 시 예외 메시지.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값은 self.timeout.
+
+        Raises:
+            AssertionError: 시간 내에 텍스트가 표시되지 않은 경우 발생.
+        """
+        self.all(has_text(text, locator), message=message, timeout=timeout)
+
+    def _ensure_script_timeout(self, remaining):
+        # 세션 스크립트 타임아웃(기본 30초)이 대기 시간보다 짧으면 늘림 (BrowserWait과 같은 기록 사용)
+        required = remaining + self.SCRIPT_TIMEOUT_MARGIN
+        if getattr(self.driver, "_wait_script_timeout", 30) < required:
+            self.driver.set_script_timeout(required)
+            self.driver._wait_script_timeout = required
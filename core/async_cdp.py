@@ -0,0 +1,500 @@
+import os
+import json
+import shutil
+import asyncio
+import logging
+import tempfile
+import itertools
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+from wsproto import WSConnection, ConnectionType
+from wsproto.events import (
+    Request, AcceptConnection, RejectConnection, TextMessage, BytesMessage, Ping, CloseConnection,
+)
+
+from core.cdp import CdpError
+from core.expected_conditions import Condition
+from core.wait import WAIT_SCRIPT, NAVIGATION_ERRORS
+
+logger = logging.getLogger(__name__)
+
+# CDP에서 페이지 이동으로 평가 컨텍스트가 사라진 경우의 오류 메시지 (core.wait.NAVIGATION_ERRORS에 추가)
+CDP_NAVIGATION_ERRORS = NAVIGATION_ERRORS + ("inspected target navigated or closed", "cannot find default execution context")
+
+# WAIT_SCRIPT(execute_async_script용)를 Runtime.evaluate에서 실행하기 위한 Promise 래퍼
+# - 결과의 element(DOM 노드)는 값으로 직렬화할 수 없으므로 ok/reason/click과 요소 중심 좌표(x, y)만 반환
+ASYNC_WAIT_EXPRESSION = """
+new Promise(function (resolve) {
+    var done = function (result) {
+        var value = {ok: !!(result && result.ok), reason: result && result.reason, click: !!(result && result.click)};
+        if (result && result.element) {
+            var rect = result.element.getBoundingClientRect();
+            value.x = rect.left + rect.width / 2;
+            value.y = rect.top + rect.height / 2;
+        }
+        resolve(value);
+    };
+    (function () { %s }).apply(null, [%s, %d, done]);
+})
+"""
+
+
+class AsyncCdpConnection:
+    """
+    asyncio 기반 Chrome DevTools Protocol 웹소켓 연결
+
+    - asyncio 스트림 위에서 wsproto로 웹소켓을 처리하므로 브라우저(세션)마다 스레드가 필요 없음.
+    - 하나의 연결로 여러 탭(세션)을 flatten 모드로 다루며, 응답과 이벤트는 수신 태스크가 분배.
+    """
+
+    def __init__(self, reader, writer, ws):
+        self._reader = reader
+        self._writer = writer
+        self._ws = ws
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._listeners = {}
+        self._closed = False
+        self._receiver = asyncio.get_running_loop().create_task(self._receive_loop())
+
+    @classmethod
+    async def connect(cls, ws_url, timeout=10):
+        """
+        브라우저 DevTools 웹소켓에 연결.
+
+        Args:
+            ws_url (str): 브라우저 웹소켓 URL (ws://host:port/devtools/browser/<id>).
+            timeout (float, optional): 연결 타임아웃 (초). 기본값 10초.
+
+        Returns:
+            AsyncCdpConnection: 연결된 CDP 연결.
+        """
+        parsed = urlparse(ws_url)
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(parsed.hostname, parsed.port), timeout)
+        ws = WSConnection(ConnectionType.CLIENT)
+        # Chrome 111+는 Origin 헤더가 있는 웹소켓 연결을 거부하므로 Origin을 보내지 않음
+        writer.write(ws.send(Request(host=parsed.netloc, target=parsed.path or "/")))
+        await writer.drain()
+
+        while True:
+            data = await asyncio.wait_for(reader.read(65536), timeout)
+            if not data:
+                raise CdpError("웹소켓 핸드셰이크 중 연결이 종료되었습니다.")
+            ws.receive_data(data)
+            for event in ws.events():
+                if isinstance(event, AcceptConnection):
+                    return cls(reader, writer, ws)
+                if isinstance(event, RejectConnection):
+                    raise CdpError(f"웹소켓 연결이 거부되었습니다: HTTP {event.status_code}")
+
+    async def send(self, method, params=None, session_id=None, timeout=30):
+        """
+        CDP 명령을 보내고 응답을 기다림.
+
+        Args:
+            method (str): CDP 메서드 이름 (예: "Page.navigate").
+            params (dict, optional): 명령 인자.
+            session_id (str, optional): 대상 탭의 세션 ID. 없으면 브라우저 대상.
+            timeout (float, optional): 응답 대기 시간 (초). 기본값 30초.
+
+        Returns:
+            dict: 명령 결과.
+
+        Raises:
+            CdpError: 오류 응답을 받았거나 연결이 종료된 경우 발생.
+        """
+        if self._closed:
+            raise CdpError("CDP 연결이 종료되었습니다.")
+        message_id = next(self._ids)
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        self._writer.write(self._ws.send(TextMessage(data=json.dumps(message))))
+        await self._writer.drain()
+        try:
+            response = await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(message_id, None)
+
+        if "error" in response:
+            raise CdpError(f"{method} 실패: {response['error'].get('message')}")
+        return response.get("result", {})
+
+    def on(self, method, callback, session_id=None):
+        """
+        CDP 이벤트 리스너를 등록.
+
+        Args:
+            method (str): 이벤트 이름 (예: "Network.responseReceived").
+            callback (callable): 이벤트 params를 받는 함수.
+            session_id (str, optional): 특정 탭의 이벤트만 받을 경우 세션 ID.
+        """
+        self._listeners.setdefault((method, session_id), []).append(callback)
+
+    def off(self, method, callback, session_id=None):
+        listeners = self._listeners.get((method, session_id), [])
+        if callback in listeners:
+            listeners.remove(callback)
+
+    def expect_event(self, method, predicate=None, session_id=None):
+        """
+        조건을 만족하는 CDP 이벤트를 받을 Future를 즉시 등록 (명령을 보내기 전에 호출하여 이벤트를 놓치지 않도록 함).
+
+        Returns:
+            asyncio.Future: 이벤트 params로 완료되는 Future.
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        def listener(params):
+            if not future.done() and (predicate is None or predicate(params)):
+                future.set_result(params)
+
+        self.on(method, listener, session_id)
+        future.add_done_callback(lambda _: self.off(method, listener, session_id))
+        return future
+
+    async def wait_for_event(self, method, predicate=None, session_id=None, timeout=30):
+        """
+        조건을 만족하는 CDP 이벤트가 도착할 때까지 대기.
+
+        Returns:
+            dict: 이벤트 params.
+
+        Raises:
+            asyncio.TimeoutError: 시간 내에 이벤트가 도착하지 않은 경우 발생.
+        """
+        return await asyncio.wait_for(self.expect_event(method, predicate, session_id), timeout)
+
+    async def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._writer.write(self._ws.send(CloseConnection(code=1000)))
+            await self._writer.drain()
+        except Exception:
+            pass
+        self._writer.close()
+        self._receiver.cancel()
+
+    async def _receive_loop(self):
+        buffer = []
+        try:
+            while True:
+                data = await self._reader.read(65536)
+                if not data:
+                    break
+                self._ws.receive_data(data)
+                for event in self._ws.events():
+                    if isinstance(event, (TextMessage, BytesMessage)):
+                        buffer.append(event.data if isinstance(event.data, str) else event.data.decode("utf-8"))
+                        if event.message_finished:
+                            self._dispatch(json.loads("".join(buffer)))
+                            buffer = []
+                    elif isinstance(event, Ping):
+                        self._writer.write(self._ws.send(event.response()))
+                    elif isinstance(event, CloseConnection):
+                        return
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"CDP 수신 중 오류가 발생했습니다: {str(e)}")
+        finally:
+            self._closed = True
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_result({"error": {"message": "connection closed"}})
+
+    def _dispatch(self, message):
+        if "id" in message:
+            future = self._pending.get(message["id"])
+            if future is not None and not future.done():
+                future.set_result(message)
+            return
+
+        # 이벤트는 같은 세션(탭)에 등록된 리스너에만 전달 (세션 ID가 없으면 브라우저 대상 이벤트)
+        key = (message.get("method"), message.get("sessionId"))
+        for callback in list(self._listeners.get(key, [])):
+            try:
+                callback(message.get("params", {}))
+            except Exception as e:
+                logger.warning(f"CDP 이벤트 처리 중 오류가 발생했습니다 ({key[0]}): {str(e)}")
+
+
+class AsyncBrowser:
+    """
+    원격 디버깅 모드로 실행한 Chrome 프로세스와 CDP 연결
+
+    - 테스트 세션마다 새 브라우저 컨텍스트(시크릿 프로필과 같은 격리)를 만들어 하나의 프로세스에서 여러 세션을 실행.
+    """
+
+    CHROME_BINARY = os.getenv("CHROME_BINARY")
+    HEADLESS = os.getenv("HEADLESS", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+
+    def __init__(self, process, connection, user_data_dir):
+        self.process = process
+        self.connection = connection
+        self.user_data_dir = user_data_dir
+
+    @classmethod
+    async def launch(cls, arguments=None, headless=None, timeout=30):
+        """
+        Chrome을 원격 디버깅 모드로 실행하고 브라우저 웹소켓에 연결.
+
+        Args:
+            arguments (list, optional): 추가 Chrome 실행 인자 (예: launch_profiles의 LEAN_ARGUMENTS).
+            headless (bool, optional): 헤드리스 모드 여부. 기본값은 HEADLESS 환경 변수.
+            timeout (float, optional): 브라우저 시작 대기 시간 (초). 기본값 30초.
+
+        Returns:
+            AsyncBrowser: 실행된 브라우저.
+        """
+        binary = cls.CHROME_BINARY or next(
+            (path for path in map(shutil.which, ("google-chrome", "chromium", "chromium-browser", "chrome")) if path),
+            None,
+        )
+        if binary is None:
+            raise Exception("Chrome 실행 파일을 찾을 수 없습니다. CHROME_BINARY 환경 변수를 설정해주세요.")
+
+        user_data_dir = tempfile.mkdtemp(prefix="async-chrome-")
+        command = [
+            binary,
+            "--remote-debugging-port=0",
+            f"--user-data-dir={user_data_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "--ignore-certificate-errors",
+            "--disable-blink-features=AutomationControlled",
+            *(arguments or []),
+        ]
+        if cls.HEADLESS if headless is None else headless:
+            command += ["--headless=new", "--window-size=1920,1080"]
+        command.append("about:blank")
+
+        process = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+
+        # 포트 0으로 실행하면 Chrome이 실제 포트와 웹소켓 경로를 DevToolsActivePort 파일에 기록
+        port_file = os.path.join(user_data_dir, "DevToolsActivePort")
+        deadline = asyncio.get_running_loop().time() + timeout
+        while not os.path.exists(port_file) or os.path.getsize(port_file) == 0:
+            if process.returncode is not None or asyncio.get_running_loop().time() > deadline:
+                raise Exception("Chrome 원격 디버깅 포트를 확인하지 못했습니다.")
+            await asyncio.sleep(0.05)
+        with open(port_file, encoding="utf-8") as f:
+            port, path = f.read().split()[:2]
+
+        connection = await AsyncCdpConnection.connect(f"ws://127.0.0.1:{port}{path}")
+        return cls(process, connection, user_data_dir)
+
+    async def new_page(self):
+        """
+        새 브라우저 컨텍스트에 탭을 열고 세션을 연결.
+
+        Returns:
+            AsyncPage: 격리된 새 탭.
+        """
+        context = await self.connection.send("Target.createBrowserContext", {"disposeOnDetach": True})
+        context_id = context["browserContextId"]
+        target = await self.connection.send(
+            "Target.createTarget", {"url": "about:blank", "browserContextId": context_id})
+        attached = await self.connection.send(
+            "Target.attachToTarget", {"targetId": target["targetId"], "flatten": True})
+        page = AsyncPage(self.connection, attached["sessionId"], target["targetId"], context_id)
+        await page.enable()
+        return page
+
+    async def close(self):
+        try:
+            await self.connection.send("Browser.close", timeout=5)
+        except Exception:
+            pass
+        await self.connection.close()
+        try:
+            await asyncio.wait_for(self.process.wait(), 10)
+        except asyncio.TimeoutError:
+            self.process.kill()
+        shutil.rmtree(self.user_data_dir, ignore_errors=True)
+
+
+class AsyncPage:
+    """
+    하나의 탭(세션)에 대한 비동기 조작
+
+    - 대기/동작은 core.wait의 WAIT_SCRIPT를 그대로 사용하므로 페이지 객체의 로케이터와 조건을 공유.
+    - 네트워크 응답은 CDP 이벤트로 기록되어 wait_for_response로 바로 받을 수 있음 (최근 MAX_RESPONSES개까지만 보관).
+    """
+
+    MAX_RESPONSES = 500  # 보관할 최대 요청 수
+
+    def __init__(self, connection, session_id, target_id, context_id):
+        self.connection = connection
+        self.session_id = session_id
+        self.target_id = target_id
+        self.context_id = context_id
+        self._responses = OrderedDict()
+        self._response_waiters = []
+
+    async def enable(self):
+        self.connection.on("Network.requestWillBeSent", self._on_request, self.session_id)
+        self.connection.on("Network.responseReceived", self._on_response, self.session_id)
+        self.connection.on("Network.loadingFinished", self._on_loading_finished, self.session_id)
+        await asyncio.gather(
+            self.send("Page.enable"),
+            self.send("Network.enable"),
+            self.send("Runtime.enable"),
+        )
+
+    async def send(self, method, params=None, timeout=30):
+        return await self.connection.send(method, params, self.session_id, timeout)
+
+    async def goto(self, url, timeout=30):
+        """
+        URL로 이동하고 load 이벤트까지 대기.
+        """
+        loaded = self.connection.expect_event("Page.loadEventFired", session_id=self.session_id)
+        await self.send("Page.navigate", {"url": url})
+        await asyncio.wait_for(loaded, timeout)
+
+    async def evaluate(self, expression, timeout=30):
+        """
+        페이지에서 JavaScript 표현식을 평가하고 값을 반환 (Promise는 완료까지 대기).
+        """
+        result = await self.send("Runtime.evaluate", {
+            "expression": expression,
+            "awaitPromise": True,
+            "returnByValue": True,
+        }, timeout=timeout)
+        if "exceptionDetails" in result:
+            details = result["exceptionDetails"]
+            raise CdpError((details.get("exception") or {}).get("description") or details.get("text"))
+        return result.get("result", {}).get("value")
+
+    async def wait(self, condition, timeout=10, action=None, value=None):
+        """
+        조건이 충족될 때까지 브라우저 안에서 대기하고, action이 있으면 동작까지 수행.
+
+        Args:
+            condition (Condition): core.expected_conditions의 조건.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값 10초.
+            action (str, optional): 수행할 동작 ("click", "type", "check").
+            value (str, optional): 입력할 값.
+
+        Raises:
+            asyncio.TimeoutError: 시간 내에 조건이 충족되지 않은 경우 발생.
+        """
+        spec = dict(condition.spec(), action=action, value=value if value is not None else condition.value)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = max(deadline - loop.time(), 0)
+            expression = ASYNC_WAIT_EXPRESSION % (WAIT_SCRIPT, json.dumps(spec), int(remaining * 1000))
+            try:
+                result = await self.evaluate(expression, timeout=remaining + 5)
+            except CdpError as e:
+                # 대기 중 페이지가 이동하면 새 문서에서 남은 시간만큼 다시 대기
+                if any(error in str(e).lower() for error in CDP_NAVIGATION_ERRORS) and loop.time() < deadline:
+                    await asyncio.sleep(0.05)
+                    continue
+                raise
+            if result and result.get("ok"):
+                break
+            raise asyncio.TimeoutError(
+                f"{spec.get('kind')} {spec.get('selector') or spec.get('value')} 조건을 {timeout}초 안에 만족하지 못했습니다 "
+                f"({(result or {}).get('reason')})")
+
+        # 클릭은 실제 마우스 이벤트로 요소 중심을 클릭 (Selenium 경로의 WebElement.click과 같음)
+        if result.get("click"):
+            await self._click_at(result["x"], result["y"])
+        return result
+
+    async def _click_at(self, x, y):
+        for event in ("mouseMoved", "mousePressed", "mouseReleased"):
+            await self.send("Input.dispatchMouseEvent", {"type": event, "x": x, "y": y, "button": "left", "clickCount": 1})
+
+    async def click(self, locator, condition="clickable", timeout=10):
+        await self.wait(Condition(condition, locator), timeout, action="click")
+
+    async def type(self, locator, text, condition="clickable", ready=False, timeout=10):
+        # WAIT_SCRIPT는 입력 필드에 포커스만 맞추므로, 포커스된 요소에 CDP로 텍스트를 입력
+        await self.wait(Condition(condition, locator, ready=ready), timeout, action="type", value=text)
+        await self.send("Input.insertText", {"text": text})
+
+    async def set_cookies(self, cookies):
+        """
+        쿠키를 설정 (core.browser_state / StandInApiClient.browser_state 형식).
+        """
+        if cookies:
+            await self.send("Network.setCookies", {"cookies": cookies})
+
+    async def wait_for_response(self, url_pattern, method=None, timeout=10):
+        """
+        URL 패턴과 일치하는 응답이 완료될 때까지 대기하고 본문을 반환 (이미 받은 응답이면 즉시 반환).
+
+        Args:
+            url_pattern (str): URL에 포함될 문자열.
+            method (str, optional): HTTP 메서드 (예: "GET").
+            timeout (float, optional): 최대 대기 시간 (초). 기본값 10초.
+
+        Returns:
+            str: 응답 본문.
+        """
+        def matches(entry):
+            return entry["finished"] and url_pattern in entry["url"] and (method is None or entry["method"] == method)
+
+        entry = next((e for e in self._responses.values() if matches(e)), None)
+        if entry is None:
+            future = asyncio.get_running_loop().create_future()
+            self._response_waiters.append((matches, future))
+            entry = await asyncio.wait_for(future, timeout)
+
+        body = await self.send("Network.getResponseBody", {"requestId": entry["request_id"]})
+        return body.get("body")
+
+    def _on_request(self, params):
+        request = params.get("request", {})
+        self._responses[params.get("requestId")] = {
+            "request_id": params.get("requestId"),
+            "url": request.get("url", ""),
+            "method": request.get("method"),
+            "status": None,
+            "finished": False,
+        }
+        while len(self._responses) > self.MAX_RESPONSES:
+            self._responses.popitem(last=False)
+
+    def _on_response(self, params):
+        entry = self._responses.get(params.get("requestId"))
+        if entry is not None:
+            entry["status"] = params.get("response", {}).get("status")
+
+    def _on_loading_finished(self, params):
+        entry = self._responses.get(params.get("requestId"))
+        if entry is None:
+            return
+        entry["finished"] = True
+        for matches, future in list(self._response_waiters):
+            if not future.done() and matches(entry):
+                future.set_result(entry)
+                self._response_waiters.remove((matches, future))
+
+    async def close(self):
+        """
+        탭과 브라우저 컨텍스트를 닫음.
+        """
+        self.connection.off("Network.requestWillBeSent", self._on_request, self.session_id)
+        self.connection.off("Network.responseReceived", self._on_response, self.session_id)
+        self.connection.off("Network.loadingFinished", self._on_loading_finished, self.session_id)
+        self._responses.clear()
+        try:
+            await self.connection.send("Target.closeTarget", {"targetId": self.target_id})
+        except CdpError as e:
+            logger.info(f"탭 정리 중 오류를 무시합니다: {str(e)}")
+        try:
+            await self.connection.send("Target.disposeBrowserContext", {"browserContextId": self.context_id})
+        except CdpError as e:
+            logger.info(f"브라우저 컨텍스트 정리 중 오류를 무시합니다: {str(e)}")
@@ -0,0 +1,158 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+import itertools
+
+from core.async_cdp import AsyncBrowser
+from core.launch_profiles import get_profile
+from core.timing import percentile
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncOrchestrator:
+    """
+    하나의 이벤트 루프에서 여러 Chrome 세션을 동시에 실행하는 비동기 오케스트레이터
+
+    - 브라우저 프로세스 몇 개를 띄우고, 작업마다 격리된 브라우저 컨텍스트(탭)를 만들어 플로우 코루틴을 실행.
+    - 명령과 대기는 모두 CDP 웹소켓 위의 비동기 호출이므로 세션마다 스레드나 프로세스가 필요 없음.
+    - 동시에 실행할 세션 수는 세마포어로 제한.
+    """
+
+    BROWSERS = int(os.getenv("ASYNC_BROWSERS", "1"))  # 띄울 브라우저 프로세스 수
+    CONCURRENCY = int(os.getenv("ASYNC_CONCURRENCY", "20"))  # 동시에 실행할 세션 수
+
+    def __init__(self, browsers=None, concurrency=None, profile="full", headless=None):
+        """
+        AsyncOrchestrator 클래스의 생성자.
+
+        Args:
+            browsers (int, optional): 브라우저 프로세스 수. 기본값은 ASYNC_BROWSERS 환경 변수.
+            concurrency (int, optional): 동시 세션 수. 기본값은 ASYNC_CONCURRENCY 환경 변수.
+            profile (str, optional): Chrome 실행 프로필 이름 (core.launch_profiles). 기본값 "full".
+            headless (bool, optional): 헤드리스 모드 여부. 기본값은 HEADLESS 환경 변수.
+        """
+        self.browsers = browsers or AsyncOrchestrator.BROWSERS
+        self.concurrency = concurrency or AsyncOrchestrator.CONCURRENCY
+        self.profile = get_profile(profile)
+        self.headless = headless
+
+    async def run(self, flow, jobs):
+        """
+        작업마다 새 탭에서 플로우를 실행하고 결과를 모음.
+
+        Args:
+            flow (coroutine function): (page, **job)을 받는 비동기 플로우 (예: pages.async_flows.login_and_extract_wid).
+            jobs (list): 플로우에 전달할 인자 dict 목록.
+
+        Returns:
+            list: 작업별 {"index", "ok", "result", "error", "duration_ms"} 목록 (jobs 순서).
+        """
+        browsers = await asyncio.gather(*[
+            AsyncBrowser.launch(self.profile.arguments, headless=self.headless) for _ in range(self.browsers)
+        ])
+        semaphore = asyncio.Semaphore(self.concurrency)
+        assignment = itertools.cycle(browsers)
+
+        async def run_job(index, job, browser):
+            async with semaphore:
+                started = time.perf_counter()
+                page = None
+                try:
+                    page = await browser.new_page()
+                    if self.profile.blocked_urls:
+                        await page.send("Network.setBlockedURLs", {"urls": self.profile.blocked_urls})
+                    result = await flow(page, **job)
+                    return {"index": index, "ok": True, "result": result, "error": None,
+                            "duration_ms": (time.perf_counter() - started) * 1000}
+                except Exception as e:
+                    return {"index": index, "ok": False, "result": None, "error": f"{type(e).__name__}: {e}",
+                            "duration_ms": (time.perf_counter() - started) * 1000}
+                finally:
+                    if page is not None:
+                        await page.close()
+
+        try:
+            return await asyncio.gather(*[
+                run_job(index, job, next(assignment)) for index, job in enumerate(jobs)
+            ])
+        finally:
+            await asyncio.gather(*[browser.close() for browser in browsers], return_exceptions=True)
+
+
+def summarize(results, wall_seconds):
+    """
+    실행 결과의 성공 수, 처리량, 소요 시간 분포를 계산하는 함수.
+    """
+    durations = [result["duration_ms"] for result in results if result["ok"]]
+    return {
+        "sessions": len(results),
+        "ok": len(durations),
+        "failed": len(results) - len(durations),
+        "wall_seconds": wall_seconds,
+        "flows_per_minute": len(durations) / wall_seconds * 60 if wall_seconds else 0.0,
+        "duration_ms": {f"p{p}": percentile(durations, p) for p in (50, 95, 99)},
+        "errors": sorted({result["error"] for result in results if result["error"]}),
+    }
+
+
+def main(argv=None):
+    """
+    비동기 오케스트레이터 실행 진입점.
+
+    Example:
+        python -m core.async_orchestrator --sessions 100 --concurrency 50 --browsers 2 --standin --headless
+    """
+    from core import utils
+    from core.driver import Driver
+    from pages.async_flows import FLOWS
+
+    parser = argparse.ArgumentParser(description="하나의 이벤트 루프에서 여러 Chrome 세션으로 플로우를 동시에 실행합니다.")
+    parser.add_argument("--flow", choices=sorted(FLOWS), default="login_profile")
+    parser.add_argument("--sessions", type=int, default=10, help="실행할 세션(플로우) 수")
+    parser.add_argument("--concurrency", type=int, help="동시에 실행할 세션 수")
+    parser.add_argument("--browsers", type=int, help="브라우저 프로세스 수")
+    parser.add_argument("--profile", default=Driver.LAUNCH_PROFILE, help="Chrome 실행 프로필 (full, lean)")
+    parser.add_argument("--headless", action="store_true", help="헤드리스 모드로 실행")
+    parser.add_argument("--standin", action="store_true", help="로컬 대역 서버를 띄워 세션마다 다른 계정으로 실행")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.standin:
+        from standin.weverse_server import WeverseStandInServer
+
+        users = {f"async-{index}@benx.com": "standin-password" for index in range(args.sessions)}
+        server = WeverseStandInServer(users=users).serve_in_background()
+        Driver.BASE_URL = Driver.API_HOST = server.url
+        utils.WAIT_SCALE = 0
+        jobs = [{"email": email, "password": password} for email, password in users.items()]
+    else:
+        email, password = os.getenv("TEST_EMAIL"), os.getenv("TEST_USER_PASSWORD")
+        if not email or not password:
+            print("TEST_EMAIL/TEST_USER_PASSWORD 환경 변수를 설정하거나 --standin 옵션을 사용해주세요.")
+            return 1
+        jobs = [{"email": email, "password": password} for _ in range(args.sessions)]
+
+    orchestrator = AsyncOrchestrator(args.browsers, args.concurrency, args.profile, args.headless or None)
+    started = time.perf_counter()
+    try:
+        results = asyncio.run(orchestrator.run(FLOWS[args.flow], jobs))
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    report = summarize(results, time.perf_counter() - started)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(dict(report, results=results), f, ensure_ascii=False, indent=2)
+    return 0 if report["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
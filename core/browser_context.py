@@ -0,0 +1,166 @@
+import os
+import atexit
+import logging
+import threading
+
+from selenium import webdriver
+
+from core.cdp import CdpConnection
+
+logger = logging.getLogger(__name__)
+
+
+class SharedChrome:
+    """
+    하나의 Chrome 프로세스 안에 사용자별로 격리된 브라우저 컨텍스트(시크릿 창과 같은 쿠키/스토리지 분리)를 만들어 세션을 제공
+
+    - 호스트 세션이 Chrome을 띄우고, 사용자마다 CDP Target.createBrowserContext로 컨텍스트와 탭을 만든 뒤
+      debuggerAddress로 같은 Chrome에 붙은 별도의 WebDriver 세션을 그 탭에 연결.
+    - 세션마다 chromedriver 명령 큐가 분리되어 있으므로 여러 플로우가 스레드에서 동시에 실행되어도 서로 기다리지 않음.
+    - Chrome 하나당 CONTEXTS_PER_BROWSER개까지 컨텍스트를 만들고, 넘으면 새 Chrome을 띄움.
+    - 실행 인자는 Chrome 프로세스 단위로 적용되므로 Chrome은 실행 프로필별로 따로 띄우고, 같은 프로필의 컨텍스트끼리만 공유.
+    - 세션의 quit()은 WebDriver 세션을 닫고 컨텍스트(쿠키, 스토리지, 탭)를 폐기하며 Chrome은 유지.
+    """
+
+    ENABLED = os.getenv("BROWSER_CONTEXTS", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+    CONTEXTS_PER_BROWSER = int(os.getenv("BROWSER_CONTEXTS_PER_CHROME", "8"))  # Chrome 하나에 만들 최대 컨텍스트 수
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, contexts_per_browser=None):
+        """
+        SharedChrome 클래스의 생성자.
+
+        Args:
+            contexts_per_browser (int, optional): Chrome 하나에 만들 최대 컨텍스트 수.
+                기본값은 BROWSER_CONTEXTS_PER_CHROME 환경 변수.
+        """
+        self.contexts_per_browser = contexts_per_browser or SharedChrome.CONTEXTS_PER_BROWSER
+        self._hosts = []  # [{"driver": 호스트 WebDriver, "profile": 실행 프로필 이름, "contexts": 사용 중인 컨텍스트 ID 집합}]
+        self._lock = threading.Lock()
+        self._closed = False
+
+    @classmethod
+    def get(cls):
+        """
+        프로세스 공용 SharedChrome을 반환 (프로세스 종료 시 Chrome도 종료).
+
+        Returns:
+            SharedChrome: 공유 Chrome 관리자.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.close)
+            return cls._instance
+
+    def _acquire_host(self, profile):
+        # 같은 실행 프로필로 띄운 Chrome 중 컨텍스트 여유가 있는 것을 고르고, 없으면 새로 띄움 (호출자가 self._lock을 보유)
+        for host in self._hosts:
+            if host["profile"] == profile and len(host["contexts"]) < self.contexts_per_browser:
+                return host
+
+        from core.driver import Driver
+
+        driver = Driver.create_session(Driver.get_options(profile))
+        debugger_address = driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+        if not debugger_address:
+            driver.quit()
+            raise Exception("Chrome 세션에서 debuggerAddress를 찾을 수 없어 브라우저 컨텍스트를 만들 수 없습니다.")
+        host = {"driver": driver, "debugger_address": debugger_address, "profile": profile, "contexts": set()}
+        self._hosts.append(host)
+        logger.info(f"브라우저 컨텍스트용 Chrome을 시작했습니다: {debugger_address} (프로필: {profile})")
+        return host
+
+    def new_driver(self, profile=None):
+        """
+        새 브라우저 컨텍스트를 만들고 그 탭에 연결된 WebDriver 세션을 반환.
+
+        Args:
+            profile (str, optional): Chrome 실행 프로필 이름. 기본값은 LAUNCH_PROFILE 환경 변수.
+
+        Returns:
+            WebDriver: 컨텍스트의 탭을 제어하는 WebDriver (quit 시 컨텍스트 폐기).
+        """
+        from core.driver import Driver
+        from core.launch_profiles import get_profile
+
+        profile = get_profile(profile or Driver.LAUNCH_PROFILE).name
+        with self._lock:
+            if self._closed:
+                raise Exception("SharedChrome이 이미 종료되었습니다.")
+            host = self._acquire_host(profile)
+            connection = CdpConnection.for_driver(host["driver"])
+            context_id = connection.send("Target.createBrowserContext", {"disposeOnDetach": False})["browserContextId"]
+            host["contexts"].add(context_id)
+
+        try:
+            target_id = connection.send(
+                "Target.createTarget", {"url": "about:blank", "browserContextId": context_id})["targetId"]
+            options = webdriver.ChromeOptions()
+            options.debugger_address = host["debugger_address"]
+            driver = Driver.create_session(options)
+            # chromedriver의 창 핸들은 DevTools 타깃 ID와 같음
+            driver.switch_to.window(target_id)
+        except Exception:
+            self._dispose(host, context_id)
+            raise
+
+        session_quit = driver.quit
+
+        def quit():
+            try:
+                session_quit()
+            finally:
+                self._dispose(host, context_id)
+
+        driver.quit = quit
+        driver._browser_context_id = context_id
+        driver._browser_context_target = target_id
+        return driver
+
+    def _dispose(self, host, context_id):
+        with self._lock:
+            host["contexts"].discard(context_id)
+        try:
+            CdpConnection.for_driver(host["driver"]).send(
+                "Target.disposeBrowserContext", {"browserContextId": context_id})
+        except Exception as e:
+            logger.info(f"브라우저 컨텍스트 폐기 중 오류를 무시합니다: {str(e)}")
+
+    def close(self):
+        """
+        모든 Chrome 프로세스를 종료.
+        """
+        with self._lock:
+            self._closed = True
+            hosts, self._hosts = self._hosts, []
+        for host in hosts:
+            try:
+                host["driver"].quit()
+            except Exception as e:
+                logger.info(f"Chrome 종료 중 오류를 무시합니다: {str(e)}")
+
+
+def context_window_handles(driver):
+    """
+    드라이버가 사용할 수 있는 창 핸들 목록을 반환하는 함수.
+
+    - 같은 Chrome에 붙은 세션은 다른 사용자의 컨텍스트 탭도 window_handles로 보이므로,
+      SharedChrome 세션이면 자신의 컨텍스트에 속한 탭만 반환 (처음 연결한 탭이 첫 번째).
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+
+    Returns:
+        list: 창 핸들 목록.
+    """
+    context_id = getattr(driver, "_browser_context_id", None)
+    if context_id is None:
+        return driver.window_handles
+
+    targets = CdpConnection.for_driver(driver).send("Target.getTargets")["targetInfos"]
+    own = {t["targetId"] for t in targets if t.get("type") == "page" and t.get("browserContextId") == context_id}
+    main = driver._browser_context_target
+    return [main] + [handle for handle in driver.window_handles if handle in own and handle != main]
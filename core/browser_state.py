@@ -0,0 +1,66 @@
+from urllib.parse import urlparse
+
+# Network.setCookies가 허용하는 쿠키 필드
+COOKIE_PARAM_KEYS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires", "priority")
+
+
+def capture_browser_state(driver):
+    """
+    현재 브라우저 상태(URL, 모든 도메인의 쿠키, 현재 오리진의 localStorage/sessionStorage)를 수집하는 함수.
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+
+    Returns:
+        dict: JSON으로 저장 가능한 브라우저 상태.
+    """
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {}).get("cookies", [])
+    storage = driver.execute_script(
+        "return {"
+        "  origin: window.location.origin,"
+        "  local: Object.assign({}, window.localStorage),"
+        "  session: Object.assign({}, window.sessionStorage)"
+        "};"
+    )
+    return {"url": driver.current_url, "cookies": cookies, "storage": storage}
+
+
+def restore_browser_state(driver, state, url=None):
+    """
+    수집한 브라우저 상태를 드라이버에 복원하는 함수.
+
+    - 쿠키는 CDP로 한 번에 설정하고, 스토리지는 저장 당시의 오리진에 이동한 뒤 설정.
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+        state (dict): capture_browser_state로 수집한 브라우저 상태.
+        url (str, optional): 복원 후 이동할 URL. 기본값은 저장 당시의 URL.
+    """
+    cookies = []
+    for cookie in state.get("cookies", []):
+        param = {key: cookie[key] for key in COOKIE_PARAM_KEYS if key in cookie}
+        if cookie.get("session"):
+            param.pop("expires", None)
+        cookies.append(param)
+    if cookies:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+    storage = state.get("storage") or {}
+    origin = storage.get("origin")
+    if origin and _origin(driver.current_url) != origin:
+        driver.get(origin)
+    if origin:
+        driver.execute_script(
+            "var local = arguments[0], session = arguments[1];"
+            "Object.keys(local).forEach(function (k) { window.localStorage.setItem(k, local[k]); });"
+            "Object.keys(session).forEach(function (k) { window.sessionStorage.setItem(k, session[k]); });",
+            storage.get("local", {}),
+            storage.get("session", {}),
+        )
+
+    driver.get(url or state.get("url") or origin)
+
+
+def _origin(url):
+    parsed = urlparse(url or "")
+    return f"{parsed.scheme}://{parsed.netloc}" if parsed.netloc else None
@@ -0,0 +1,200 @@
+import json
+import logging
+import threading
+import itertools
+from urllib.parse import urlparse
+
+import urllib3
+import websocket
+
+logger = logging.getLogger(__name__)
+
+
+class CdpError(Exception):
+    """
+    CDP 명령이 오류 응답을 반환한 경우 발생
+    """
+
+
+class CdpConnection:
+    """
+    WebDriver 세션의 브라우저에 직접 연결하는 Chrome DevTools Protocol 웹소켓 연결
+
+    - chromedriver를 거치지 않고 브라우저 웹소켓으로 명령을 보내고 이벤트를 구독.
+    - 수신 스레드가 응답과 이벤트를 분배하므로 이벤트는 폴링 없이 도착 즉시 처리됨.
+    """
+
+    _http = urllib3.PoolManager()
+
+    def __init__(self, ws_url):
+        """
+        CdpConnection 클래스의 생성자.
+
+        Args:
+            ws_url (str): 브라우저 DevTools 웹소켓 URL (ws://host:port/devtools/browser/<id>).
+        """
+        # Chrome 111+는 Origin 헤더가 있는 웹소켓 연결을 거부하므로 Origin을 보내지 않음
+        self._ws = websocket.create_connection(ws_url, suppress_origin=True, enable_multithread=True)
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._listeners = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._reader = threading.Thread(target=self._read_loop, name="cdp-reader", daemon=True)
+        self._reader.start()
+
+    @classmethod
+    def for_driver(cls, driver):
+        """
+        드라이버에 연결된 CdpConnection을 반환. 없으면 새로 연결하여 드라이버에 캐시.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+
+        Returns:
+            CdpConnection: 브라우저 웹소켓 연결.
+        """
+        connection = getattr(driver, "_cdp_connection", None)
+        if connection is None or connection._closed:
+            connection = cls(cls.websocket_url(driver))
+            driver._cdp_connection = connection
+        return connection
+
+    @classmethod
+    def websocket_url(cls, driver):
+        """
+        드라이버 capabilities에서 브라우저 DevTools 웹소켓 URL을 찾음.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+
+        Returns:
+            str: 브라우저 DevTools 웹소켓 URL.
+
+        - 원격 세션(core.remote)의 debuggerAddress는 노드 머신 기준 주소(localhost:<port>)이므로,
+          Selenium Grid가 제공하는 se:cdp가 없으면 노드가 같은 머신에 있는 경우에만 사용.
+
+        Raises:
+            CdpError: 세션에 DevTools 주소가 없거나, 원격 노드의 DevTools 주소에 연결할 수 없는 경우 발생.
+        """
+        capabilities = driver.capabilities
+        if capabilities.get("se:cdp"):
+            return capabilities["se:cdp"]
+
+        remote_node = getattr(driver, "_remote_node", None)
+        if remote_node and urlparse(remote_node).hostname not in ("localhost", "127.0.0.1", "::1"):
+            raise CdpError(
+                f"원격 노드({remote_node})의 세션은 se:cdp를 제공하지 않아 CDP 웹소켓에 연결할 수 없습니다. "
+                "CDP 이벤트 기반 기능은 Selenium Grid 노드에서만 지원합니다.")
+
+        debugger_address = capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+        if not debugger_address:
+            raise CdpError("세션에서 DevTools 주소를 찾을 수 없습니다.")
+
+        response = cls._http.request("GET", f"http://{debugger_address}/json/version")
+        return json.loads(response.data.decode("utf-8"))["webSocketDebuggerUrl"]
+
+    def attach(self, target_id):
+        """
+        타깃(탭)에 flatten 세션으로 연결.
+
+        Args:
+            target_id (str): 연결할 타깃 ID. chromedriver의 창 핸들과 동일.
+
+        Returns:
+            str: CDP 세션 ID.
+        """
+        return self.send("Target.attachToTarget", {"targetId": target_id, "flatten": True})["sessionId"]
+
+    def send(self, method, params=None, session_id=None, timeout=10):
+        """
+        CDP 명령을 보내고 응답을 기다림.
+
+        Args:
+            method (str): CDP 메서드 이름 (예: "Network.enable").
+            params (dict, optional): 명령 파라미터.
+            session_id (str, optional): 타깃 세션 ID. 없으면 브라우저 대상 명령.
+            timeout (float, optional): 응답 대기 시간 (초). 기본값 10초.
+
+        Returns:
+            dict: 명령 결과.
+
+        Raises:
+            CdpError: 오류 응답을 받았거나 시간 내에 응답이 없는 경우 발생.
+        """
+        message_id = next(self._ids)
+        waiter = {"event": threading.Event()}
+        with self._lock:
+            self._pending[message_id] = waiter
+
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+        self._ws.send(json.dumps(message))
+
+        if not waiter["event"].wait(timeout):
+            with self._lock:
+                self._pending.pop(message_id, None)
+            raise CdpError(f"{method} 응답 시간이 초과되었습니다.")
+
+        if "error" in waiter["message"]:
+            raise CdpError(f"{method} 실패: {waiter['message']['error'].get('message')}")
+        return waiter["message"].get("result", {})
+
+    def on(self, method, callback, session_id=None):
+        """
+        CDP 이벤트 리스너를 등록.
+
+        Args:
+            method (str): 이벤트 이름 (예: "Network.responseReceived").
+            callback (callable): 이벤트 params(dict)를 인자로 받는 함수. 수신 스레드에서 호출됨.
+            session_id (str, optional): 이벤트를 받을 타깃 세션 ID.
+        """
+        with self._lock:
+            self._listeners.setdefault((session_id, method), []).append(callback)
+
+    def off(self, method, callback, session_id=None):
+        """
+        등록한 CDP 이벤트 리스너를 해제.
+
+        Args:
+            method (str): 이벤트 이름.
+            callback (callable): 등록했던 함수.
+            session_id (str, optional): 등록 시 사용한 타깃 세션 ID.
+        """
+        with self._lock:
+            callbacks = self._listeners.get((session_id, method), [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    def close(self):
+        self._closed = True
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+    def _read_loop(self):
+        while not self._closed:
+            try:
+                message = json.loads(self._ws.recv())
+            except Exception:
+                # 브라우저 종료(driver.quit) 등으로 연결이 끊어진 경우
+                self._closed = True
+                break
+
+            if "id" in message:
+                with self._lock:
+                    waiter = self._pending.pop(message["id"], None)
+                if waiter:
+                    waiter["message"] = message
+                    waiter["event"].set()
+                continue
+
+            with self._lock:
+                callbacks = list(self._listeners.get((message.get("sessionId"), message.get("method")), []))
+            for callback in callbacks:
+                try:
+                    callback(message.get("params", {}))
+                except Exception as e:
+                    logger.warning(f"CDP 이벤트 처리 중 오류가 발생했습니다 ({message.get('method')}): {str(e)}")
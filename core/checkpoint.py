@@ -0,0 +1,162 @@
+import os
+import json
+import time
+import logging
+
+from core.browser_state import capture_browser_state, restore_browser_state
+from core.utils import safe_filename
+
+logger = logging.getLogger(__name__)
+
+
+class FlowCheckpoint:
+    """
+    긴 플로우의 진행 상태를 이름 붙은 단계마다 디스크에 저장하고, 재시도/재실행 시 마지막 체크포인트부터 이어서 실행
+
+    - 체크포인트는 브라우저 상태(URL, 쿠키, localStorage/sessionStorage)와 테스트 컨텍스트(이메일, 인증 URL 등)로 구성.
+      세션 쿠키가 파일로 저장되므로 CHECKPOINT=true 인 경우에만 사용하며, 비밀번호 등 비밀 값은 컨텍스트에 넣지 않음.
+    - 테스트(nodeid)별로 마지막 체크포인트 하나만 유지하며, 테스트가 통과하면 삭제.
+    - 같은 체크포인트에서 MAX_RESUMES번 넘게 이어서 실행해도 실패하면 체크포인트를 버리고 처음부터 실행.
+    """
+
+    ENABLED = os.getenv("CHECKPOINT", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+    CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", ".checkpoints")
+    TTL = int(os.getenv("CHECKPOINT_TTL", "1800"))  # 체크포인트 유효 시간 (초)
+    MAX_RESUMES = int(os.getenv("CHECKPOINT_MAX_RESUMES", "2"))  # 같은 체크포인트에서 이어서 실행할 최대 횟수
+
+    def __init__(self, key, steps, checkpoint_dir=None, ttl=None):
+        """
+        FlowCheckpoint 클래스의 생성자.
+
+        Args:
+            key (str): 체크포인트를 구분하는 키 (테스트 nodeid).
+            steps (list): 체크포인트 단계 이름 목록 (플로우 진행 순서).
+            checkpoint_dir (str, optional): 저장 디렉토리. 기본값은 CHECKPOINT_DIR 환경 변수.
+            ttl (int, optional): 체크포인트 유효 시간 (초). 기본값은 CHECKPOINT_TTL 환경 변수.
+        """
+        self.key = key
+        self.steps = list(steps)
+        self.checkpoint_dir = checkpoint_dir or FlowCheckpoint.CHECKPOINT_DIR
+        self.ttl = ttl or FlowCheckpoint.TTL
+        self.step = None  # 이어서 실행하는 경우 복원한 단계 이름
+        self.context = {}  # 저장/복원된 테스트 컨텍스트
+        self._resumes = 0
+
+    @property
+    def path(self):
+        return os.path.join(self.checkpoint_dir, f"{safe_filename(self.key)}.json")
+
+    def save(self, driver, step, url=None, **context):
+        """
+        현재 브라우저 상태와 테스트 컨텍스트를 체크포인트로 저장 (이전 체크포인트를 대체).
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+            step (str): 체크포인트 단계 이름 (steps 중 하나).
+            url (str, optional): 복원 후 이동할 URL. 기본값은 저장 시점의 URL.
+            **context: 이어서 실행할 때 필요한 테스트 컨텍스트 (JSON으로 저장 가능한 값).
+        """
+        if not FlowCheckpoint.ENABLED:
+            return
+        if step not in self.steps:
+            raise ValueError(f"알 수 없는 체크포인트 단계입니다: {step} (사용 가능: {', '.join(self.steps)})")
+
+        self.context.update(context)
+        try:
+            state = capture_browser_state(driver)
+        except Exception as e:
+            logger.warning(f"체크포인트 '{step}'의 브라우저 상태를 수집하지 못했습니다: {str(e)}")
+            return
+        checkpoint = {
+            "key": self.key,
+            "step": step,
+            "url": url,
+            "saved_at": time.time(),
+            "expires_at": time.time() + self.ttl,
+            "resumes": 0,
+            "context": self.context,
+            "state": state,
+        }
+        self._write(checkpoint)
+
+    def load(self):
+        """
+        유효한 체크포인트를 읽어옴.
+
+        Returns:
+            dict or None: 만료되지 않은 체크포인트. 없거나 만료된 경우 None.
+        """
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if checkpoint.get("expires_at", 0) <= time.time() or checkpoint.get("step") not in self.steps:
+            logger.info(f"체크포인트가 만료되어 삭제합니다: {self.key}")
+            self.clear()
+            return None
+        return checkpoint
+
+    def resume(self, driver):
+        """
+        마지막 체크포인트가 있으면 브라우저 상태를 복원하고 테스트 컨텍스트를 반환.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+
+        Returns:
+            dict: 복원한 테스트 컨텍스트. 체크포인트가 없으면 빈 dict (처음부터 실행).
+        """
+        checkpoint = self.load() if FlowCheckpoint.ENABLED else None
+        if checkpoint is None:
+            return self.context
+
+        if checkpoint.get("resumes", 0) >= FlowCheckpoint.MAX_RESUMES:
+            logger.info(f"체크포인트 '{checkpoint['step']}'에서 {FlowCheckpoint.MAX_RESUMES}번 실패하여 처음부터 실행합니다: {self.key}")
+            self.clear()
+            return self.context
+
+        # 이어서 실행한 횟수를 먼저 기록하여, 복원한 상태로 계속 실패하는 경우 처음부터 다시 실행되도록 함
+        checkpoint["resumes"] = checkpoint.get("resumes", 0) + 1
+        self._write(checkpoint)
+        try:
+            restore_browser_state(driver, checkpoint["state"], url=checkpoint.get("url"))
+        except Exception as e:
+            logger.warning(f"체크포인트 '{checkpoint['step']}'를 복원하지 못해 처음부터 실행합니다: {str(e)}")
+            return self.context
+
+        self.step = checkpoint["step"]
+        self.context = dict(checkpoint.get("context") or {})
+        logger.info(f"체크포인트 '{self.step}'부터 이어서 실행합니다: {self.key}")
+        print(f"Resuming from checkpoint: {self.step}")
+        return self.context
+
+    def reached(self, step):
+        """
+        복원한 체크포인트가 지정한 단계 이후인지 확인 (True이면 해당 단계까지는 건너뜀).
+
+        Args:
+            step (str): 체크포인트 단계 이름.
+
+        Returns:
+            bool: 이미 지난 단계이면 True.
+        """
+        if self.step is None:
+            return False
+        return self.steps.index(self.step) >= self.steps.index(step)
+
+    def clear(self):
+        """
+        체크포인트를 삭제.
+        """
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    def _write(self, checkpoint):
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        with open(f"{self.path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(f"{self.path}.tmp", self.path)  # 저장 중 실패해도 이전 체크포인트가 깨지지 않도록 원자적으로 교체
@@ -1,5 +1,10 @@
 import os
 from selenium import webdriver
+from core.launch_profiles import get_profile
+from core.profiler import CommandProfiler
+from core.driver_service import DriverService
+from core.browser_context import SharedChrome
+from core.remote import SessionDistributor
 
 class Driver:
     """
@@ -7,17 +12,26 @@ class Driver:
     """
 
     BASE_URL = os.getenv("BASE_URL", "https://weverse.io")
+    API_HOST = os.getenv("API_HOST", "https://global.apis.naver.com")
     HEADLESS = os.getenv("HEADLESS", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+    # 크롬 상세 로깅 및 성능 로그 수집 여부 (디버깅 용도, 기본값은 False)
+    VERBOSE_LOGGING = os.getenv("CHROME_VERBOSE_LOGGING", "False").lower() in ("true", "1", "yes")
+    # Chrome 실행 프로필 ("full": 기본, "lean": 무거운 리소스/서드파티 차단 및 백그라운드 기능 비활성화)
+    LAUNCH_PROFILE = os.getenv("LAUNCH_PROFILE", "full")
 
     @staticmethod
-    def get_driver():
+    def get_options(profile=None):
         """
-        Selenium WebDriver를 생성 및  기본 설정을 적용
+        Chrome 옵션(기본 설정 및 실행 프로필의 추가 인자)을 생성
+
+        Args:
+            profile (str, optional): Chrome 실행 프로필 이름. 기본값은 LAUNCH_PROFILE 환경 변수.
 
         Returns:
-            WebDriver: 설정이 완료된 Chrome WebDriver 인스턴스를 반환합니다.
+            ChromeOptions: 설정이 적용된 Chrome 옵션.
         """
 
+        launch_profile = get_profile(profile or Driver.LAUNCH_PROFILE)
         chrome_options = webdriver.ChromeOptions()
 
         # SSL 관련 오류 우회
@@ -27,10 +41,11 @@ class Driver:
         # 자동화 제어 관련 기능 비활성화
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
 
-        # 브라우저의 로깅 기능 활성화
-        chrome_options.add_argument("--enable-logging")
-        chrome_options.add_argument("--v=1")
-        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        # 브라우저의 로깅 기능 활성화 (네트워크 캡처는 CDP 기반 NetworkRecorder를 사용하므로 기본적으로 비활성화)
+        if Driver.VERBOSE_LOGGING:
+            chrome_options.add_argument("--enable-logging")
+            chrome_options.add_argument("--v=1")
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
 
         # 헤드리스 모드 설정
         if Driver.HEADLESS:
@@ -38,7 +53,55 @@ class Driver:
             chrome_options.add_argument("--disable-gpu")
             chrome_options.add_argument("--window-size=1920x1080")
 
-        driver = webdriver.Chrome(options=chrome_options)
+        # 실행 프로필의 추가 인자 적용
+        launch_profile.apply_options(chrome_options)
+        return chrome_options
+
+    @staticmethod
+    def create_session(chrome_options):
+        """
+        옵션으로 새 WebDriver 세션을 생성 (DRIVER_SERVICE=true 이면 공유 chromedriver 서비스 사용)
+
+        Args:
+            chrome_options (ChromeOptions): Chrome 옵션.
+
+        Returns:
+            WebDriver: 생성된 Chrome WebDriver 인스턴스.
+        """
+        if DriverService.ENABLED:
+            return DriverService.get().create_driver(chrome_options)
+        return webdriver.Chrome(options=chrome_options)
+
+    @staticmethod
+    def get_driver(profile=None, affinity=None):
+        """
+        Selenium WebDriver를 생성 및  기본 설정을 적용
+
+        Args:
+            profile (str, optional): Chrome 실행 프로필 이름. 기본값은 LAUNCH_PROFILE 환경 변수.
+            affinity (str, optional): 원격 실행 시 같은 노드에 모을 세션의 키 (예: 테스트 nodeid).
+
+        Returns:
+            WebDriver: 설정이 완료된 Chrome WebDriver 인스턴스를 반환합니다.
+        """
+
+        launch_profile = get_profile(profile or Driver.LAUNCH_PROFILE)
+
+        # REMOTE_NODES가 설정되어 있으면 원격 노드에 세션을 분배
+        if SessionDistributor.ENABLED:
+            driver = SessionDistributor.get().create_driver(Driver.get_options(profile), affinity)
+        # BROWSER_CONTEXTS=true 이면 공유 Chrome 안의 격리된 브라우저 컨텍스트에 세션을 생성
+        elif SharedChrome.ENABLED:
+            driver = SharedChrome.get().new_driver(profile)
+        else:
+            driver = Driver.create_session(Driver.get_options(profile))
+
+        # 명령 단위 프로파일링 (COMMAND_PROFILE=true 인 경우에만)
+        if CommandProfiler.ENABLED:
+            CommandProfiler.for_driver(driver)
+
+        # 첫 페이지 이동 전에 리소스 차단 규칙 적용
+        launch_profile.apply_session(driver)
 
         # 브라우저 창을 최대화 (헤드리스 모드가 아닐 경우)
         if not Driver.HEADLESS:
@@ -0,0 +1,200 @@
+import os
+import time
+import queue
+import logging
+import threading
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+
+from core.driver import Driver
+from core.browser_context import context_window_handles
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """
+    Chrome 세션을 재사용하는 드라이버 풀
+
+    - 테스트가 끝난 세션은 종료하지 않고 CDP로 상태(쿠키, 스토리지, 캐시, 서비스 워커)를 초기화한 뒤 풀에 반환.
+    - 반환/대여 시 헬스 체크를 수행하여 응답하지 않거나 깨진 세션은 폐기하고 새 세션으로 대체.
+    """
+
+    ENABLED = os.getenv("DRIVER_POOL", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+    SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+    MAX_USES = int(os.getenv("DRIVER_POOL_MAX_USES", "50"))  # 세션 재사용 최대 횟수 (초과 시 재생성)
+    HEALTH_CHECK_TIMEOUT = float(os.getenv("DRIVER_POOL_HEALTH_TIMEOUT", "5"))
+    CLOSE_TIMEOUT = float(os.getenv("DRIVER_POOL_CLOSE_TIMEOUT", "30"))  # 종료 시 세션 quit을 기다릴 최대 시간 (초)
+    # BASE_URL 외에 초기화가 필요한 오리진 (쉼표로 구분, 예: https://account.weverse.io)
+    EXTRA_ORIGINS = [o.strip() for o in os.getenv("DRIVER_POOL_EXTRA_ORIGINS", "").split(",") if o.strip()]
+
+    def __init__(self, size=None, factory=None):
+        """
+        DriverPool 클래스의 생성자.
+
+        Args:
+            size (int, optional): 풀에 유지할 최대 세션 수. 기본값은 DRIVER_POOL_SIZE 환경 변수.
+            factory (callable, optional): 새 WebDriver를 생성하는 함수. 기본값은 Driver.get_driver.
+        """
+        self.size = size or DriverPool.SIZE
+        self.factory = factory or Driver.get_driver
+        self._idle = queue.LifoQueue()  # 가장 최근에 사용한 (캐시가 따뜻한) 세션부터 대여
+        self._uses = {}
+        self._quitting = []  # 백그라운드에서 quit 중인 스레드
+        self._closed = False
+
+    def acquire(self):
+        """
+        풀에서 정상 상태의 세션을 대여. 유휴 세션이 없으면 새로 생성.
+
+        Returns:
+            WebDriver: BASE_URL로 이동된 깨끗한 상태의 WebDriver 인스턴스.
+        """
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+
+            if self.is_healthy(driver):
+                self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+                return driver
+            self._discard(driver)
+
+        driver = self.factory()
+        self._uses[id(driver)] = 1
+        return driver
+
+    def release(self, driver):
+        """
+        사용이 끝난 세션을 초기화한 뒤 풀에 반환. 초기화에 실패하거나 재사용 한도를 넘으면 폐기.
+
+        Args:
+            driver: 반환할 WebDriver 인스턴스.
+        """
+        if self._closed or self._uses.get(id(driver), 0) >= self.MAX_USES or self._idle.qsize() >= self.size:
+            self._discard(driver)
+            return
+
+        try:
+            self.reset(driver)
+        except Exception as e:
+            logger.warning(f"세션 초기화 중 오류가 발생하여 세션을 폐기합니다: {str(e)}")
+            self._discard(driver)
+            return
+
+        self._idle.put(driver)
+
+    def reset(self, driver):
+        """
+        CDP를 이용해 세션의 브라우저 상태를 초기화하고 BASE_URL로 이동.
+
+        - 추가로 열린 창/탭 닫기
+        - 쿠키, HTTP 캐시 삭제
+        - 방문한 오리진의 localStorage, sessionStorage, IndexedDB, Cache Storage, 서비스 워커 삭제
+
+        Args:
+            driver: 초기화할 WebDriver 인스턴스.
+        """
+        handles = context_window_handles(driver)
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        origins = {self._origin(Driver.BASE_URL), self._origin(driver.current_url)}
+        origins.update(self._origin(o) for o in self.EXTRA_ORIGINS)
+        origins.discard(None)
+
+        # sessionStorage는 탭 단위이므로 현재 문서에서 직접 삭제
+        driver.execute_script("try { window.sessionStorage.clear(); window.localStorage.clear(); } catch (e) {}")
+
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        for origin in origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+
+        # 네트워크 모니터가 연결된 세션이면 이전 테스트의 요청 기록을 비움
+        monitor = getattr(driver, "_network_monitor", None)
+        if monitor is not None:
+            monitor.clear()
+
+        driver.get(Driver.BASE_URL)
+
+    def is_healthy(self, driver):
+        """
+        세션이 정상적으로 응답하는지 확인.
+
+        Args:
+            driver: 확인할 WebDriver 인스턴스.
+
+        Returns:
+            bool: HEALTH_CHECK_TIMEOUT 안에 브라우저가 스크립트를 실행하면 True.
+        """
+        result = {}
+
+        def check():
+            try:
+                result["state"] = driver.execute_script("return document.readyState")
+            except WebDriverException as e:
+                result["error"] = e
+
+        # 멈춘 세션의 명령이 테스트를 붙잡지 않도록 별도 데몬 스레드에서 타임아웃과 함께 실행
+        checker = threading.Thread(target=check, daemon=True)
+        checker.start()
+        checker.join(self.HEALTH_CHECK_TIMEOUT)
+
+        if checker.is_alive():
+            logger.warning("세션이 응답하지 않습니다 (헬스 체크 시간 초과).")
+            return False
+        if "error" in result:
+            logger.warning(f"세션 헬스 체크 실패: {str(result['error'])}")
+            return False
+        return result.get("state") in ("interactive", "complete")
+
+    def close(self, timeout=None):
+        """
+        풀에 남아 있는 모든 세션을 종료하고, 백그라운드 quit이 끝날 때까지 대기.
+
+        - 세션 종료 직후 인터프리터가 끝나면 데몬 스레드가 함께 종료되어 Chrome/chromedriver가 남으므로 quit 완료를 기다림.
+
+        Args:
+            timeout (float, optional): 최대 대기 시간 (초). 기본값은 CLOSE_TIMEOUT.
+        """
+        self._closed = True
+        while True:
+            try:
+                self._discard(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+        deadline = time.monotonic() + (self.CLOSE_TIMEOUT if timeout is None else timeout)
+        for thread in self._quitting:
+            thread.join(max(deadline - time.monotonic(), 0))
+        remaining = [thread for thread in self._quitting if thread.is_alive()]
+        if remaining:
+            logger.warning(f"{len(remaining)}개 세션이 시간 내에 종료되지 않았습니다.")
+
+    def _discard(self, driver):
+        """
+        세션을 풀에서 제거하고 종료. 멈춘 세션의 quit이 테스트를 막지 않도록 백그라운드에서 실행 (close에서 완료를 기다림).
+        """
+        self._uses.pop(id(driver), None)
+        thread = threading.Thread(target=self._quit_quietly, args=(driver,), daemon=True)
+        thread.start()
+        self._quitting = [t for t in self._quitting if t.is_alive()] + [thread]
+
+    @staticmethod
+    def _quit_quietly(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.info(f"세션 종료 중 오류를 무시합니다: {str(e)}")
+
+    @staticmethod
+    def _origin(url):
+        parsed = urlparse(url or "")
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return None
+        return f"{parsed.scheme}://{parsed.netloc}"
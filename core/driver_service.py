@@ -0,0 +1,297 @@
+import os
+import sys
+import json
+import time
+import atexit
+import logging
+import argparse
+import platform
+import threading
+
+import selenium
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.remote_connection import ChromeRemoteConnection
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+logger = logging.getLogger(__name__)
+
+
+class _AttachedChrome(webdriver.Chrome):
+    """
+    이미 실행 중인 chromedriver 서비스에 세션만 새로 만드는 Chrome 드라이버
+
+    - webdriver.Chrome과 같은 API(execute_cdp_cmd 등)를 제공하지만, 생성 시 서비스를 시작하지 않고
+      종료(quit) 시 세션만 닫고 서비스는 유지.
+    """
+
+    def __init__(self, service, options):
+        self.service = service
+        executor = ChromeRemoteConnection(
+            remote_server_addr=service.service_url,
+            keep_alive=True,
+            ignore_proxy=options._ignore_local_proxy,
+        )
+        RemoteWebDriver.__init__(self, command_executor=executor, options=options)
+        self._is_remote = False
+
+    def quit(self):
+        RemoteWebDriver.quit(self)
+
+
+class DriverService:
+    """
+    chromedriver/Chrome 경로 확인 결과를 캐시하고, 여러 세션이 공유하는 chromedriver 서비스를 관리
+
+    - webdriver.Chrome은 세션마다 Selenium Manager 실행(경로 확인)과 chromedriver 프로세스 시작을 반복하므로,
+      경로는 머신 단위 캐시 파일에 저장하고 chromedriver는 프로세스당 하나만 띄워 세션을 붙임.
+    - 캐시는 Selenium 버전/플랫폼/요청한 브라우저 버전으로 구분하고, 바이너리 파일이 바뀌거나(브라우저 업데이트)
+      CACHE_TTL이 지나거나 버전 불일치로 세션 생성이 실패하면 다시 확인.
+    """
+
+    ENABLED = os.getenv("DRIVER_SERVICE", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+    CACHE_PATH = os.getenv(
+        "DRIVER_CACHE_PATH", os.path.join(os.path.expanduser("~"), ".cache", "weverse-test", "driver_paths.json"))
+    CACHE_TTL = int(os.getenv("DRIVER_CACHE_TTL", "86400"))  # 경로 확인 결과 유효 시간 (초)
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, cache_path=None, cache_ttl=None):
+        """
+        DriverService 클래스의 생성자.
+
+        Args:
+            cache_path (str, optional): 경로 캐시 파일. 기본값은 DRIVER_CACHE_PATH 환경 변수.
+            cache_ttl (int, optional): 캐시 유효 시간 (초). 기본값은 DRIVER_CACHE_TTL 환경 변수.
+        """
+        self.cache_path = cache_path or DriverService.CACHE_PATH
+        self.cache_ttl = cache_ttl or DriverService.CACHE_TTL
+        self._service = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls):
+        """
+        프로세스 공용 DriverService를 반환 (프로세스 종료 시 chromedriver도 종료).
+
+        Returns:
+            DriverService: 드라이버 서비스.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+                atexit.register(cls._instance.stop)
+            return cls._instance
+
+    @staticmethod
+    def _cache_key(options):
+        return "|".join([
+            selenium.__version__,
+            platform.system(),
+            platform.machine(),
+            options.capabilities.get("browserName", "chrome"),
+            options.browser_version or "stable",
+            options.binary_location or "",
+        ])
+
+    @staticmethod
+    def _fingerprint(path):
+        # 브라우저/드라이버가 업데이트되면 파일의 크기나 수정 시각이 바뀜
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _read_cache(self):
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_cache(self, cache):
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=2)
+        os.replace(tmp_path, self.cache_path)  # 여러 프로세스가 동시에 써도 깨지지 않도록 원자적으로 교체
+
+    def _cached_paths(self, key):
+        entry = self._read_cache().get(key)
+        if not entry or entry.get("resolved_at", 0) + self.cache_ttl <= time.time():
+            return None
+        try:
+            for name in ("driver_path", "browser_path"):
+                if entry[name] and self._fingerprint(entry[name]) != entry[f"{name}_fingerprint"]:
+                    return None
+        except (OSError, KeyError):
+            return None
+        return {"driver_path": entry["driver_path"], "browser_path": entry["browser_path"]}
+
+    def resolve(self, options, refresh=False):
+        """
+        chromedriver/Chrome 경로를 반환. 유효한 캐시가 없으면 Selenium Manager로 확인하고 캐시에 저장.
+
+        Args:
+            options (ChromeOptions): 드라이버 옵션 (브라우저 버전, 실행 파일 경로 반영).
+            refresh (bool, optional): True이면 캐시를 무시하고 다시 확인.
+
+        Returns:
+            dict: {"driver_path", "browser_path"}.
+        """
+        key = self._cache_key(options)
+        paths = None if refresh else self._cached_paths(key)
+        if paths is not None:
+            return paths
+
+        started = time.perf_counter()
+        finder = DriverFinder(Service(), options)
+        paths = {"driver_path": finder.get_driver_path(), "browser_path": finder.get_browser_path()}
+        logger.info(f"드라이버 경로를 확인했습니다 ({(time.perf_counter() - started) * 1000:.0f}ms): {paths}")
+
+        entry = dict(paths, resolved_at=time.time())
+        for name in ("driver_path", "browser_path"):
+            entry[f"{name}_fingerprint"] = self._fingerprint(paths[name]) if paths[name] else None
+        cache = self._read_cache()
+        cache[key] = entry
+        self._write_cache(cache)
+        return paths
+
+    def invalidate(self, options):
+        """
+        옵션에 해당하는 경로 캐시를 삭제.
+        """
+        cache = self._read_cache()
+        if cache.pop(self._cache_key(options), None) is not None:
+            self._write_cache(cache)
+
+    def service(self, driver_path):
+        """
+        공유 chromedriver 서비스를 반환. 실행 중이 아니거나 드라이버 경로가 바뀌었으면 새로 시작.
+
+        Args:
+            driver_path (str): chromedriver 경로.
+
+        Returns:
+            Service: 시작된 chromedriver 서비스.
+        """
+        with self._lock:
+            service = self._service
+            if service is not None and (service.path != driver_path or service.process.poll() is not None):
+                logger.info("chromedriver 서비스를 다시 시작합니다.")
+                self._stop_service(service)
+                service = None
+            if service is None:
+                service = Service(executable_path=driver_path)
+                service.start()
+                self._service = service
+            return service
+
+    def create_driver(self, options):
+        """
+        공유 chromedriver 서비스에 새 Chrome 세션을 생성.
+
+        - 브라우저 업데이트로 캐시된 chromedriver와 버전이 맞지 않으면 경로를 다시 확인하고 한 번 재시도.
+
+        Args:
+            options (ChromeOptions): 드라이버 옵션.
+
+        Returns:
+            WebDriver: webdriver.Chrome과 같은 API의 드라이버 (quit 시 세션만 종료).
+        """
+        requested = options.browser_version, options.binary_location
+        for attempt in range(2):
+            options.browser_version, options.binary_location = requested
+            paths = self.resolve(options, refresh=attempt > 0)
+            if paths["browser_path"]:
+                options.binary_location = paths["browser_path"]
+                options.browser_version = None
+            try:
+                return _AttachedChrome(self.service(paths["driver_path"]), options)
+            except SessionNotCreatedException as e:
+                if attempt > 0:
+                    raise
+                logger.warning(f"세션 생성에 실패하여 드라이버 경로를 다시 확인합니다: {(str(e).splitlines() or [''])[0]}")
+
+    def stop(self):
+        """
+        공유 chromedriver 서비스를 종료.
+        """
+        with self._lock:
+            if self._service is not None:
+                self._stop_service(self._service)
+                self._service = None
+
+    @staticmethod
+    def _stop_service(service):
+        try:
+            service.stop()
+        except Exception as e:
+            logger.info(f"chromedriver 서비스 종료 중 오류를 무시합니다: {str(e)}")
+
+
+def measure_startup(create, sessions):
+    """
+    세션 생성(create)과 종료에 걸린 시간을 측정하는 함수.
+
+    Returns:
+        dict: {"start_ms": [...], "quit_ms": [...]}.
+    """
+    result = {"start_ms": [], "quit_ms": []}
+    for _ in range(sessions):
+        started = time.perf_counter()
+        driver = create()
+        driver.execute_script("return 1")
+        result["start_ms"].append((time.perf_counter() - started) * 1000)
+        started = time.perf_counter()
+        driver.quit()
+        result["quit_ms"].append((time.perf_counter() - started) * 1000)
+    return result
+
+
+def main(argv=None):
+    """
+    드라이버 서비스 실행 진입점.
+
+    Example:
+        python -m core.driver_service bench --sessions 5
+        python -m core.driver_service resolve --refresh
+    """
+    from core.driver import Driver
+    from core.timing import percentile
+
+    parser = argparse.ArgumentParser(description="chromedriver 경로 캐시와 공유 서비스를 관리합니다.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    resolve_parser = subparsers.add_parser("resolve", help="드라이버 경로를 확인하고 캐시에 저장")
+    resolve_parser.add_argument("--refresh", action="store_true", help="캐시를 무시하고 다시 확인")
+    bench_parser = subparsers.add_parser("bench", help="세션 시작 시간을 기존 방식(cold)과 비교")
+    bench_parser.add_argument("--sessions", type=int, default=5, help="방식별로 생성할 세션 수")
+    bench_parser.add_argument("--profile", default=Driver.LAUNCH_PROFILE, help="Chrome 실행 프로필")
+    args = parser.parse_args(argv)
+
+    service = DriverService()
+    if args.command == "resolve":
+        print(json.dumps(service.resolve(Driver.get_options(), refresh=args.refresh), indent=2))
+        return 0
+
+    results = {
+        "cold": measure_startup(lambda: webdriver.Chrome(options=Driver.get_options(args.profile)), args.sessions),
+        "shared": measure_startup(lambda: service.create_driver(Driver.get_options(args.profile)), args.sessions),
+    }
+    service.stop()
+
+    print(f"{'mode':<8} {'sessions':>8} {'start p50':>10} {'start p95':>10} {'first':>8} {'quit p50':>9}")
+    for mode, result in results.items():
+        print(
+            f"{mode:<8} {args.sessions:>8} {percentile(result['start_ms'], 50):>8.0f}ms "
+            f"{percentile(result['start_ms'], 95):>8.0f}ms {result['start_ms'][0]:>6.0f}ms "
+            f"{percentile(result['quit_ms'], 50):>7.0f}ms"
+        )
+    saving = percentile(results["cold"]["start_ms"], 50) - percentile(results["shared"]["start_ms"], 50)
+    print(f"세션당 시작 시간 절감 (p50): {saving:.0f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+import os
+import re
+import time
+import heapq
+import sqlite3
+import statistics
+from contextlib import closing
+
+
+class DurationHistory:
+    """
+    테스트별 실행 시간 기록을 저장하는 로컬 SQLite 저장소 (병렬 워커 프로세스가 같은 파일에 기록)
+
+    - 실행 대상(BASE_URL 또는 "standin")별로 구분하여 저장하며, 최근 SAMPLES번 실행의 중앙값으로 시간을 예측.
+    - 단위 테스트 실행 등에서 기록 파일이 생기지 않도록 기본적으로는 core.parallel 워커에서만 기록.
+    - 기록이 없는 테스트는 duration 마커 또는 docstring의 "Steps:" 단계 수로 시간을 추정.
+    """
+
+    # 기본값은 False (core.parallel이 실행한 워커에서는 따로 지정하지 않으면 기록)
+    ENABLED = os.getenv("DURATION_HISTORY", "False").lower() in ("true", "1", "yes")
+    DB_PATH = os.getenv("DURATION_HISTORY_DB", ".durations/history.sqlite3")
+    SAMPLES = int(os.getenv("DURATION_HISTORY_SAMPLES", "5"))  # 예측에 사용할 최근 실행 수
+    SECONDS_PER_STEP = float(os.getenv("DURATION_SECONDS_PER_STEP", "5"))  # 기록이 없을 때 단계당 추정 시간 (초)
+    DEFAULT_SECONDS = float(os.getenv("DURATION_DEFAULT_SECONDS", "30"))  # 단계도 알 수 없을 때의 추정 시간 (초)
+
+    def __init__(self, path=None):
+        """
+        DurationHistory 클래스의 생성자.
+
+        Args:
+            path (str, optional): SQLite 파일 경로. 기본값은 DURATION_HISTORY_DB 환경 변수.
+        """
+        self.path = path or DurationHistory.DB_PATH
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS durations ("
+                " nodeid TEXT NOT NULL, target TEXT NOT NULL, seconds REAL NOT NULL,"
+                " outcome TEXT NOT NULL, steps INTEGER, recorded_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS durations_nodeid ON durations (target, nodeid, recorded_at)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def record(self, nodeid, target, seconds, outcome, steps=None):
+        """
+        테스트 한 번의 실행 시간을 기록.
+
+        Args:
+            nodeid (str): 테스트 노드 ID.
+            target (str): 실행 대상 (BASE_URL 또는 "standin").
+            seconds (float): setup/call/teardown을 합친 실행 시간 (초).
+            outcome (str): 결과 ("passed", "failed", "skipped").
+            steps (int, optional): 테스트에 선언된 단계 수.
+        """
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT INTO durations (nodeid, target, seconds, outcome, steps, recorded_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (nodeid, target, seconds, outcome, steps, time.time()),
+            )
+
+    def recent(self, target):
+        """
+        대상별로 테스트마다 최근 SAMPLES번의 통과한 실행 시간을 반환.
+
+        - 실패한 실행은 중간에 끝나 실제 시간보다 짧을 수 있으므로 예측에 사용하지 않음.
+
+        Returns:
+            dict: {nodeid: {"seconds": [...], "steps": 단계 수}}.
+        """
+        history = {}
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT nodeid, seconds, steps FROM durations WHERE target = ? AND outcome = 'passed'"
+                " ORDER BY recorded_at DESC",
+                (target,),
+            ).fetchall()
+        for nodeid, seconds, steps in rows:
+            entry = history.setdefault(nodeid, {"seconds": [], "steps": steps})
+            if len(entry["seconds"]) < DurationHistory.SAMPLES:
+                entry["seconds"].append(seconds)
+        return history
+
+    def estimate(self, items, target):
+        """
+        테스트별 예상 실행 시간을 계산.
+
+        - 기록이 있으면 최근 실행 시간의 중앙값.
+        - 없으면 duration 마커의 값, 또는 "Steps:" 단계 수 × 단계당 시간
+          (단계당 시간은 단계 수가 기록된 다른 테스트의 실행 기록으로 보정하며, 없으면 SECONDS_PER_STEP).
+
+        Args:
+            items (list): pytest Item 목록.
+            target (str): 실행 대상.
+
+        Returns:
+            dict: {nodeid: (예상 시간(초), 근거("history", "marker", "steps", "default"))}.
+        """
+        history = self.recent(target)
+        per_step = [
+            statistics.median(entry["seconds"]) / entry["steps"]
+            for entry in history.values() if entry["steps"]
+        ]
+        seconds_per_step = statistics.median(per_step) if per_step else DurationHistory.SECONDS_PER_STEP
+
+        estimates = {}
+        for item in items:
+            entry = history.get(item.nodeid)
+            marker = item.get_closest_marker("duration")
+            steps = declared_steps(item)
+            if entry:
+                estimates[item.nodeid] = (statistics.median(entry["seconds"]), "history")
+            elif marker and marker.args:
+                estimates[item.nodeid] = (float(marker.args[0]), "marker")
+            elif steps:
+                estimates[item.nodeid] = (steps * seconds_per_step, "steps")
+            else:
+                estimates[item.nodeid] = (DurationHistory.DEFAULT_SECONDS, "default")
+        return estimates
+
+
+def declared_steps(item):
+    """
+    테스트 docstring의 "Steps:" 섹션에 선언된 단계 수를 세는 함수.
+
+    Args:
+        item: pytest Item.
+
+    Returns:
+        int: 단계 수. 선언된 단계가 없으면 0.
+    """
+    doc = getattr(getattr(item, "obj", None), "__doc__", None) or ""
+    match = re.search(r"^\s*Steps:\s*$(.*?)(?=^\s*\w[\w ]*:\s*$|\Z)", doc, re.MULTILINE | re.DOTALL)
+    if not match:
+        return 0
+    return len(re.findall(r"^\s*\d+\.", match.group(1), re.MULTILINE))
+
+
+def lpt_schedule(estimates, workers):
+    """
+    예상 시간이 긴 테스트부터 현재 부하가 가장 작은 워커에 배정하는 LPT(Longest Processing Time first) 스케줄링.
+
+    Args:
+        estimates (dict): {nodeid: 예상 시간(초)}.
+        workers (int): 워커 수.
+
+    Returns:
+        list: 워커별 (예상 부하(초), 노드 ID 목록) 리스트 (비어 있는 워커는 제외, 각 목록은 긴 테스트부터).
+    """
+    loads = [(0.0, index, []) for index in range(workers)]
+    heapq.heapify(loads)
+    for nodeid in sorted(estimates, key=lambda key: (-estimates[key], key)):
+        load, index, nodeids = heapq.heappop(loads)
+        nodeids.append(nodeid)
+        heapq.heappush(loads, (load + estimates[nodeid], index, nodeids))
+    return [(load, nodeids) for load, _, nodeids in sorted(loads, key=lambda entry: entry[1]) if nodeids]
@@ -0,0 +1,90 @@
+"""
+BrowserWait에서 사용하는 대기 조건
+
+selenium.webdriver.support.expected_conditions와 같은 이름을 제공하므로
+`from core import expected_conditions as EC`로 바꾸기만 하면 기존 EC.* 호출을 그대로 사용할 수 있음.
+"""
+
+
+class Condition:
+    """
+    브라우저 안에서 평가되는 대기 조건
+    """
+
+    def __init__(self, kind, locator=None, value=None, ready=False):
+        """
+        Condition 클래스의 생성자.
+
+        Args:
+            kind (str): 조건 종류 (present, visible, clickable, invisible, url_contains, url_to_be, title_contains, ready_state).
+            locator (tuple, optional): (By, 값) 형식의 요소 위치 (요소 조건인 경우).
+            value (str, optional): 비교할 값 (URL, 제목, readyState 등).
+            ready (bool, optional): True이면 document.readyState가 complete일 때만 충족.
+        """
+        self.kind = kind
+        self.locator = locator
+        self.value = value
+        self.ready = ready
+
+    def spec(self):
+        by, selector = self.locator if self.locator else (None, None)
+        return {"kind": self.kind, "by": by, "selector": selector, "value": self.value, "ready": self.ready}
+
+    def __repr__(self):
+        return f"Condition({self.kind}, {self.locator or self.value})"
+
+
+def presence_of_element_located(locator):
+    """
+    요소가 DOM에 존재.
+    """
+    return Condition("present", locator)
+
+
+def visibility_of_element_located(locator):
+    """
+    요소가 DOM에 존재하고 화면에 노출.
+    """
+    return Condition("visible", locator)
+
+
+def element_to_be_clickable(locator):
+    """
+    요소가 노출되어 있고 비활성(disabled) 상태가 아님.
+    """
+    return Condition("clickable", locator)
+
+
+def invisibility_of_element_located(locator):
+    """
+    요소가 없거나 화면에 노출되지 않음.
+    """
+    return Condition("invisible", locator)
+
+
+def url_contains(url):
+    """
+    현재 URL에 문자열이 포함.
+    """
+    return Condition("url_contains", value=url)
+
+
+def url_to_be(url):
+    """
+    현재 URL이 값과 일치.
+    """
+    return Condition("url_to_be", value=url)
+
+
+def title_contains(title):
+    """
+    문서 제목에 문자열이 포함.
+    """
+    return Condition("title_contains", value=title)
+
+
+def document_ready_state(state="complete"):
+    """
+    document.readyState가 값과 일치 (기본값 complete).
+    """
+    return Condition("ready_state", value=state)
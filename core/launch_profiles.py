@@ -0,0 +1,187 @@
+import os
+import sys
+import json
+import argparse
+import statistics
+
+
+class LaunchProfile:
+    """
+    Chrome 실행 프로필 (추가 실행 인자 + CDP로 차단할 URL 패턴)
+    """
+
+    def __init__(self, name, arguments=None, blocked_urls=None):
+        """
+        LaunchProfile 클래스의 생성자.
+
+        Args:
+            name (str): 프로필 이름.
+            arguments (list, optional): Chrome 실행 인자.
+            blocked_urls (list, optional): Network.setBlockedURLs에 전달할 URL 패턴 (와일드카드 * 사용 가능).
+        """
+        self.name = name
+        self.arguments = arguments or []
+        self.blocked_urls = blocked_urls or []
+
+    def apply_options(self, chrome_options):
+        """
+        Chrome 옵션에 프로필의 실행 인자를 추가.
+
+        Args:
+            chrome_options: webdriver.ChromeOptions 인스턴스.
+        """
+        for argument in self.arguments:
+            chrome_options.add_argument(argument)
+
+    def apply_session(self, driver):
+        """
+        생성된 세션에 리소스 차단 규칙을 적용 (첫 페이지 이동 전에 호출).
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+        """
+        if not self.blocked_urls:
+            return
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+
+
+# 폼 입력 위주의 기능 테스트에 필요 없는 무거운 리소스
+HEAVY_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+]
+
+# 서드파티 분석/광고/트래커 도메인
+THIRD_PARTY_PATTERNS = [
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*facebook.net*", "*connect.facebook.com*", "*analytics.tiktok.com*", "*hotjar.com*",
+    "*branch.io*", "*appsflyer.com*", "*criteo.com*", "*adservice.google.com*",
+]
+
+LEAN_ARGUMENTS = [
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-client-side-phishing-detection",
+    "--disable-features=Translate,MediaRouter,OptimizationHints",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+    "--blink-settings=imagesEnabled=false",
+]
+
+PROFILES = {
+    "full": LaunchProfile("full"),
+    "lean": LaunchProfile(
+        "lean",
+        arguments=LEAN_ARGUMENTS,
+        blocked_urls=HEAVY_RESOURCE_PATTERNS + THIRD_PARTY_PATTERNS
+        + [p for p in os.getenv("LEAN_EXTRA_BLOCKED_URLS", "").split(",") if p],
+    ),
+}
+
+
+def get_profile(name):
+    """
+    이름으로 실행 프로필을 찾는 함수.
+
+    Args:
+        name (str): 프로필 이름 ("full" 또는 "lean").
+
+    Returns:
+        LaunchProfile: 실행 프로필.
+
+    Raises:
+        ValueError: 알 수 없는 프로필 이름인 경우 발생.
+    """
+    if name not in PROFILES:
+        raise ValueError(f"알 수 없는 실행 프로필입니다: {name} (사용 가능: {', '.join(PROFILES)})")
+    return PROFILES[name]
+
+
+# 현재 문서의 로드 시간과 전송량을 수집하는 스크립트
+LOAD_METRICS_SCRIPT = """
+var nav = performance.getEntriesByType('navigation')[0] || {};
+var resources = performance.getEntriesByType('resource');
+var transferred = resources.reduce(function (sum, r) { return sum + (r.transferSize || 0); }, nav.transferSize || 0);
+return {
+    dom_content_loaded_ms: nav.domContentLoadedEventEnd || 0,
+    load_ms: nav.loadEventEnd || 0,
+    resource_count: resources.length,
+    transferred_bytes: transferred
+};
+"""
+
+
+def collect_load_metrics(driver):
+    """
+    현재 페이지의 로드 시간, 리소스 전송량, JS 힙/DOM 노드 수를 수집하는 함수.
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+
+    Returns:
+        dict: 페이지 로드 및 메모리 지표.
+    """
+    metrics = driver.execute_script(LOAD_METRICS_SCRIPT)
+    driver.execute_cdp_cmd("Performance.enable", {})
+    performance = {m["name"]: m["value"] for m in driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]}
+    metrics["js_heap_used_bytes"] = performance.get("JSHeapUsedSize", 0)
+    metrics["dom_nodes"] = performance.get("Nodes", 0)
+    return metrics
+
+
+def main(argv=None):
+    """
+    실행 프로필별 페이지 로드/메모리 지표 비교 진입점.
+
+    Example:
+        python -m core.launch_profiles --runs 5 --url https://weverse.io --url https://weverse.io/more
+    """
+    from core.driver import Driver
+
+    parser = argparse.ArgumentParser(description="Chrome 실행 프로필별 페이지 로드 시간과 메모리 사용량을 비교합니다.")
+    parser.add_argument("--profiles", default=",".join(PROFILES), help="비교할 프로필 (쉼표 구분)")
+    parser.add_argument("--url", action="append", help="측정할 URL (여러 번 지정 가능, 기본값 BASE_URL)")
+    parser.add_argument("--runs", type=int, default=3, help="프로필/URL별 반복 횟수")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    urls = args.url or [Driver.BASE_URL]
+    results = {}
+    for name in args.profiles.split(","):
+        for url in urls:
+            samples = []
+            for _ in range(args.runs):
+                # get_driver는 BASE_URL로 먼저 이동하므로(캐시가 채워진 재방문 측정), 이동 없이 세션만 생성한 뒤 첫 로드를 측정
+                driver = Driver.create_session(Driver.get_options(name))
+                try:
+                    get_profile(name).apply_session(driver)
+                    driver.get(url)
+                    samples.append(collect_load_metrics(driver))
+                finally:
+                    driver.quit()
+            results.setdefault(name, {})[url] = {
+                key: statistics.median(sample[key] for sample in samples) for key in samples[0]
+            }
+
+    for url in urls:
+        print(f"\n{url}")
+        print(f"{'profile':<8} {'DCL(ms)':>10} {'load(ms)':>10} {'resources':>10} {'transfer(KB)':>13} {'heap(MB)':>9} {'nodes':>7}")
+        for name, by_url in results.items():
+            m = by_url[url]
+            print(f"{name:<8} {m['dom_content_loaded_ms']:>10.0f} {m['load_ms']:>10.0f} {m['resource_count']:>10.0f} "
+                  f"{m['transferred_bytes'] / 1024:>13.1f} {m['js_heap_used_bytes'] / 1048576:>9.1f} {m['dom_nodes']:>7.0f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
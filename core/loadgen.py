@@ -0,0 +1,489 @@
+import os
+import sys
+import json
+import math
+import time
+import logging
+import argparse
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from core.timing import start_timeline, stop_timeline
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """
+    HDR 방식의 지연 시간 히스토그램
+
+    - 값(마이크로초)을 2의 거듭제곱 구간마다 SUB_BUCKETS개의 하위 구간으로 나누어 세므로,
+      1µs부터 수 시간까지의 값을 약 1% 상대 오차로 고정된 메모리에 기록.
+    - 같은 구간 체계를 쓰므로 여러 히스토그램(스레드, 실행)을 그대로 합칠 수 있음.
+    """
+
+    SUB_BUCKET_BITS = 7
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS  # 128
+    HALF = SUB_BUCKETS // 2
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = None
+        self.max_us = 0
+
+    @classmethod
+    def _index(cls, value_us):
+        if value_us < cls.SUB_BUCKETS:
+            return value_us
+        shift = value_us.bit_length() - cls.SUB_BUCKET_BITS
+        return cls.SUB_BUCKETS + (shift - 1) * cls.HALF + ((value_us >> shift) - cls.HALF)
+
+    @classmethod
+    def _highest_value(cls, index):
+        # 구간에 속하는 가장 큰 값 (HDR의 highest equivalent value)
+        if index < cls.SUB_BUCKETS:
+            return index
+        shift = (index - cls.SUB_BUCKETS) // cls.HALF + 1
+        mantissa = (index - cls.SUB_BUCKETS) % cls.HALF + cls.HALF
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, elapsed_ms):
+        """
+        지연 시간 하나를 기록.
+
+        Args:
+            elapsed_ms (float): 지연 시간 (밀리초).
+        """
+        value_us = max(int(elapsed_ms * 1000), 0)
+        index = self._index(value_us)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        self.min_us = value_us if self.min_us is None else min(self.min_us, value_us)
+        self.max_us = max(self.max_us, value_us)
+
+    def merge(self, other):
+        """
+        다른 히스토그램의 기록을 합침.
+        """
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        self.max_us = max(self.max_us, other.max_us)
+        return self
+
+    def percentile(self, percent):
+        """
+        백분위 지연 시간을 계산.
+
+        Args:
+            percent (float): 백분위 (0~100).
+
+        Returns:
+            float: 백분위 지연 시간 (밀리초). 기록이 없으면 0.
+        """
+        if self.count == 0:
+            return 0.0
+        target = max(math.ceil(self.count * percent / 100), 1)
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_value(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    def to_dict(self):
+        """
+        요약 통계와 구간별 개수를 JSON으로 저장 가능한 형태로 반환.
+        """
+        return {
+            "count": self.count,
+            "min_ms": (self.min_us or 0) / 1000,
+            "mean_ms": self.total_us / self.count / 1000 if self.count else 0.0,
+            "max_ms": self.max_us / 1000,
+            "percentiles_ms": {
+                f"p{p:g}": self.percentile(p) for p in (50, 75, 90, 95, 99, 99.9)
+            },
+            "buckets": {str(index): count for index, count in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls()
+        histogram.counts = {int(index): count for index, count in data.get("buckets", {}).items()}
+        histogram.count = data.get("count", 0)
+        histogram.total_us = int(data.get("mean_ms", 0) * 1000 * histogram.count)
+        histogram.min_us = int(data.get("min_ms", 0) * 1000) if histogram.count else None
+        histogram.max_us = int(data.get("max_ms", 0) * 1000)
+        return histogram
+
+
+class LoadRecorder:
+    """
+    가상 사용자의 플로우/단계 결과를 모으는 스레드 안전 기록기
+
+    - 플로우별 응답 시간(예정된 도착 시각부터 완료까지)과 처리 시간(실제 시작부터 완료까지) 히스토그램.
+    - 단계별(core.timing 단계 이름) 소요 시간 히스토그램과 오류 수.
+    - WINDOW초 단위의 시작/완료/오류 수 (시간에 따른 처리량과 오류율).
+    """
+
+    def __init__(self, window=10):
+        """
+        LoadRecorder 클래스의 생성자.
+
+        Args:
+            window (float, optional): 시간별 집계 구간 (초). 기본값 10초.
+        """
+        self.window = window
+        self.origin = time.monotonic()
+        self.flows = {}
+        self.steps = {}
+        self.step_errors = Counter()
+        self.errors = Counter()
+        self.windows = {}
+        self._lock = threading.Lock()
+
+    def _window(self, at):
+        index = max(int((at - self.origin) // self.window), 0)
+        return self.windows.setdefault(index, {"started": 0, "completed": 0, "errors": 0})
+
+    def started(self, at):
+        with self._lock:
+            self._window(at)["started"] += 1
+
+    def record(self, flow, intended_at, started_at, finished_at, timeline=None, error=None):
+        """
+        가상 사용자 한 명의 플로우 결과를 기록.
+
+        Args:
+            flow (str): 시나리오 이름.
+            intended_at (float): 예정된 도착 시각 (time.monotonic 기준).
+            started_at (float): 실제 시작 시각.
+            finished_at (float): 완료 시각.
+            timeline (StepTimeline, optional): 플로우의 단계 기록.
+            error (Exception, optional): 플로우가 실패한 경우의 예외.
+        """
+        with self._lock:
+            histograms = self.flows.setdefault(
+                flow, {"response": LatencyHistogram(), "service": LatencyHistogram(), "errors": 0})
+            # 부하기가 밀려 늦게 시작한 시간까지 포함해야 지연이 과소평가되지 않음 (coordinated omission 보정)
+            histograms["response"].record((finished_at - intended_at) * 1000)
+            histograms["service"].record((finished_at - started_at) * 1000)
+
+            for record in (timeline.steps if timeline else []):
+                if "wall_ms" not in record:
+                    continue
+                self.steps.setdefault(record["name"], LatencyHistogram()).record(record["wall_ms"])
+                if "error" in record:
+                    self.step_errors[record["name"]] += 1
+
+            window = self._window(finished_at)
+            window["completed"] += 1
+            if error is not None:
+                histograms["errors"] += 1
+                window["errors"] += 1
+                message = (str(error).splitlines() or [""])[0][:200]
+                self.errors[f"{type(error).__name__}: {message}"] += 1
+
+    def summary(self):
+        """
+        기록한 결과를 JSON으로 저장 가능한 형태로 반환.
+        """
+        with self._lock:
+            elapsed = max(time.monotonic() - self.origin, 1e-9)
+            return {
+                "duration_seconds": elapsed,
+                "window_seconds": self.window,
+                "flows": {
+                    name: {
+                        "completed": h["response"].count,
+                        "errors": h["errors"],
+                        "error_rate": h["errors"] / h["response"].count if h["response"].count else 0.0,
+                        "throughput_per_second": h["response"].count / elapsed,
+                        "response": h["response"].to_dict(),
+                        "service": h["service"].to_dict(),
+                    }
+                    for name, h in self.flows.items()
+                },
+                "steps": {
+                    name: dict(histogram.to_dict(), errors=self.step_errors.get(name, 0))
+                    for name, histogram in sorted(self.steps.items())
+                },
+                "timeline": [
+                    dict(window, start_seconds=index * self.window,
+                         throughput_per_second=window["completed"] / self.window,
+                         error_rate=window["errors"] / window["completed"] if window["completed"] else 0.0)
+                    for index, window in sorted(self.windows.items())
+                ],
+                "errors": dict(self.errors.most_common()),
+            }
+
+
+def arrival_times(rate, duration, ramp_up=0):
+    """
+    도착률이 0에서 rate까지 ramp_up초 동안 선형으로 증가한 뒤 유지되는 도착 시각(초)을 차례로 생성하는 함수.
+
+    Args:
+        rate (float): 목표 도착률 (초당 사용자 수).
+        duration (float): 전체 실행 시간 (초, ramp_up 포함).
+        ramp_up (float, optional): 목표 도착률까지 증가하는 시간 (초). 기본값 0.
+
+    Yields:
+        float: 실행 시작 기준 도착 시각 (초).
+    """
+    if rate <= 0:
+        return
+    ramp_arrivals = rate * ramp_up / 2  # 증가 구간의 누적 도착 수
+    arrival = 0
+    while True:
+        if arrival < ramp_arrivals:
+            at = math.sqrt(2 * arrival * ramp_up / rate)
+        else:
+            at = ramp_up + (arrival - ramp_arrivals) / rate
+        if at >= duration:
+            return
+        yield at
+        arrival += 1
+
+
+def login_profile(driver, user):
+    """
+    TestLoginProfile의 단계(UI 로그인 → 프로필 버튼 → 프로필 페이지 → wid 추출)를 실행하는 시나리오.
+    """
+    from pages.flows import login_via_ui
+    from pages.home_page import HomePage
+    from pages.profile_page import ProfilePage
+
+    login_via_ui(driver, user["email"], user["password"])
+    HomePage(driver).click_profile_button()
+    profile_page = ProfilePage(driver)
+    profile_page.verify_profile_page()
+    if profile_page.extract_wid() is None:
+        raise Exception("wid 값을 추출하지 못했습니다.")
+
+
+def user_signup(driver, user):
+    """
+    TestUserSignUp의 단계(홈 → 이메일 → 가입하기 → 비밀번호 → 닉네임 → 약관 동의 → 인증 안내 화면)를 실행하는 시나리오.
+    """
+    from core.utils import generate_random_email
+    from core.assertions import PageAssert
+    from pages.home_page import HomePage
+    from pages.signup.signup_page import SignUpPage
+    from pages.signup.password_page import PasswordPage
+    from pages.signup.nickname_page import NicknamePage
+    from pages.signup.agreement_page import AgreementPage
+
+    email = generate_random_email()
+    HomePage(driver).click_sign_in()
+
+    signup_page = SignUpPage(driver)
+    signup_page.enter_email(email)
+    signup_page.click_continue()
+    signup_page.click_signup()
+
+    password_page = PasswordPage(driver)
+    password_page.enter_password(user["password"])
+    password_page.click_next()
+
+    nickname_page = NicknamePage(driver)
+    nickname_page.enter_nickname(user.get("nickname", "아보카도"))
+    nickname_page.click_next()
+
+    agreement_page = AgreementPage(driver)
+    agreement_page.click_agree_all()
+    agreement_page.click_next()
+
+    PageAssert(driver).shows_text("이제 이메일을 인증해주세요!", message=f"이메일 인증 안내 화면에 도달하지 못했습니다: {email}")
+
+
+# --scenario 옵션으로 선택하는 부하 시나리오
+SCENARIOS = {"login_profile": login_profile, "user_signup": user_signup}
+
+
+class LoadGenerator:
+    """
+    기존 플로우를 동시에 실행하는 가상 사용자로 부하를 생성하는 부하 발생기 (개방형 도착 모델)
+
+    - 가상 사용자는 arrival_times의 예정 시각에 도착하며, 앞선 사용자의 완료를 기다리지 않음.
+    - 동시에 실행 중인 사용자는 MAX_USERS로 제한하고, 초과한 도착은 대기열에서 기다린 시간까지 응답 시간에 포함.
+    - 각 사용자는 DriverPool에서 브라우저 세션을 대여하고, 페이지 객체 메서드 단계는 core.timing으로 기록.
+    """
+
+    RATE = float(os.getenv("LOADGEN_RATE", "0.5"))  # 초당 도착 사용자 수
+    RAMP_UP = float(os.getenv("LOADGEN_RAMP_UP", "30"))  # 목표 도착률까지 증가하는 시간 (초)
+    DURATION = float(os.getenv("LOADGEN_DURATION", "120"))  # 전체 실행 시간 (초)
+    MAX_USERS = int(os.getenv("LOADGEN_MAX_USERS", "8"))  # 동시에 실행할 최대 가상 사용자 수
+    WINDOW = float(os.getenv("LOADGEN_WINDOW", "10"))  # 시간별 집계 구간 (초)
+
+    def __init__(self, scenario, users, rate=None, duration=None, ramp_up=None, max_users=None,
+                 window=None, driver_pool=None):
+        """
+        LoadGenerator 클래스의 생성자.
+
+        Args:
+            scenario (str): 시나리오 이름 (SCENARIOS 중 하나).
+            users (list): 가상 사용자에게 순서대로 나눠 줄 계정 dict 목록 ({"email", "password"}).
+            rate (float, optional): 초당 도착 사용자 수. 기본값은 LOADGEN_RATE 환경 변수.
+            duration (float, optional): 전체 실행 시간 (초). 기본값은 LOADGEN_DURATION 환경 변수.
+            ramp_up (float, optional): 증가 시간 (초). 기본값은 LOADGEN_RAMP_UP 환경 변수.
+            max_users (int, optional): 최대 동시 사용자 수. 기본값은 LOADGEN_MAX_USERS 환경 변수.
+            window (float, optional): 집계 구간 (초). 기본값은 LOADGEN_WINDOW 환경 변수.
+            driver_pool (DriverPool, optional): 브라우저 세션 풀. 기본값은 max_users 크기의 새 DriverPool.
+        """
+        from core.driver_pool import DriverPool
+
+        if scenario not in SCENARIOS:
+            raise ValueError(f"알 수 없는 시나리오입니다: {scenario} (사용 가능: {', '.join(SCENARIOS)})")
+        self.scenario = scenario
+        self.users = users
+        self.rate = rate if rate is not None else LoadGenerator.RATE
+        self.duration = duration if duration is not None else LoadGenerator.DURATION
+        self.ramp_up = ramp_up if ramp_up is not None else LoadGenerator.RAMP_UP
+        self.max_users = max_users or LoadGenerator.MAX_USERS
+        self.recorder = LoadRecorder(window or LoadGenerator.WINDOW)
+        self.driver_pool = driver_pool or DriverPool(size=self.max_users)
+
+    def run(self):
+        """
+        도착 일정에 따라 가상 사용자를 실행하고 모든 사용자가 끝날 때까지 대기.
+
+        Returns:
+            dict: LoadRecorder.summary() 결과.
+        """
+        self.recorder.origin = time.monotonic()
+        flow = SCENARIOS[self.scenario]
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_users, thread_name_prefix="loadgen-user") as executor:
+                for index, offset in enumerate(arrival_times(self.rate, self.duration, self.ramp_up)):
+                    intended_at = self.recorder.origin + offset
+                    delay = intended_at - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    user = self.users[index % len(self.users)]
+                    executor.submit(self._run_user, flow, index, user, intended_at)
+        finally:
+            self.driver_pool.close()
+        return self.recorder.summary()
+
+    def _run_user(self, flow, index, user, intended_at):
+        started_at = time.monotonic()
+        self.recorder.started(started_at)
+        timeline = start_timeline(f"{self.scenario}#{index}")
+        driver = None
+        error = None
+        try:
+            driver = self.driver_pool.acquire()
+            flow(driver, user)
+        except Exception as e:
+            error = e
+            logger.info(f"가상 사용자 {index} 실패: {type(e).__name__}: {str(e)}")
+        finally:
+            stop_timeline()
+            self.recorder.record(self.scenario, intended_at, started_at, time.monotonic(), timeline, error)
+            if driver is not None:
+                self.driver_pool.release(driver)
+
+
+def format_summary(summary):
+    """
+    부하 결과를 사람이 읽을 수 있는 표 형식 문자열로 변환하는 함수.
+    """
+    lines = []
+    for name, flow in summary["flows"].items():
+        percentiles = flow["response"]["percentiles_ms"]
+        lines.append(
+            f"[{name}] completed={flow['completed']} errors={flow['errors']} ({flow['error_rate']:.1%}) "
+            f"throughput={flow['throughput_per_second']:.2f}/s "
+            f"p50={percentiles['p50']:.0f}ms p95={percentiles['p95']:.0f}ms p99={percentiles['p99']:.0f}ms"
+        )
+
+    lines.append("")
+    lines.append(f"{'step':<45} {'count':>6} {'err':>4} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}")
+    for name, histogram in summary["steps"].items():
+        percentiles = histogram["percentiles_ms"]
+        lines.append(
+            f"{name:<45} {histogram['count']:>6} {histogram['errors']:>4} {percentiles['p50']:>9.0f} "
+            f"{percentiles['p95']:>9.0f} {percentiles['p99']:>9.0f} {histogram['max_ms']:>9.0f}"
+        )
+
+    lines.append("")
+    lines.append(f"{'window':>10} {'started':>8} {'done':>6} {'errors':>7} {'rps':>7}")
+    for window in summary["timeline"]:
+        lines.append(
+            f"{window['start_seconds']:>9.0f}s {window['started']:>8} {window['completed']:>6} "
+            f"{window['errors']:>7} {window['throughput_per_second']:>7.2f}"
+        )
+
+    if summary["errors"]:
+        lines.append("")
+        lines.extend(f"{count:>5} x {error}" for error, count in summary["errors"].items())
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """
+    부하 발생 실행 진입점.
+
+    Example:
+        python -m core.loadgen --scenario login_profile --standin --rate 2 --ramp-up 10 --duration 60 --max-users 8
+        BASE_URL=https://staging.example.com python -m core.loadgen --scenario user_signup --rate 0.2
+    """
+    from core import utils
+    from core.driver import Driver
+
+    parser = argparse.ArgumentParser(description="회원가입/로그인 플로우를 동시 가상 사용자로 실행하여 부하를 측정합니다.")
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS), default="login_profile")
+    parser.add_argument("--rate", type=float, help="목표 도착률 (초당 사용자 수)")
+    parser.add_argument("--ramp-up", type=float, help="목표 도착률까지 증가하는 시간 (초)")
+    parser.add_argument("--duration", type=float, help="전체 실행 시간 (초)")
+    parser.add_argument("--max-users", type=int, help="동시에 실행할 최대 가상 사용자 수")
+    parser.add_argument("--window", type=float, help="시간별 집계 구간 (초)")
+    parser.add_argument("--standin", action="store_true", help="로컬 대역 서버를 띄워 대상으로 사용")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    server = None
+    if args.standin:
+        from standin.weverse_server import WeverseStandInServer
+
+        # 로그인 시나리오의 가상 사용자마다 다른 계정을 사용하도록 미리 등록
+        users = [{"email": f"load-{index}@benx.com", "password": "standin-password"} for index in range(50)]
+        server = WeverseStandInServer(users={user["email"]: user["password"] for user in users})
+        server.serve_in_background()
+        Driver.BASE_URL = Driver.API_HOST = server.url
+        utils.WAIT_SCALE = 0
+    else:
+        email = os.getenv("TEST_EMAIL")
+        password = os.getenv("TEST_USER_PASSWORD") or os.getenv("USER_PASSWORD")
+        if not password or (args.scenario == "login_profile" and not email):
+            print("TEST_EMAIL/TEST_USER_PASSWORD 환경 변수를 설정하거나 --standin 옵션을 사용해주세요.")
+            return 1
+        users = [{"email": email, "password": password}]
+
+    generator = LoadGenerator(args.scenario, users, rate=args.rate, duration=args.duration, ramp_up=args.ramp_up,
+                              max_users=args.max_users, window=args.window)
+    print(f"Load: scenario={args.scenario} rate={generator.rate}/s ramp_up={generator.ramp_up}s "
+          f"duration={generator.duration}s max_users={generator.max_users} target={Driver.BASE_URL}")
+    try:
+        summary = generator.run()
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    print(format_summary(summary))
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
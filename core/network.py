@@ -0,0 +1,370 @@
+import os
+import re
+import json
+import time
+import base64
+import threading
+from datetime import datetime, timezone
+from collections import OrderedDict
+
+from selenium.common.exceptions import TimeoutException
+
+from core.cdp import CdpConnection, CdpError
+from core.timing import waiting
+
+
+class NetworkResponse:
+    """
+    CDP Network 이벤트로 수집한 하나의 요청/응답
+    """
+
+    def __init__(self, request_id, url, method):
+        self.request_id = request_id
+        self.url = url
+        self.method = method
+        self.request_headers = {}
+        self.post_data = None
+        self.started_at = None  # 요청 시작 시각 (epoch 초)
+        self.started_ts = None  # 요청 시작 시점의 CDP monotonic timestamp
+        self.finished_ts = None
+        self.status = None
+        self.status_text = ""
+        self.protocol = None
+        self.headers = {}
+        self.mime_type = None
+        self.timing = None
+        self.encoded_length = 0
+        self.finished = False
+        self.failed = False
+        self._body = None
+        self._fetch_body = None
+
+    @property
+    def body(self):
+        """
+        응답 본문. 처음 접근할 때 Network.getResponseBody로 가져옴.
+
+        Returns:
+            str: 응답 본문 문자열.
+        """
+        if self._body is None and self._fetch_body:
+            self._body = self._fetch_body(self.request_id)
+        return self._body
+
+
+class NetworkMonitor:
+    """
+    드라이버의 현재 탭에서 발생하는 네트워크 요청/응답을 CDP 이벤트로 구독
+
+    - 성능 로그를 수집/파싱하지 않고, 응답이 도착하는 즉시 대기 중인 호출을 깨움.
+    - URL/메서드 필터와 일치하는 요청만 기록하며, 최근 요청은 max_entries 개까지만 보관 (링 버퍼).
+    - 응답 본문은 body 속성에 처음 접근할 때만 가져옴.
+    """
+
+    def __init__(self, driver, max_entries=500, url_patterns=None, methods=None):
+        """
+        NetworkMonitor 클래스의 생성자.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+            max_entries (int, optional): 보관할 최대 요청 수. 기본값 500.
+            url_patterns (list, optional): 기록할 URL 정규식 목록. 없으면 모든 URL을 기록.
+            methods (list, optional): 기록할 요청 메서드 목록 (예: ["GET", "POST"]). 없으면 모든 메서드를 기록.
+        """
+        self.connection = CdpConnection.for_driver(driver)
+        self.session_id = self.connection.attach(driver.current_window_handle)
+        self.max_entries = max_entries
+        self.url_patterns = [re.compile(p) if isinstance(p, str) else p for p in (url_patterns or [])]
+        self.methods = {m.upper() for m in (methods or [])}
+        self._entries = OrderedDict()
+        self._condition = threading.Condition()
+        self._detached = False
+
+        for method, callback in self._handlers():
+            self.connection.on(method, callback, self.session_id)
+        self.connection.send("Network.enable", {}, self.session_id)
+
+    @classmethod
+    def for_driver(cls, driver):
+        """
+        드라이버에 연결된 NetworkMonitor를 반환. 없으면 새로 만들어 드라이버에 캐시.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+
+        Returns:
+            NetworkMonitor: 네트워크 모니터.
+        """
+        monitor = getattr(driver, "_network_monitor", None)
+        if monitor is None or monitor.connection._closed:
+            monitor = cls(driver)
+            driver._network_monitor = monitor
+        return monitor
+
+    def wait_for_response(self, url_pattern, timeout=10, method=None, predicate=None):
+        """
+        URL 패턴과 일치하는 첫 번째 응답이 완료될 때까지 대기 (이미 수신한 응답 포함).
+
+        Args:
+            url_pattern (str or re.Pattern): URL에 포함될 문자열 또는 정규식.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값 10초.
+            method (str, optional): 요청 메서드 (예: "GET"). 지정하면 해당 메서드만 일치.
+            predicate (callable, optional): 응답(NetworkResponse)을 받아 사용할지 판단하는 함수.
+                False를 반환한 응답은 건너뛰고 다음 응답을 기다림.
+
+        Returns:
+            NetworkResponse: 일치하는 응답. 본문은 body 속성으로 접근.
+
+        Raises:
+            TimeoutException: 시간 내에 일치하는 응답이 없는 경우 발생.
+        """
+        deadline = time.monotonic() + timeout
+        rejected = set()
+        with waiting():
+            while True:
+                with self._condition:
+                    candidates = [
+                        entry for entry in self._entries.values()
+                        if entry.finished and entry.request_id not in rejected
+                        and self._matches(entry, url_pattern, method)
+                    ]
+                    if not candidates:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise TimeoutException(f"{url_pattern} 응답을 {timeout}초 안에 받지 못했습니다.")
+                        self._condition.wait(remaining)
+                        continue
+
+                # predicate는 본문 조회(CDP 호출)를 할 수 있으므로 이벤트 처리를 막지 않도록 잠금 밖에서 평가
+                for entry in candidates:
+                    if predicate is None or predicate(entry):
+                        return entry
+                    rejected.add(entry.request_id)
+
+    def clear(self):
+        """
+        수집한 요청 기록을 비움.
+        """
+        with self._condition:
+            self._entries.clear()
+
+    def close(self):
+        """
+        이벤트 구독을 해제하고 탭 세션에서 분리.
+        """
+        for method, callback in self._handlers():
+            self.connection.off(method, callback, self.session_id)
+        if not self.connection._closed:
+            try:
+                self.connection.send("Target.detachFromTarget", {"sessionId": self.session_id})
+            except CdpError:
+                pass
+        self._detached = True
+        self.clear()
+
+    def _handlers(self):
+        return [
+            ("Network.requestWillBeSent", self._on_request),
+            ("Network.responseReceived", self._on_response),
+            ("Network.loadingFinished", self._on_finished),
+            ("Network.loadingFailed", self._on_failed),
+        ]
+
+    @staticmethod
+    def _matches(entry, url_pattern, method):
+        if method and entry.method != method:
+            return False
+        if isinstance(url_pattern, re.Pattern):
+            return bool(url_pattern.search(entry.url))
+        return url_pattern in entry.url
+
+    def _get_body(self, request_id, timeout=10):
+        try:
+            result = self.connection.send(
+                "Network.getResponseBody", {"requestId": request_id}, self.session_id, timeout=timeout)
+        except CdpError:
+            # 리다이렉트/캐시 등으로 본문이 없는 경우
+            return None
+        if result.get("base64Encoded"):
+            return base64.b64decode(result["body"]).decode("utf-8", errors="replace")
+        return result.get("body")
+
+    def _should_record(self, url, method):
+        if self.methods and method.upper() not in self.methods:
+            return False
+        if self.url_patterns and not any(p.search(url) for p in self.url_patterns):
+            return False
+        return True
+
+    def _on_request(self, params):
+        request = params["request"]
+        if not self._should_record(request["url"], request["method"]):
+            return
+
+        entry = NetworkResponse(params["requestId"], request["url"], request["method"])
+        entry.request_headers = request.get("headers", {})
+        entry.post_data = request.get("postData")
+        entry.started_at = params.get("wallTime")
+        entry.started_ts = params.get("timestamp")
+        entry._fetch_body = self._get_body
+        with self._condition:
+            self._entries[entry.request_id] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _on_response(self, params):
+        with self._condition:
+            entry = self._entries.get(params["requestId"])
+            if entry:
+                response = params["response"]
+                entry.url = response["url"]
+                entry.status = response.get("status")
+                entry.status_text = response.get("statusText", "")
+                entry.protocol = response.get("protocol")
+                entry.headers = response.get("headers", {})
+                entry.mime_type = response.get("mimeType")
+                entry.timing = response.get("timing")
+
+    def _on_finished(self, params):
+        with self._condition:
+            entry = self._entries.get(params["requestId"])
+            if entry and entry.status is not None:
+                entry.finished = True
+                entry.finished_ts = params.get("timestamp")
+                entry.encoded_length = params.get("encodedDataLength", 0)
+                self._condition.notify_all()
+
+    def _on_failed(self, params):
+        with self._condition:
+            entry = self._entries.get(params["requestId"])
+            if entry:
+                entry.failed = True
+
+
+class NetworkRecorder(NetworkMonitor):
+    """
+    필터와 일치하는 트래픽을 링 버퍼에 기록하고, 필요할 때만 HAR 파일로 내보내는 네트워크 레코더
+
+    - 기본 세션은 크롬 상세 로깅/성능 로그 없이 실행되며, 캡처를 요청한 세션에만 레코더를 연결.
+    - HAR 내보내기(본문 포함)는 테스트가 실패한 경우에만 수행.
+    - 본문 조회는 전체 시간 예산(BODY_BUDGET) 안에서만 하며, 예산을 넘기거나 탭에서 분리된 뒤에는 본문을 생략.
+    """
+
+    ENABLED = os.getenv("NETWORK_CAPTURE", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+    URL_PATTERNS = [p for p in os.getenv("NETWORK_CAPTURE_URLS", "").split(",") if p]
+    METHODS = [m for m in os.getenv("NETWORK_CAPTURE_METHODS", "").split(",") if m]
+    MAX_ENTRIES = int(os.getenv("NETWORK_CAPTURE_MAX_ENTRIES", "300"))
+    BODY_BUDGET = float(os.getenv("NETWORK_CAPTURE_BODY_BUDGET", "10"))  # HAR 하나의 본문 조회에 쓰는 최대 시간 (초)
+
+    def snapshot(self):
+        """
+        현재까지 기록된 요청 목록을 반환 (이후 버퍼가 비워지거나 교체되어도 유지됨).
+
+        Returns:
+            list: NetworkResponse 목록.
+        """
+        with self._condition:
+            return list(self._entries.values())
+
+    def to_har(self, include_bodies=True, entries=None):
+        """
+        기록된 요청을 HAR 1.2 형식으로 변환.
+
+        Args:
+            include_bodies (bool, optional): 응답 본문 포함 여부. 기본값 True.
+            entries (list, optional): 변환할 요청 목록 (snapshot() 결과). 없으면 현재 기록된 요청.
+
+        Returns:
+            dict: HAR 데이터.
+        """
+        if entries is None:
+            entries = self.snapshot()
+        deadline = time.monotonic() + self.BODY_BUDGET
+        return {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "weverse-test", "version": "1.0"},
+                "entries": [self._har_entry(entry, include_bodies, deadline) for entry in entries],
+            }
+        }
+
+    def save_har(self, path, include_bodies=True):
+        """
+        기록된 요청을 HAR 파일로 저장.
+
+        Args:
+            path (str): 저장할 파일 경로.
+            include_bodies (bool, optional): 응답 본문 포함 여부. 기본값 True.
+
+        Returns:
+            str: 저장한 파일 경로.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_har(include_bodies), f, ensure_ascii=False)
+        return path
+
+    @staticmethod
+    def _har_headers(headers):
+        return [{"name": name, "value": str(value)} for name, value in headers.items()]
+
+    def _har_body(self, entry, deadline):
+        # 이미 가져온 본문은 그대로 쓰고, 탭에서 분리되었거나 예산을 다 쓴 경우에는 조회하지 않음
+        if entry._body is not None:
+            return entry._body
+        remaining = deadline - time.monotonic()
+        if self._detached or self.connection._closed or remaining <= 0:
+            return None
+        entry._body = self._get_body(entry.request_id, timeout=min(remaining, 10))
+        return entry._body
+
+    def _har_entry(self, entry, include_bodies, deadline):
+        # HAR 1.2의 time/send/wait/receive는 음수를 허용하지 않으므로 완료되지 않은 요청은 0으로 기록
+        total_ms = 0
+        if entry.started_ts is not None and entry.finished_ts is not None:
+            total_ms = max((entry.finished_ts - entry.started_ts) * 1000, 0)
+
+        timings = {"send": 0, "wait": 0, "receive": 0}
+        if entry.timing:
+            timings["send"] = max(entry.timing["sendEnd"] - entry.timing["sendStart"], 0)
+            timings["wait"] = max(entry.timing["receiveHeadersEnd"] - entry.timing["sendEnd"], 0)
+            timings["receive"] = max(total_ms - entry.timing["receiveHeadersEnd"], 0)
+
+        started = datetime.fromtimestamp(entry.started_at or 0, tz=timezone.utc)
+        content = {"size": entry.encoded_length, "mimeType": entry.mime_type or ""}
+        if include_bodies and entry.finished and not entry.failed:
+            body = self._har_body(entry, deadline)
+            if body is not None:
+                content["text"] = body
+
+        request = {
+            "method": entry.method,
+            "url": entry.url,
+            "httpVersion": entry.protocol or "",
+            "headers": self._har_headers(entry.request_headers),
+            "queryString": [],
+            "cookies": [],
+            "headersSize": -1,
+            "bodySize": len(entry.post_data or ""),
+        }
+        if entry.post_data:
+            request["postData"] = {"mimeType": entry.request_headers.get("Content-Type", ""), "text": entry.post_data}
+
+        return {
+            "startedDateTime": started.isoformat(),
+            "time": total_ms,
+            "request": request,
+            "response": {
+                "status": entry.status or 0,
+                "statusText": entry.status_text,
+                "httpVersion": entry.protocol or "",
+                "headers": self._har_headers(entry.headers),
+                "cookies": [],
+                "content": content,
+                "redirectURL": entry.headers.get("Location", ""),
+                "headersSize": -1,
+                "bodySize": entry.encoded_length,
+            },
+            "cache": {},
+            "timings": timings,
+        }
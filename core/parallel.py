@@ -0,0 +1,268 @@
+import os
+import sys
+import time
+import shlex
+import signal
+import argparse
+import subprocess
+
+import pytest
+
+from core.durations import DurationHistory, lpt_schedule
+
+
+class _CollectPlugin:
+    """
+    pytest 수집 단계에서 테스트 노드 ID를 모으는 플러그인
+    """
+
+    def __init__(self):
+        self.items = []
+        self.paths = []
+
+    def pytest_collection_finish(self, session):
+        self.items = list(session.items)
+        # 명령줄의 위치 인자(경로, 노드 ID). 워커에는 이 대신 분배된 노드 ID를 전달
+        self.paths = list(session.config.option.file_or_dir or [])
+
+
+class ParallelRunner:
+    """
+    수집된 테스트를 여러 워커 프로세스에 나누어 병렬로 실행
+
+    - 각 워커는 독립된 pytest 프로세스이며, 자신의 Driver(Chrome 세션)를 소유.
+    - 워커마다 TEST_WORKER_ID, 스크린샷 디렉토리, 로그 파일, JUnit XML을 분리하여 결과 파일이 겹치지 않도록 함.
+    - 수집에 사용한 pytest 옵션(--standin, -p, -o 등)은 위치 인자(경로)를 제외하고 워커에도 그대로 전달.
+    - 기본적으로 실행 기록(core.durations)의 예상 시간으로 긴 테스트부터 부하가 작은 워커에 배정 (LPT).
+    """
+
+    REPORT_DIR = os.getenv("REPORT_DIR", "reports")
+    SCHEDULE = os.getenv("PARALLEL_SCHEDULE", "lpt")  # 테스트 분배 방식 ("lpt", "roundrobin")
+    STOP_TIMEOUT = 30  # 중단 시 워커가 정리(fixture teardown)를 마칠 때까지 기다릴 시간 (초)
+
+    def __init__(self, workers=None, pytest_args=None, worker_args=None, schedule=None):
+        """
+        ParallelRunner 클래스의 생성자.
+
+        Args:
+            workers (int, optional): 워커 프로세스 수. 기본값은 CPU 코어 수.
+            pytest_args (list, optional): 테스트 수집에 사용할 pytest 인자 (경로, -k, -m 등). 경로 외의 옵션은 워커에도 전달.
+            worker_args (list, optional): 각 워커 pytest 프로세스에 추가로 전달할 인자.
+            schedule (str, optional): 테스트 분배 방식 ("lpt", "roundrobin"). 기본값은 PARALLEL_SCHEDULE 환경 변수.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.pytest_args = pytest_args or []
+        self.worker_args = worker_args or []
+        self.schedule = schedule or ParallelRunner.SCHEDULE
+        self.worker_dir = os.path.join(self.REPORT_DIR, "workers")
+        self.option_args = list(self.pytest_args)
+        self.worker_count = 0
+
+    def collect(self):
+        """
+        현재 프로세스에서 테스트를 수집.
+
+        - 수집만 하므로 conftest는 대역 서버, 그리드 노드, 계정 생산자 등을 시작하지 않음 (collectonly 확인).
+
+        Returns:
+            list: 수집된 pytest Item 목록.
+
+        Raises:
+            Exception: 테스트 수집에 실패한 경우 예외 발생.
+        """
+        plugin = _CollectPlugin()
+        exit_code = pytest.main(["--collect-only", "-q", *self.pytest_args], plugins=[plugin])
+        if exit_code not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED):
+            raise Exception(f"테스트 수집 중 오류가 발생했습니다 (exit code: {exit_code})")
+        self.option_args = self._without_paths(self.pytest_args, plugin.paths)
+        return plugin.items
+
+    @staticmethod
+    def _without_paths(args, paths):
+        """
+        pytest 인자에서 위치 인자(경로, 노드 ID)를 제거하고 옵션만 남김 (pytest가 해석한 순서대로 하나씩 제거).
+        """
+        remaining = list(paths)
+        options = []
+        for arg in args:
+            if remaining and arg == remaining[0]:
+                remaining.pop(0)
+                continue
+            options.append(arg)
+        return options
+
+    def shard(self, items):
+        """
+        수집된 테스트를 워커 수만큼 분배.
+
+        - "lpt": 예상 시간이 긴 테스트부터 예상 부하가 가장 작은 워커에 배정.
+        - "roundrobin": 수집 순서대로 번갈아 배정.
+
+        Args:
+            items (list): 수집된 pytest Item 목록.
+
+        Returns:
+            list: 워커별 노드 ID 목록의 리스트 (비어 있는 샤드는 제외).
+        """
+        if self.schedule == "lpt":
+            estimates = DurationHistory().estimate(items, self._target())
+            schedule = lpt_schedule({nodeid: seconds for nodeid, (seconds, _) in estimates.items()}, self.workers)
+            self._print_schedule(estimates, schedule)
+            return [nodeids for _, nodeids in schedule]
+
+        shards = [[] for _ in range(self.workers)]
+        for index, item in enumerate(items):
+            shards[index % self.workers].append(item.nodeid)
+        return [shard for shard in shards if shard]
+
+    def _target(self):
+        # conftest와 같은 기준으로 실행 대상을 구분 (대역 서버 실행 기록과 실제 환경 기록을 섞지 않음)
+        from core.driver import Driver
+
+        standin = os.getenv("STANDIN", "False").lower() in ("true", "1", "yes")
+        if standin or "--standin" in self.pytest_args or "--standin" in self.worker_args:
+            return "standin"
+        return Driver.BASE_URL
+
+    def _print_schedule(self, estimates, schedule):
+        """
+        워커별 예상 부하와 이론상 최소 실행 시간(가장 긴 테스트와 평균 부하 중 큰 값)을 출력.
+        """
+        seconds = [estimate for estimate, _ in estimates.values()]
+        if not seconds:
+            return
+        lower_bound = max(max(seconds), sum(seconds) / self.workers)
+        for index, (load, nodeids) in enumerate(schedule):
+            print(f"[gw{index}] 예상 {load:.0f}s: {len(nodeids)}개 테스트")
+        sources = {}
+        for _, source in estimates.values():
+            sources[source] = sources.get(source, 0) + 1
+        print(f"예상 실행 시간 {max(load for load, _ in schedule):.0f}s (최소 {lower_bound:.0f}s), "
+              f"예상 근거: {', '.join(f'{source} {count}개' for source, count in sorted(sources.items()))}")
+
+    def run(self):
+        """
+        테스트를 수집, 분배한 뒤 워커 프로세스를 실행하고 모두 끝날 때까지 대기.
+
+        Returns:
+            int: 모든 워커가 성공하면 0. 실패한 테스트가 있으면 1, 그 외 오류(중단, 내부 오류 등)는 가장 큰 종료 코드.
+        """
+        items = self.collect()
+        shards = self.shard(items)
+        if not shards:
+            print("실행할 테스트가 없습니다.")
+            return int(pytest.ExitCode.NO_TESTS_COLLECTED)
+
+        os.makedirs(self.worker_dir, exist_ok=True)
+        print(f"{len(items)}개 테스트를 {len(shards)}개 워커에서 실행합니다.")
+
+        started = time.time()
+        self.worker_count = len(shards)
+        processes = []
+        try:
+            for index, nodeids in enumerate(shards):
+                processes.append(self._spawn(f"gw{index}", nodeids))
+
+            exit_codes = []
+            for worker_id, process, log_file in processes:
+                exit_codes.append(process.wait())
+                print(f"[{worker_id}] exit code {process.returncode} (log: {log_file.name})")
+        except BaseException:
+            # 중단(Ctrl+C)이나 오류 시 워커와 브라우저가 남지 않도록 모든 워커를 종료
+            self._stop(processes)
+            raise
+        finally:
+            for _, _, log_file in processes:
+                log_file.close()
+
+        print(f"전체 실행 시간: {time.time() - started:.1f}s")
+        return self._exit_code(exit_codes)
+
+    def _stop(self, processes):
+        """
+        실행 중인 워커를 종료. fixture teardown(드라이버 quit)이 실행되도록 먼저 SIGINT를 보내고, 시간 내에 끝나지 않으면 강제 종료.
+        """
+        running = [process for _, process, _ in processes if process.poll() is None]
+        for process in running:
+            if os.name == "nt":
+                process.terminate()
+            else:
+                process.send_signal(signal.SIGINT)
+
+        deadline = time.monotonic() + self.STOP_TIMEOUT
+        for process in running:
+            try:
+                process.wait(max(deadline - time.monotonic(), 0))
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+    @staticmethod
+    def _exit_code(exit_codes):
+        # 테스트가 없는 워커(5)가 다른 워커의 실패(1)를 가리지 않도록 실패를 우선
+        errors = [code for code in exit_codes if code not in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED)]
+        if pytest.ExitCode.TESTS_FAILED in errors:
+            return int(pytest.ExitCode.TESTS_FAILED)
+        if errors:
+            return max(errors)
+        if pytest.ExitCode.OK in exit_codes:
+            return int(pytest.ExitCode.OK)
+        return int(pytest.ExitCode.NO_TESTS_COLLECTED)
+
+    def _spawn(self, worker_id, nodeids):
+        """
+        워커 pytest 프로세스를 실행.
+
+        Args:
+            worker_id (str): 워커 ID (예: "gw0").
+            nodeids (list): 워커가 실행할 테스트 노드 ID 목록.
+
+        Returns:
+            tuple: (워커 ID, Popen 객체, 로그 파일 객체)
+        """
+        env = dict(os.environ)
+        env["TEST_WORKER_ID"] = worker_id
+        env["TEST_WORKER_COUNT"] = str(self.worker_count)
+        # 다음 실행의 LPT 스케줄링에 쓰도록 워커의 실행 시간을 기록 (환경 변수로 명시한 경우는 그대로 따름)
+        env.setdefault("DURATION_HISTORY", "true")
+
+        log_file = open(os.path.join(self.worker_dir, f"{worker_id}.log"), "w")
+        command = [
+            sys.executable, "-m", "pytest",
+            f"--junitxml={os.path.join(self.worker_dir, worker_id + '.xml')}",
+            *self.option_args,
+            *self.worker_args,
+            *nodeids,
+        ]
+        process = subprocess.Popen(command, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+        return worker_id, process, log_file
+
+
+def main(argv=None):
+    """
+    병렬 실행 진입점.
+
+    Example:
+        python -m core.parallel -n 4 -- tests/ -k signup
+    """
+    parser = argparse.ArgumentParser(description="테스트를 여러 워커 프로세스에서 병렬로 실행합니다.")
+    parser.add_argument("-n", "--workers", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--slack-poller", action="store_true", help="워커들이 공유할 Slack 인증 URL 폴러를 실행")
+    parser.add_argument("--worker-args", default="", help="각 워커 pytest에 전달할 추가 인자 (예: \"-s -x\")")
+    parser.add_argument("--schedule", choices=("lpt", "roundrobin"), default=None,
+                        help="테스트 분배 방식 (기본값: 실행 기록 기반 LPT)")
+    parser.add_argument("pytest_args", nargs=argparse.REMAINDER, help="테스트 수집에 사용할 pytest 인자")
+    args = parser.parse_args(argv)
+
+    pytest_args = [arg for arg in args.pytest_args if arg != "--"]
+    if args.slack_poller:
+        # 워커 프로세스는 SLACK_POLLER_URL 환경 변수를 상속받아 폴러를 구독
+        from core.slack_poller import start_shared_poller
+        start_shared_poller()
+
+    runner = ParallelRunner(args.workers, pytest_args, shlex.split(args.worker_args), args.schedule)
+    return runner.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
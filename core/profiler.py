@@ -0,0 +1,223 @@
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+import threading
+
+from core.timing import current_step_names
+
+
+class CommandProfiler:
+    """
+    WebDriver 명령(chromedriver HTTP 왕복) 단위 프로파일러
+
+    - 드라이버의 command executor를 감싸 모든 명령의 이름, 소요 시간, 요청/응답 크기를 기록.
+    - 각 명령은 호출 시점의 단계(페이지 객체 메서드, core.timing) 스택에 귀속되어,
+      어떤 메서드가 어떤 명령을 몇 번 호출했는지 확인할 수 있음.
+    - 테스트별 JSON 리포트와 flamegraph.pl / speedscope에서 읽을 수 있는 folded stack 파일을 생성.
+    """
+
+    ENABLED = os.getenv("COMMAND_PROFILE", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+
+    def __init__(self, driver):
+        """
+        CommandProfiler 클래스의 생성자. 드라이버의 command executor를 감쌈.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+        """
+        self.driver = driver
+        self.commands = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+        executor = driver.command_executor
+        original_execute = executor.execute
+
+        def execute(command, params):
+            started = time.perf_counter()
+            response = None
+            try:
+                response = original_execute(command, params)
+                return response
+            finally:
+                self._record(command, params, response, started)
+
+        executor.execute = execute
+
+    @classmethod
+    def for_driver(cls, driver):
+        """
+        드라이버에 연결된 프로파일러를 반환 (없으면 생성하여 연결).
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+
+        Returns:
+            CommandProfiler: 드라이버 전용 프로파일러.
+        """
+        profiler = getattr(driver, "_command_profiler", None)
+        if profiler is None:
+            profiler = cls(driver)
+            driver._command_profiler = profiler
+        return profiler
+
+    def _record(self, command, params, response, started):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        entry = {
+            "command": command,
+            "start_ms": (started - self._origin) * 1000,
+            "elapsed_ms": elapsed_ms,
+            "request_bytes": _size(params),
+            "response_bytes": _size(response),
+            "stack": current_step_names(),
+            "failed": response is None,
+        }
+        # CDP 명령은 메서드 이름까지 구분
+        if command == "executeCdpCommand" and isinstance(params, dict):
+            entry["command"] = f"executeCdpCommand:{params.get('cmd')}"
+        with self._lock:
+            self.commands.append(entry)
+
+    def reset(self):
+        """
+        기록된 명령을 비우고 기준 시각을 초기화 (테스트 시작 시 호출).
+        """
+        with self._lock:
+            self.commands = []
+            self._origin = time.perf_counter()
+
+    def summary(self):
+        """
+        명령별, 단계별 호출 횟수와 시간/크기 합계를 계산.
+
+        Returns:
+            dict: {"totals", "by_command", "by_step"} 형식의 집계 결과.
+        """
+        with self._lock:
+            commands = list(self.commands)
+
+        def bucket():
+            return {"count": 0, "total_ms": 0.0, "request_bytes": 0, "response_bytes": 0}
+
+        def add(target, entry):
+            target["count"] += 1
+            target["total_ms"] += entry["elapsed_ms"]
+            target["request_bytes"] += entry["request_bytes"]
+            target["response_bytes"] += entry["response_bytes"]
+
+        totals, by_command, by_step = bucket(), {}, {}
+        for entry in commands:
+            add(totals, entry)
+            add(by_command.setdefault(entry["command"], bucket()), entry)
+            # 명령은 가장 안쪽 단계(직접 호출한 메서드)에 귀속
+            step_name = entry["stack"][-1] if entry["stack"] else "(no step)"
+            step = by_step.setdefault(step_name, dict(bucket(), commands={}))
+            add(step, entry)
+            step["commands"][entry["command"]] = step["commands"].get(entry["command"], 0) + 1
+        return {"totals": totals, "by_command": by_command, "by_step": by_step}
+
+    def folded(self, root):
+        """
+        flamegraph 호환 folded stack 라인을 생성 ("루트;단계;...;명령 마이크로초").
+
+        Args:
+            root (str): 스택의 최상위 프레임 이름 (보통 pytest 노드 ID).
+
+        Returns:
+            list: folded stack 문자열 목록.
+        """
+        weights = {}
+        with self._lock:
+            commands = list(self.commands)
+        for entry in commands:
+            frames = [root] + entry["stack"] + [entry["command"]]
+            key = ";".join(frame.replace(";", ":").replace(" ", "_") for frame in frames)
+            weights[key] = weights.get(key, 0) + int(entry["elapsed_ms"] * 1000)
+        return [f"{key} {weight}" for key, weight in weights.items()]
+
+    def save(self, directory, name, **extra):
+        """
+        테스트별 리포트(<name>.json)와 folded stack 파일(<name>.folded)을 저장.
+
+        Args:
+            directory (str): 저장할 디렉토리.
+            name (str): 파일명 (확장자 제외).
+            **extra: 리포트에 함께 저장할 정보 (예: nodeid, outcome).
+
+        Returns:
+            str: 저장된 JSON 리포트 경로.
+        """
+        os.makedirs(directory, exist_ok=True)
+        report_path = os.path.join(directory, f"{name}.json")
+        with self._lock:
+            commands = list(self.commands)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(dict(extra, **self.summary(), commands=commands), f, ensure_ascii=False, indent=2)
+        with open(os.path.join(directory, f"{name}.folded"), "w", encoding="utf-8") as f:
+            f.write("\n".join(self.folded(extra.get("nodeid", name))) + "\n")
+        return report_path
+
+
+def _size(value):
+    # JSON 직렬화 기준의 대략적인 크기 (바이트)
+    if value is None:
+        return 0
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return 0
+
+
+def main(argv=None):
+    """
+    테스트별 프로파일 리포트를 합쳐 명령/단계별 왕복 횟수와 시간을 출력하는 진입점.
+
+    Example:
+        python -m core.profiler reports/profiles --folded reports/profiles.folded
+        flamegraph.pl reports/profiles.folded > reports/profiles.svg
+    """
+    parser = argparse.ArgumentParser(description="WebDriver 명령 프로파일을 집계합니다.")
+    parser.add_argument("directory", nargs="?", default=os.path.join(os.getenv("REPORT_DIR", "reports"), "profiles"))
+    parser.add_argument("--folded", help="모든 테스트의 folded stack을 합쳐 저장할 파일 경로")
+    parser.add_argument("--top", type=int, default=20, help="출력할 단계 수")
+    args = parser.parse_args(argv)
+
+    paths = glob.glob(os.path.join(args.directory, "**", "*.json"), recursive=True)
+    if not paths:
+        print(f"프로파일 파일이 없습니다: {args.directory}")
+        return 1
+
+    by_command, by_step = {}, {}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            report = json.load(f)
+        for target, source in ((by_command, report.get("by_command", {})), (by_step, report.get("by_step", {}))):
+            for name, stats in source.items():
+                merged = target.setdefault(name, {"count": 0, "total_ms": 0.0})
+                merged["count"] += stats["count"]
+                merged["total_ms"] += stats["total_ms"]
+
+    print(f"{len(paths)}개 프로파일 집계\n")
+    print(f"{'command':<45} {'calls':>7} {'total ms':>10} {'avg ms':>8}")
+    for name, stats in sorted(by_command.items(), key=lambda item: -item[1]["total_ms"]):
+        print(f"{name:<45} {stats['count']:>7} {stats['total_ms']:>10.0f} {stats['total_ms'] / stats['count']:>8.1f}")
+
+    print(f"\n{'step':<45} {'calls':>7} {'total ms':>10} {'avg ms':>8}")
+    for name, stats in sorted(by_step.items(), key=lambda item: -item[1]["total_ms"])[:args.top]:
+        print(f"{name:<45} {stats['count']:>7} {stats['total_ms']:>10.0f} {stats['total_ms'] / stats['count']:>8.1f}")
+
+    if args.folded:
+        lines = []
+        for path in glob.glob(os.path.join(args.directory, "**", "*.folded"), recursive=True):
+            with open(path, encoding="utf-8") as f:
+                lines.extend(line.rstrip("\n") for line in f if line.strip())
+        with open(args.folded, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
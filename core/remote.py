@@ -0,0 +1,290 @@
+import os
+import json
+import time
+import logging
+import threading
+from collections import OrderedDict
+
+import urllib3
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
+
+logger = logging.getLogger(__name__)
+
+
+class RemoteChrome(webdriver.Remote):
+    """
+    원격 노드(Selenium Grid, chromedriver 등)의 Chrome 세션
+
+    - 로컬 webdriver.Chrome과 같이 execute_cdp_cmd를 제공.
+    - CDP 이벤트 기반 기능(NetworkMonitor 등)은 브라우저 웹소켓이 필요하므로, 세션이 se:cdp를 제공하는
+      Selenium Grid 노드이거나 같은 머신의 노드(standin.grid)인 경우에만 사용 가능 (core.cdp 참고).
+    """
+
+    def __init__(self, url, options):
+        executor = ChromiumRemoteConnection(
+            remote_server_addr=url,
+            vendor_prefix="goog",
+            browser_name="chrome",
+            keep_alive=True,
+            ignore_proxy=options._ignore_local_proxy,
+        )
+        super().__init__(command_executor=executor, options=options)
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+
+class RemoteNode:
+    """
+    세션을 실행할 원격 노드와 현재 사용 중인 세션 수
+    """
+
+    def __init__(self, url, capacity=1):
+        self.url = url.rstrip("/")
+        self.capacity = capacity
+        self.active = 0
+        self.ready = True
+        self.checked_at = 0.0
+
+    @property
+    def free(self):
+        return self.capacity - self.active if self.ready else 0
+
+    def __repr__(self):
+        return f"RemoteNode({self.url!r}, active={self.active}/{self.capacity}, ready={self.ready})"
+
+
+def parse_nodes(value, default_capacity=1):
+    """
+    "URL[=동시 세션 수]"를 쉼표로 구분한 노드 설정을 해석하는 함수.
+
+    Args:
+        value (str): 노드 설정 (예: "http://node1:4444=4,http://node2:4444=2").
+        default_capacity (int, optional): 세션 수를 지정하지 않은 노드의 동시 세션 수. 기본값 1.
+
+    Returns:
+        list: RemoteNode 목록.
+    """
+    nodes = []
+    for item in (value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        url, _, capacity = item.rpartition("=")
+        if url and capacity.isdigit():
+            nodes.append(RemoteNode(url, int(capacity)))
+        else:
+            nodes.append(RemoteNode(item, default_capacity))
+    return nodes
+
+
+def share_capacity(nodes, worker_index, worker_count):
+    """
+    병렬 실행 워커끼리 노드 용량을 나누어, 워커 프로세스마다 자신의 몫만 사용하도록 노드 용량을 조정하는 함수.
+
+    - 나누어 떨어지지 않는 나머지 세션은 노드 순서대로 워커에 번갈아 배정 (워커 간 합계 차이는 최대 1).
+
+    Args:
+        nodes (list): RemoteNode 목록 (capacity를 이 워커의 몫으로 변경).
+        worker_index (int): 워커 번호 (0부터).
+        worker_count (int): 전체 워커 수.
+
+    Returns:
+        list: 용량을 조정한 RemoteNode 목록.
+
+    Raises:
+        ValueError: 전체 노드 용량이 워커 수보다 작아 이 워커에 배정할 세션이 없는 경우 발생.
+    """
+    if worker_count <= 1:
+        return nodes
+
+    offset = 0
+    for node in nodes:
+        base, extra = divmod(node.capacity, worker_count)
+        node.capacity = base + (1 if (worker_index - offset) % worker_count < extra else 0)
+        offset += extra
+    if not sum(node.capacity for node in nodes):
+        raise ValueError(f"원격 노드의 전체 용량이 워커 수({worker_count})보다 작습니다: {nodes}")
+    return nodes
+
+
+class SessionDistributor:
+    """
+    등록된 원격 노드에 WebDriver 세션을 분배하는 분배기
+
+    - 새 세션은 남은 용량(capacity - 사용 중인 세션)이 가장 큰 노드에 생성.
+    - 같은 affinity 키(테스트 nodeid, 계정 등)로 요청한 세션은 용량이 남아 있는 한 같은 노드에 생성하여,
+      여러 세션에 걸친 플로우(재실행, 체크포인트 복원 등)가 같은 노드의 캐시를 재사용하도록 함.
+    - 노드의 /status를 STATUS_INTERVAL마다 확인하고, 준비되지 않았거나 세션 생성에 실패한 노드는 제외.
+    - 모든 노드가 가득 차면 세션이 반환될 때까지 대기.
+    - 병렬 실행(core.parallel) 중에는 노드 용량을 워커 수로 나누어 각 워커가 자신의 몫만 사용 (share_capacity).
+    """
+
+    NODES = os.getenv("REMOTE_NODES", "")  # 예: "http://node1:4444=4,http://node2:4444=2"
+    ENABLED = bool(NODES.strip())
+    NODE_CAPACITY = int(os.getenv("REMOTE_NODE_CAPACITY", "1"))  # 세션 수를 지정하지 않은 노드의 동시 세션 수
+    STATUS_INTERVAL = float(os.getenv("REMOTE_STATUS_INTERVAL", "5"))  # 노드 상태 확인 간격 (초)
+    ACQUIRE_TIMEOUT = float(os.getenv("REMOTE_ACQUIRE_TIMEOUT", "300"))  # 빈 노드를 기다리는 최대 시간 (초)
+    AFFINITY_SIZE = 1000  # 기억할 최대 affinity 키 수 (가장 오래 사용하지 않은 키부터 제거)
+
+    _http = urllib3.PoolManager()
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, nodes):
+        """
+        SessionDistributor 클래스의 생성자.
+
+        Args:
+            nodes (list): RemoteNode 목록.
+        """
+        if not nodes:
+            raise ValueError("원격 노드가 설정되지 않았습니다 (REMOTE_NODES).")
+        self.nodes = nodes
+        self._affinity = OrderedDict()
+        self._condition = threading.Condition()
+
+    @classmethod
+    def get(cls):
+        """
+        REMOTE_NODES 설정으로 만든 프로세스 공용 SessionDistributor를 반환 (병렬 실행 중이면 이 워커의 용량 몫만 사용).
+
+        Returns:
+            SessionDistributor: 세션 분배기.
+        """
+        from core.utils import get_worker_count, get_worker_index
+
+        with cls._instance_lock:
+            if cls._instance is None:
+                nodes = parse_nodes(cls.NODES, cls.NODE_CAPACITY)
+                cls._instance = cls(share_capacity(nodes, get_worker_index(), get_worker_count()))
+            return cls._instance
+
+    def check(self, node):
+        """
+        노드의 /status를 조회하여 새 세션을 받을 수 있는지 확인.
+
+        Args:
+            node (RemoteNode): 확인할 노드.
+
+        Returns:
+            bool: 준비된 노드이면 True.
+        """
+        # HTTP 요청은 잠금 밖에서 수행하여 다른 acquire/release가 기다리지 않도록 함
+        try:
+            response = self._http.request("GET", f"{node.url}/status", timeout=2, retries=False)
+            value = json.loads(response.data.decode("utf-8")).get("value", {})
+            ready = response.status == 200 and value.get("ready", False)
+        except Exception:
+            ready = False
+        with self._condition:
+            if ready != node.ready:
+                logger.info(f"원격 노드 상태가 변경되었습니다: {node.url} ready={ready}")
+            node.ready = ready
+            node.checked_at = time.monotonic()
+            if ready:
+                self._condition.notify_all()
+        return ready
+
+    def _refresh(self):
+        # 확인할 노드를 잠금 안에서 정하고(다른 스레드가 같은 노드를 중복 확인하지 않도록 시각을 먼저 갱신),
+        # /status 조회는 잠금 밖에서 수행
+        now = time.monotonic()
+        with self._condition:
+            due = [node for node in self.nodes if now - node.checked_at >= self.STATUS_INTERVAL]
+            for node in due:
+                node.checked_at = now
+        for node in due:
+            self.check(node)
+
+    def _select(self, affinity):
+        # 호출자가 self._condition을 보유
+        pinned = self._affinity.get(affinity) if affinity is not None else None
+        if pinned is not None and pinned.free > 0:
+            return pinned
+        candidates = [node for node in self.nodes if node.free > 0]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda node: (node.free, -node.active))
+
+    def acquire(self, affinity=None, timeout=None):
+        """
+        세션을 만들 노드를 골라 사용 중으로 표시.
+
+        Args:
+            affinity (str, optional): 같은 노드에 모을 세션의 키.
+            timeout (float, optional): 빈 노드를 기다리는 최대 시간 (초). 기본값은 ACQUIRE_TIMEOUT.
+
+        Returns:
+            RemoteNode: 선택된 노드.
+
+        Raises:
+            TimeoutError: 시간 내에 빈 노드가 없는 경우 발생.
+        """
+        deadline = time.monotonic() + (timeout or self.ACQUIRE_TIMEOUT)
+        while True:
+            self._refresh()
+            with self._condition:
+                node = self._select(affinity)
+                if node is not None:
+                    node.active += 1
+                    if affinity is not None:
+                        self._affinity[affinity] = node
+                        self._affinity.move_to_end(affinity)
+                        while len(self._affinity) > self.AFFINITY_SIZE:
+                            self._affinity.popitem(last=False)
+                    return node
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(f"세션을 만들 수 있는 원격 노드가 없습니다: {self.nodes}")
+                self._condition.wait(min(remaining, self.STATUS_INTERVAL))
+
+    def release(self, node):
+        """
+        노드의 세션 하나를 반환.
+        """
+        with self._condition:
+            node.active = max(node.active - 1, 0)
+            self._condition.notify_all()
+
+    def create_driver(self, options, affinity=None):
+        """
+        분배된 노드에 Chrome 세션을 생성. 세션 생성에 실패한 노드는 제외하고 다른 노드로 재시도.
+
+        Args:
+            options (ChromeOptions): Chrome 옵션.
+            affinity (str, optional): 같은 노드에 모을 세션의 키.
+
+        Returns:
+            RemoteChrome: 원격 세션 (quit 시 노드 용량 반환).
+        """
+        last_error = None
+        for _ in range(len(self.nodes)):
+            node = self.acquire(affinity)
+            try:
+                driver = RemoteChrome(node.url, options)
+            except WebDriverException as e:
+                logger.warning(f"원격 노드에서 세션 생성에 실패했습니다 ({node.url}): {(str(e).splitlines() or [''])[0]}")
+                with self._condition:
+                    node.ready = False
+                    node.checked_at = time.monotonic()
+                    self._affinity = OrderedDict((key, value) for key, value in self._affinity.items() if value is not node)
+                self.release(node)
+                last_error = e
+                continue
+
+            session_quit = driver.quit
+
+            def quit(node=node, session_quit=session_quit):
+                try:
+                    session_quit()
+                finally:
+                    self.release(node)
+
+            driver.quit = quit
+            driver._remote_node = node.url
+            logger.info(f"원격 노드에 세션을 생성했습니다: {node}")
+            return driver
+        raise Exception(f"모든 원격 노드에서 세션 생성에 실패했습니다: {str(last_error)}")
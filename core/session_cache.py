@@ -0,0 +1,111 @@
+import os
+import json
+import time
+import hashlib
+import logging
+
+from core.browser_state import capture_browser_state, restore_browser_state
+
+logger = logging.getLogger(__name__)
+
+
+class SessionCache:
+    """
+    로그인된 브라우저 세션(쿠키, localStorage/sessionStorage)을 계정별로 디스크에 저장하고 복원
+
+    - 스냅샷은 만료 시간(TTL)과 함께 저장되며, 만료되었거나 복원 후 로그인 상태가 아니면 폐기.
+    - 스냅샷은 계정과 BASE_URL별로 구분하고, 인증 쿠키가 평문으로 들어 있으므로 소유자만 읽을 수 있는 파일(0600)로 저장.
+    """
+
+    ENABLED = os.getenv("SESSION_CACHE", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+    CACHE_DIR = os.getenv("SESSION_CACHE_DIR", ".session_cache")
+    TTL = int(os.getenv("SESSION_CACHE_TTL", "3600"))  # 스냅샷 유효 시간 (초)
+
+    def __init__(self, cache_dir=None, ttl=None, base_url=None):
+        """
+        SessionCache 클래스의 생성자.
+
+        Args:
+            cache_dir (str, optional): 스냅샷 저장 디렉토리. 기본값은 SESSION_CACHE_DIR 환경 변수.
+            ttl (int, optional): 스냅샷 유효 시간 (초). 기본값은 SESSION_CACHE_TTL 환경 변수.
+            base_url (str, optional): 스냅샷을 구분할 대상 환경의 URL. 기본값은 Driver.BASE_URL.
+        """
+        from core.driver import Driver
+
+        self.cache_dir = cache_dir or SessionCache.CACHE_DIR
+        self.ttl = ttl or SessionCache.TTL
+        self.base_url = (base_url or Driver.BASE_URL).rstrip("/")
+
+    def _path(self, email):
+        # 같은 계정이라도 환경(BASE_URL)이 다르면 다른 스냅샷을 사용. 파일명에 이메일이 그대로 노출되지 않도록 해시 사용
+        key = f"{self.base_url}|{email.lower()}"
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def save(self, driver, email):
+        """
+        현재 로그인된 세션을 스냅샷으로 저장.
+
+        Args:
+            driver: 로그인된 상태의 Selenium WebDriver 인스턴스.
+            email (str): 로그인한 계정의 이메일 주소.
+        """
+        snapshot = {
+            "email": email,
+            "base_url": self.base_url,
+            "expires_at": time.time() + self.ttl,
+            "state": capture_browser_state(driver),
+        }
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        path = self._path(email)
+        # 인증 쿠키가 들어 있으므로 소유자만 읽고 쓸 수 있도록 생성
+        fd = os.open(f"{path}.tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(f"{path}.tmp", path)  # 병렬 워커가 읽는 중에 파일이 깨지지 않도록 원자적으로 교체
+
+    def load(self, email):
+        """
+        유효한 스냅샷을 읽어옴.
+
+        Args:
+            email (str): 계정 이메일 주소.
+
+        Returns:
+            dict or None: 만료되지 않은 스냅샷. 없거나 만료된 경우 None.
+        """
+        path = self._path(email)
+        try:
+            with open(path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if snapshot.get("expires_at", 0) <= time.time():
+            logger.info(f"세션 스냅샷이 만료되었습니다: {email}")
+            self.invalidate(email)
+            return None
+        return snapshot
+
+    def restore(self, driver, snapshot, url=None):
+        """
+        스냅샷을 드라이버에 복원.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스 (새 세션 또는 초기화된 풀 세션).
+            snapshot (dict): load로 읽은 스냅샷.
+            url (str, optional): 복원 후 이동할 URL.
+        """
+        restore_browser_state(driver, snapshot["state"], url=url)
+
+    def invalidate(self, email):
+        """
+        계정의 스냅샷을 삭제.
+
+        Args:
+            email (str): 계정 이메일 주소.
+        """
+        try:
+            os.remove(self._path(email))
+        except OSError:
+            pass
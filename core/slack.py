@@ -1,19 +1,37 @@
 import os
 import re
+import time
 import logging
+import threading
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
+from core.timing import waiting
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+EMAIL_PATTERN = re.compile(r'[\w.+-]+@[\w-]+(?:\.[\w-]+)+')
+URL_PATTERN = re.compile(r'(https?://[^\s<>|]+)')
+
 
 class Slack:
     """
     특정 이메일이 포함된 슬랙 메시지에서 인증URL 검색
+
+    - 채널 메시지를 `oldest` 워터마크 이후로만 증분 조회하고, 커서 기반 페이지네이션을 끝까지 따라감.
+    - 조회한 메시지는 이메일 → 인증 URL 인덱스에 저장되며, 프로세스 내 모든 Slack 인스턴스(테스트)가 공유.
     """
 
+    # 첫 조회 시 거슬러 올라갈 시간 (초)
+    LOOKBACK_SECONDS = int(os.getenv("SLACK_LOOKBACK_SECONDS", "3600"))
+    # conversations.history 한 페이지에서 가져올 메시지 수
+    PAGE_SIZE = int(os.getenv("SLACK_PAGE_SIZE", "200"))
+
+    # 프로세스 내 공유 상태: 채널 ID → {"oldest": 워터마크 ts, "index": {이메일: (ts, URL)}}
+    _channels = {}
+    _lock = threading.Lock()
+
     def __init__(self):
         self.token = os.getenv("SLACK_API_TOKEN")
         self.channel_id = os.getenv("SLACK_CHANNEL_ID")
@@ -21,7 +39,84 @@ class Slack:
         if not self.token or not self.channel_id:
             raise ValueError("SLACK_API_TOKEN 또는 SLACK_CHANNEL_ID 환경 변수가 설정되지 않았습니다.")
 
-        self.client = WebClient(token=self.token)
+        # SLACK_API_BASE_URL로 로컬 대역 서버(standin.slack_server) 등을 지정할 수 있음
+        self.client = WebClient(token=self.token, base_url=os.getenv("SLACK_API_BASE_URL", WebClient.BASE_URL))
+
+    @property
+    def _state(self):
+        return Slack._channels.setdefault(self.channel_id, {
+            "oldest": f"{time.time() - Slack.LOOKBACK_SECONDS:.6f}",
+            "index": {},
+        })
+
+    def sync(self):
+        """
+        마지막 워터마크 이후에 도착한 메시지만 가져와 인덱스에 추가.
+
+        - `oldest` 이후의 메시지를 모든 페이지에 걸쳐 조회하고, 가장 최근 메시지의 ts로 워터마크를 갱신.
+
+        Returns:
+            int: 새로 조회한 메시지 수.
+
+        Raises:
+            SlackApiError: Slack API 호출에 실패한 경우 발생.
+        """
+        with Slack._lock:
+            state = self._state
+            newest = state["oldest"]
+            cursor = None
+            fetched = 0
+
+            while True:
+                result = self.client.conversations_history(
+                    channel=self.channel_id,
+                    oldest=state["oldest"],
+                    limit=Slack.PAGE_SIZE,
+                    cursor=cursor,
+                )
+
+                for message in result.get('messages', []):
+                    ts = message.get('ts', '0')
+                    if float(ts) > float(newest):
+                        newest = ts
+                    self._index_message(state["index"], message, ts)
+                    fetched += 1
+
+                cursor = (result.get('response_metadata') or {}).get('next_cursor')
+                if not result.get('has_more') or not cursor:
+                    break
+
+            # 모든 페이지를 읽은 뒤에만 워터마크를 이동해 중간 실패 시 메시지를 놓치지 않도록 함
+            state["oldest"] = newest
+            return fetched
+
+    @staticmethod
+    def _index_message(index, message, ts):
+        """
+        메시지에 포함된 이메일마다 인증 URL을 인덱스에 저장. 같은 이메일이면 최신 메시지를 우선.
+        """
+        text = message.get('text', '')
+        match = URL_PATTERN.search(text)
+        if not match:
+            return
+
+        for email in set(EMAIL_PATTERN.findall(text)):
+            key = email.lower()
+            if key not in index or float(index[key][0]) < float(ts):
+                index[key] = (ts, match.group(1))
+
+    def lookup(self, email):
+        """
+        API 호출 없이 인덱스에서 인증 URL을 조회.
+
+        Args:
+            email (str): 검색할 이메일 주소.
+
+        Returns:
+            str or None: 인덱스에 있는 인증 URL. 없으면 None.
+        """
+        entry = self._state["index"].get(email.lower())
+        return entry[1] if entry else None
 
     def find_verification_url_by_email(self, email):
         """
@@ -33,23 +128,41 @@ class Slack:
         Returns:
             str or None: 찾은 인증 URL을 반환. URL을 찾지 못한 경우 None을 반환.
         """
-        try:
-            # 슬랙에서 최근 20개 메시지 가져오기
-            result = self.client.conversations_history(channel=self.channel_id, limit=20)
-
-            # 메시지 리스트에서 이메일이 포함된 메시지 검색
-            for message in result.get('messages', []):
-                # 메시지에 이메일이 포함되어 있는지 확인
-                if email in message.get('text', ''):
-                    # 이메일이 포함된 경우, 해당 메시지에서 URL을 검색
-                    match = re.search(r'(https://[^\s]+)', message['text'])
-                    if match:
-                        logger.info(f"인증 URL을 찾았습니다!: {match.group(1)}")
-                        return match.group(1)
+        url = self.lookup(email)
+        if url:
+            return url
 
+        try:
+            # 워터마크 이후의 새 메시지만 가져와 인덱스 갱신
+            self.sync()
         except SlackApiError as e:
             logger.error(f"Slack API에서 메시지를 가져오는 중 오류가 발생했습니다: {e.response.get('error', '알 수 없는 오류')}")
 
+        url = self.lookup(email)
+        if url:
+            logger.info(f"인증 URL을 찾았습니다!: {url}")
+            return url
+
         # URL을 찾지 못한 경우 None 반환
         logger.info("인증 URL을 찾지 못했습니다.")
         return None
+
+    def wait_for_verification_url(self, email, timeout=30, poll_interval=2):
+        """
+        인증 URL이 도착할 때까지 짧은 간격으로 증분 조회.
+
+        Args:
+            email (str): 검색할 이메일 주소.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값 30초.
+            poll_interval (float, optional): 조회 간격 (초). 기본값 2초.
+
+        Returns:
+            str or None: 찾은 인증 URL. 시간 내에 찾지 못한 경우 None.
+        """
+        deadline = time.monotonic() + timeout
+        with waiting():
+            while True:
+                url = self.find_verification_url_by_email(email)
+                if url or time.monotonic() >= deadline:
+                    return url
+                time.sleep(min(poll_interval, max(0, deadline - time.monotonic())))
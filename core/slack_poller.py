@@ -0,0 +1,310 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+import urllib3
+from slack_sdk.errors import SlackApiError
+
+from core.slack import Slack
+from core.timing import waiting
+
+logger = logging.getLogger(__name__)
+
+
+class SlackPoller:
+    """
+    하나의 Slack 클라이언트로 채널을 폴링하여, 이메일별로 대기 중인 여러 요청에 인증 URL을 전달
+
+    - 대기자가 있을 때만 폴링하며, 새 메시지가 없으면 폴링 간격을 점진적으로 늘림 (적응형 백오프).
+    - 429(rate limit) 응답 시 Retry-After 헤더만큼 대기 후 재개 (그동안 새 구독이 생겨도 API를 호출하지 않음).
+    - 메시지가 인덱스에 들어오는 즉시 해당 이메일의 Future를 완료.
+    """
+
+    MIN_INTERVAL = float(os.getenv("SLACK_POLL_MIN_INTERVAL", "1"))
+    MAX_INTERVAL = float(os.getenv("SLACK_POLL_MAX_INTERVAL", "10"))
+    BACKOFF_FACTOR = 1.5
+
+    def __init__(self, slack=None):
+        """
+        SlackPoller 클래스의 생성자.
+
+        Args:
+            slack (Slack, optional): 폴링에 사용할 Slack 인스턴스. 모든 요청이 이 인스턴스의 WebClient를 공유.
+        """
+        self.slack = slack or Slack()
+        self.interval = SlackPoller.MIN_INTERVAL
+        self._not_before = 0.0  # Retry-After가 끝나는 시각 (time.monotonic 기준)
+        self._waiters = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="slack-poller", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        self._wakeup.set()
+        self._thread.join(timeout=5)
+
+    def subscribe(self, email):
+        """
+        이메일의 인증 URL을 기다리는 Future를 등록. 이미 인덱스에 있으면 완료된 Future를 반환.
+
+        Args:
+            email (str): 인증 URL을 기다릴 이메일 주소.
+
+        Returns:
+            Future: 인증 URL(str)로 완료되는 Future.
+        """
+        future = Future()
+        url = self.slack.lookup(email)
+        if url:
+            future.set_result(url)
+            return future
+
+        with self._lock:
+            self._waiters.setdefault(email.lower(), []).append(future)
+            # 새 대기자가 생기면 즉시 폴링하도록 간격을 초기화 (rate limit 대기 중에는 유지)
+            if time.monotonic() >= self._not_before:
+                self.interval = SlackPoller.MIN_INTERVAL
+        self._wakeup.set()
+        return future
+
+    def wait_for_verification_url(self, email, timeout=30, poll_interval=None):
+        """
+        인증 URL이 도착할 때까지 대기.
+
+        Args:
+            email (str): 검색할 이메일 주소.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값 30초.
+            poll_interval: 사용하지 않음 (Slack.wait_for_verification_url과 호환을 위한 인자).
+
+        Returns:
+            str or None: 찾은 인증 URL. 시간 내에 찾지 못한 경우 None.
+        """
+        future = self.subscribe(email)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            self._unsubscribe(email, future)
+            return None
+
+    def _unsubscribe(self, email, future):
+        with self._lock:
+            futures = self._waiters.get(email.lower(), [])
+            if future in futures:
+                futures.remove(future)
+            if not futures:
+                self._waiters.pop(email.lower(), None)
+
+    def _run(self):
+        while not self._stopped.is_set():
+            with self._lock:
+                has_waiters = bool(self._waiters)
+
+            if not has_waiters:
+                # 대기자가 없으면 API를 호출하지 않고 새 구독을 기다림
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            # rate limit 대기 중이면 구독으로 깨어나도 Retry-After가 끝날 때까지 호출하지 않음
+            remaining = self._not_before - time.monotonic()
+            if remaining > 0:
+                self._stopped.wait(remaining)
+                continue
+
+            delay = self._poll_once()
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+
+    def _poll_once(self):
+        """
+        한 번 폴링하여 대기자를 처리하고, 다음 폴링까지의 대기 시간을 반환.
+        """
+        try:
+            fetched = self.slack.sync()
+        except SlackApiError as e:
+            if e.response.status_code == 429:
+                with self._lock:
+                    retry_after = float(e.response.headers.get("Retry-After", self.interval))
+                    self._not_before = time.monotonic() + retry_after
+                    self.interval = min(max(retry_after, self.interval) * SlackPoller.BACKOFF_FACTOR, SlackPoller.MAX_INTERVAL)
+                logger.warning(f"Slack rate limit에 걸렸습니다. {retry_after}초 후 재시도합니다.")
+                return retry_after
+            logger.error(f"Slack API에서 메시지를 가져오는 중 오류가 발생했습니다: {e.response.get('error', '알 수 없는 오류')}")
+            fetched = 0
+        except Exception as e:
+            # 연결 오류 등으로 폴링 스레드가 종료되지 않도록 기록만 하고 간격을 늘려 재시도
+            logger.error(f"Slack 폴링 중 오류가 발생했습니다: {str(e)}")
+            fetched = 0
+
+        self._resolve_waiters()
+
+        with self._lock:
+            if fetched:
+                self.interval = SlackPoller.MIN_INTERVAL
+            else:
+                self.interval = min(self.interval * SlackPoller.BACKOFF_FACTOR, SlackPoller.MAX_INTERVAL)
+            return self.interval
+
+    def _resolve_waiters(self):
+        with self._lock:
+            for email in list(self._waiters):
+                url = self.slack.lookup(email)
+                if not url:
+                    continue
+                for future in self._waiters.pop(email):
+                    if not future.done():
+                        future.set_result(url)
+
+
+class SlackPollerServer(ThreadingHTTPServer):
+    """
+    머신당 하나의 SlackPoller를 HTTP로 공유하는 서버 (워커 프로세스들이 이메일 단위로 구독)
+
+    - GET /wait?email=<이메일>&timeout=<초>: 인증 URL이 도착할 때까지 롱 폴링.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, poller, host="127.0.0.1", port=0):
+        super().__init__((host, port), _PollerRequestHandler)
+        self.poller = poller
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_in_background(self):
+        threading.Thread(target=self.serve_forever, name="slack-poller-server", daemon=True).start()
+        return self
+
+
+class _PollerRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        if parsed.path != "/wait" or "email" not in query:
+            self._respond(404, {"error": "not_found"})
+            return
+
+        timeout = float(query.get("timeout", ["30"])[0])
+        url = self.server.poller.wait_for_verification_url(query["email"][0], timeout=timeout)
+        if url:
+            self._respond(200, {"url": url})
+        else:
+            self._respond(408, {"error": "timeout"})
+
+    def _respond(self, status, body):
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+class SlackPollerClient:
+    """
+    SlackPollerServer에 인증 URL을 요청하는 클라이언트
+    """
+
+    # 프로세스 내에서 HTTP 연결을 재사용
+    _http = urllib3.PoolManager()
+
+    def __init__(self, server_url):
+        self.server_url = server_url.rstrip("/")
+
+    def wait_for_verification_url(self, email, timeout=30, poll_interval=None):
+        """
+        서버에 롱 폴링으로 인증 URL을 요청.
+
+        Args:
+            email (str): 검색할 이메일 주소.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값 30초.
+            poll_interval: 사용하지 않음 (Slack.wait_for_verification_url과 호환을 위한 인자).
+
+        Returns:
+            str or None: 찾은 인증 URL. 시간 내에 찾지 못한 경우 None.
+        """
+        with waiting():
+            response = SlackPollerClient._http.request(
+                "GET",
+                f"{self.server_url}/wait",
+                fields={"email": email, "timeout": str(timeout)},
+                timeout=urllib3.Timeout(connect=5, read=timeout + 5),
+                retries=False,
+            )
+        if response.status != 200:
+            return None
+        return json.loads(response.data.decode("utf-8")).get("url")
+
+
+def create_verification_source():
+    """
+    인증 URL 조회 객체를 생성하는 함수.
+
+    Returns:
+        SlackPollerClient or Slack: SLACK_POLLER_URL이 설정되어 있으면 공유 폴러 클라이언트, 아니면 Slack.
+    """
+    server_url = os.getenv("SLACK_POLLER_URL")
+    return SlackPollerClient(server_url) if server_url else Slack()
+
+
+def start_shared_poller(port=0):
+    """
+    공유 폴러 서버를 백그라운드로 시작하고 SLACK_POLLER_URL 환경 변수를 설정하는 함수.
+
+    Args:
+        port (int, optional): 서버 포트. 기본값 0 (임의 포트).
+
+    Returns:
+        SlackPollerServer: 실행 중인 서버.
+    """
+    server = SlackPollerServer(SlackPoller().start(), port=port).serve_in_background()
+    os.environ["SLACK_POLLER_URL"] = server.url
+    return server
+
+
+def main(argv=None):
+    """
+    공유 폴러 서버 실행 진입점.
+
+    Example:
+        python -m core.slack_poller --port 8765
+        SLACK_POLLER_URL=http://127.0.0.1:8765 pytest
+    """
+    parser = argparse.ArgumentParser(description="Slack 인증 URL 공유 폴러 서버를 실행합니다.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    server = SlackPollerServer(SlackPoller().start(), host=args.host, port=args.port)
+    print(f"Slack poller listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.poller.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+import os
+import sys
+import json
+import time
+import glob
+import argparse
+import functools
+import threading
+from contextlib import contextmanager
+
+_local = threading.local()
+
+
+class StepTimeline:
+    """
+    하나의 테스트(또는 플로우)에서 실행된 단계별 시간 기록
+
+    - 단계의 전체 시간(wall)을 대기 시간(wait), WebDriver 명령 시간(command), 나머지 Python 시간(python)으로 나눔.
+    - 중첩된 단계의 대기/명령 시간은 상위 단계에도 합산됨.
+    """
+
+    ENABLED = os.getenv("STEP_TIMING", "False").lower() in ("true", "1", "yes")  # 기본값은 False
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = time.time()
+        self._origin = time.perf_counter()
+        self.steps = []
+        self._stack = []
+
+    def begin(self, name):
+        record = {
+            "name": name,
+            "depth": len(self._stack),
+            "start_ms": (time.perf_counter() - self._origin) * 1000,
+            "wait_ms": 0.0,
+            "command_ms": 0.0,
+            "commands": 0,
+        }
+        record["_started"] = time.perf_counter()
+        self.steps.append(record)
+        self._stack.append(record)
+        return record
+
+    def end(self, record, error=None):
+        record["wall_ms"] = (time.perf_counter() - record.pop("_started")) * 1000
+        record["python_ms"] = max(record["wall_ms"] - record["wait_ms"] - record["command_ms"], 0.0)
+        if error is not None:
+            record["error"] = f"{type(error).__name__}: {error}"
+        self._stack.remove(record)
+
+    def add(self, key, elapsed_ms, commands=0):
+        for record in self._stack:
+            record[key] += elapsed_ms
+            record["commands"] += commands
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "started_at": self.started_at,
+            "duration_ms": (time.perf_counter() - self._origin) * 1000,
+            "steps": self.steps,
+        }
+
+    def save(self, path, **extra):
+        """
+        타임라인을 JSON 파일로 저장.
+
+        Args:
+            path (str): 저장할 파일 경로.
+            **extra: 함께 저장할 추가 정보 (예: outcome).
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dict(self.to_dict(), **extra), f, ensure_ascii=False, indent=2)
+
+
+def start_timeline(name):
+    """
+    현재 스레드에서 새 타임라인 기록을 시작하는 함수.
+
+    Args:
+        name (str): 타임라인 이름 (보통 pytest 노드 ID).
+
+    Returns:
+        StepTimeline: 시작된 타임라인.
+    """
+    _local.timeline = StepTimeline(name)
+    _local.wait_depth = 0
+    return _local.timeline
+
+
+def stop_timeline():
+    """
+    현재 스레드의 타임라인 기록을 종료하는 함수.
+
+    Returns:
+        StepTimeline or None: 종료된 타임라인.
+    """
+    timeline = getattr(_local, "timeline", None)
+    _local.timeline = None
+    return timeline
+
+
+def current_timeline():
+    return getattr(_local, "timeline", None)
+
+
+def current_step_names():
+    """
+    현재 실행 중인 단계 이름 목록(바깥 → 안쪽)을 반환하는 함수.
+    """
+    timeline = current_timeline()
+    return [record["name"] for record in timeline._stack] if timeline else []
+
+
+@contextmanager
+def step(name):
+    """
+    코드 블록을 하나의 단계로 기록하는 컨텍스트 매니저. 기록 중인 타임라인이 없으면 아무것도 하지 않음.
+
+    Args:
+        name (str): 단계 이름 (예: "SignUpPage.click_continue").
+    """
+    timeline = current_timeline()
+    if timeline is None:
+        yield
+        return
+
+    record = timeline.begin(name)
+    try:
+        yield
+    except BaseException as e:
+        timeline.end(record, e)
+        raise
+    timeline.end(record)
+
+
+def timed_step(name):
+    """
+    함수 호출을 하나의 단계로 기록하는 데코레이터.
+
+    Args:
+        name (str): 단계 이름.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if current_timeline() is None:
+                return func(*args, **kwargs)
+            with step(name):
+                return func(*args, **kwargs)
+        wrapper.__timed_step__ = name
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def waiting():
+    """
+    대기 시간으로 기록할 코드 블록. 블록 안에서 실행된 WebDriver 명령은 명령 시간에 중복 합산하지 않음.
+    """
+    timeline = current_timeline()
+    if timeline is None:
+        yield
+        return
+
+    _local.wait_depth = getattr(_local, "wait_depth", 0) + 1
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        _local.wait_depth -= 1
+        if _local.wait_depth == 0:
+            timeline.add("wait_ms", (time.perf_counter() - started) * 1000)
+
+
+def record_command(elapsed_ms):
+    """
+    WebDriver 명령 한 번의 소요 시간을 현재 단계들에 기록하는 함수.
+
+    Args:
+        elapsed_ms (float): 명령 소요 시간 (밀리초).
+    """
+    timeline = current_timeline()
+    if timeline is None:
+        return
+    if getattr(_local, "wait_depth", 0) > 0:
+        # 대기 중 실행된 명령은 대기 시간에 포함되므로 호출 횟수만 기록
+        timeline.add("command_ms", 0.0, commands=1)
+        return
+    timeline.add("command_ms", elapsed_ms, commands=1)
+
+
+def instrument_driver(driver):
+    """
+    드라이버의 command executor를 감싸 모든 WebDriver 명령의 소요 시간을 기록하는 함수 (드라이버당 한 번만 적용).
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+
+    Returns:
+        WebDriver: 같은 드라이버 인스턴스.
+    """
+    executor = driver.command_executor
+    if getattr(executor, "_timing_instrumented", False):
+        return driver
+
+    original_execute = executor.execute
+
+    def execute(command, params):
+        started = time.perf_counter()
+        try:
+            return original_execute(command, params)
+        finally:
+            record_command((time.perf_counter() - started) * 1000)
+
+    executor.execute = execute
+    executor._timing_instrumented = True
+    return driver
+
+
+def percentile(values, percent):
+    """
+    선형 보간 방식의 백분위 수를 계산하는 함수.
+
+    Args:
+        values (list): 숫자 목록.
+        percent (float): 백분위 (0~100).
+
+    Returns:
+        float: 백분위 값.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def aggregate(paths):
+    """
+    여러 타임라인 파일을 읽어 단계별 p50/p95/p99를 계산하는 함수.
+
+    Args:
+        paths (list): 타임라인 JSON 파일 경로 목록.
+
+    Returns:
+        dict: 단계 이름 → {count, wall/wait/command/python 별 p50, p95, p99}.
+    """
+    samples = {}
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            timeline = json.load(f)
+        for record in timeline.get("steps", []):
+            by_name = samples.setdefault(record["name"], {"wall_ms": [], "wait_ms": [], "command_ms": [], "python_ms": []})
+            for key in by_name:
+                by_name[key].append(record.get(key, 0.0))
+
+    report = {}
+    for name, by_key in samples.items():
+        report[name] = {"count": len(by_key["wall_ms"])}
+        for key, values in by_key.items():
+            report[name][key] = {f"p{p}": percentile(values, p) for p in (50, 95, 99)}
+    return report
+
+
+def main(argv=None):
+    """
+    단계별 지연 시간 리포트 진입점.
+
+    Example:
+        python -m core.timing reports/timings
+    """
+    parser = argparse.ArgumentParser(description="단계별 시간 기록을 집계하여 p50/p95/p99를 출력합니다.")
+    parser.add_argument("directory", nargs="?", default=os.path.join(os.getenv("REPORT_DIR", "reports"), "timings"))
+    parser.add_argument("--json", help="집계 결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    paths = glob.glob(os.path.join(args.directory, "**", "*.json"), recursive=True)
+    if not paths:
+        print(f"타임라인 파일이 없습니다: {args.directory}")
+        return 1
+
+    report = aggregate(paths)
+    print(f"{len(paths)}개 타임라인 집계\n")
+    print(f"{'step':<45} {'n':>5} {'p50':>9} {'p95':>9} {'p99':>9} {'wait p50':>9} {'cmd p50':>9} {'py p50':>9}")
+    for name, stats in sorted(report.items(), key=lambda item: -item[1]["wall_ms"]["p95"]):
+        wall = stats["wall_ms"]
+        print(f"{name:<45} {stats['count']:>5} {wall['p50']:>9.0f} {wall['p95']:>9.0f} {wall['p99']:>9.0f} "
+              f"{stats['wait_ms']['p50']:>9.0f} {stats['command_ms']['p50']:>9.0f} {stats['python_ms']['p50']:>9.0f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
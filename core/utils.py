@@ -1,7 +1,11 @@
 import uuid
 import time
 import os
-from datetime import datetime
+import re
+from core.timing import waiting
+
+# 고정 대기(wait) 시간 배율 (로컬 대역 서버처럼 봇 감지가 없는 환경에서는 0으로 설정)
+WAIT_SCALE = float(os.getenv("WAIT_SCALE", "1"))
 
 def generate_random_email(domain="benx.com"):
     """
@@ -19,7 +23,7 @@ def generate_random_email(domain="benx.com"):
 
 def wait(seconds=1):
     """
-    지정된 시간 동안 실행을 멈추는 대기 함수.
+    지정된 시간 동안 실행을 멈추는 대기 함수 (WAIT_SCALE 배율 적용).
 
     Args:
         seconds (int): 대기할 시간(초)을 지정. 기본값은 1초.
@@ -27,30 +31,49 @@ def wait(seconds=1):
     Returns:
         None
     """
-    time.sleep(seconds)
+    with waiting():
+        time.sleep(seconds * WAIT_SCALE)
 
 
-def save_screenshot(driver, test_name):
+def safe_filename(name):
     """
-    에러 발생 시 스크린샷을 저장하는 함수 (디버깅 용도).
+    pytest 노드 ID 등을 파일명으로 사용할 수 있도록 변환하는 함수.
 
     Args:
-        driver: Selenium WebDriver 인스턴스.
-        test_name (str): 테스트 이름을 파일명에 포함하여 스크린샷 파일명을 고유하게 만듭니다.
+        name (str): 변환할 문자열.
 
     Returns:
-        None
+        str: 영문/숫자/.-_ 이외의 문자를 '_'로 바꾼 문자열.
+    """
+    return re.sub(r"[^\w.-]+", "_", name).strip("_")
+
+
+def get_worker_id():
+    """
+    현재 프로세스의 병렬 실행 워커 ID를 반환하는 함수.
+
+    Returns:
+        str: 병렬 실행 중이면 워커 ID(예: "gw0"), 단일 프로세스 실행이면 "main".
+    """
+    return os.getenv("TEST_WORKER_ID", "main")
+
+
+def get_worker_index():
+    """
+    현재 프로세스의 병렬 실행 워커 번호를 반환하는 함수.
+
+    Returns:
+        int: 워커 ID "gw<번호>"의 번호. 단일 프로세스 실행이면 0.
     """
-    # 스크린샷을 저장할 디렉토리 경로 설정
-    screenshots_dir = "screenshots"
-    if not os.path.exists(screenshots_dir):
-        os.makedirs(screenshots_dir)  # 스크린샷 폴더가 없으면 생성
+    worker_id = get_worker_id()
+    return int(worker_id[2:]) if worker_id.startswith("gw") and worker_id[2:].isdigit() else 0
 
-    # 타임스탬프를 이용해 고유한 파일 이름 생성
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    screenshot_name = f"{test_name}_{timestamp}.png"
-    screenshot_path = os.path.join(screenshots_dir, screenshot_name)
 
-    # 스크린샷 저장 및 저장 위치 출력
-    driver.save_screenshot(screenshot_path)
-    print(f"Screenshot saved to {screenshot_path}")
+def get_worker_count():
+    """
+    병렬 실행의 전체 워커 수를 반환하는 함수.
+
+    Returns:
+        int: 병렬 실행 중이면 워커 수, 단일 프로세스 실행이면 1.
+    """
+    return int(os.getenv("TEST_WORKER_COUNT", "1"))
@@ -0,0 +1,223 @@
+import time
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from core.expected_conditions import Condition
+from core.timing import waiting
+
+# 브라우저 안에서 요소를 찾고 노출 여부를 확인하는 공통 함수 (locate(by, selector), isVisible(el))
+# - Selenium By 값과 같은 위치 방식을 지원하며, 대기 스크립트와 검증 스크립트(core.assertions)가 함께 사용.
+LOCATOR_SCRIPT = """
+function locate(by, selector) {
+    switch (by) {
+        case 'xpath':
+            return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'name':
+            return document.getElementsByName(selector)[0] || null;
+        case 'id':
+            return document.getElementById(selector);
+        case 'class name':
+            return document.getElementsByClassName(selector)[0] || null;
+        case 'tag name':
+            return document.getElementsByTagName(selector)[0] || null;
+        case 'link text':
+        case 'partial link text':
+            var links = document.getElementsByTagName('a');
+            for (var i = 0; i < links.length; i++) {
+                var text = links[i].textContent.trim();
+                if (by === 'link text' ? text === selector : text.indexOf(selector) >= 0) return links[i];
+            }
+            return null;
+        default:
+            return document.querySelector(selector);
+    }
+}
+
+function isVisible(el) {
+    if (!el.getClientRects().length) return false;
+    var style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+}
+"""
+
+# 브라우저 안에서 조건이 충족될 때까지 대기하는 비동기 스크립트
+# - 조건을 즉시 한 번 확인하고, 충족되지 않으면 MutationObserver(DOM 변경)와 requestAnimationFrame(스타일/URL 변경)으로 재확인.
+# - 조건이 충족되면 (spec.action이 있으면 요소를 스크롤하고 동작을 준비한 뒤) 바로 결과를 반환하므로 Python 측 폴링이 없음.
+# - 클릭과 입력은 실제 입력 이벤트가 발생하도록 호출자가 반환된 요소로 수행 (WebElement.click / send_keys).
+# arguments: [spec, timeoutMs, callback]
+# 반환값: {ok: bool, reason: str, element: WebElement, click: bool}
+WAIT_SCRIPT = """
+var spec = arguments[0], timeoutMs = arguments[1], done = arguments[arguments.length - 1];
+""" + LOCATOR_SCRIPT + """
+function check() {
+    if (spec.ready && document.readyState !== 'complete') return {ok: false, reason: 'not_ready'};
+
+    switch (spec.kind) {
+        case 'ready_state':
+            return document.readyState === spec.value ? {ok: true} : {ok: false, reason: 'readyState=' + document.readyState};
+        case 'url_contains':
+            return location.href.indexOf(spec.value) >= 0 ? {ok: true} : {ok: false, reason: 'url=' + location.href};
+        case 'url_to_be':
+            return location.href === spec.value ? {ok: true} : {ok: false, reason: 'url=' + location.href};
+        case 'title_contains':
+            return document.title.indexOf(spec.value) >= 0 ? {ok: true} : {ok: false, reason: 'title=' + document.title};
+    }
+
+    var el = locate(spec.by, spec.selector);
+    if (spec.kind === 'invisible') return (!el || !isVisible(el)) ? {ok: true} : {ok: false, reason: 'visible'};
+    if (!el) return {ok: false, reason: 'not_found'};
+    if ((spec.kind === 'visible' || spec.kind === 'clickable') && !isVisible(el)) return {ok: false, reason: 'not_visible'};
+    if (spec.kind === 'clickable' && el.disabled) return {ok: false, reason: 'disabled'};
+    return {ok: true, element: el};
+}
+
+function act(el) {
+    el.scrollIntoView({block: 'center'});
+    if (spec.action === 'type') {
+        // 입력은 호출자가 실제 키 이벤트로 수행 (여기서는 포커스와 클릭만)
+        el.focus();
+        el.click();
+    }
+    // 클릭 여부만 알려주고 클릭은 호출자가 수행 (스크립트 안에서는 페이지를 이동시키지 않으므로 재시도해도 동작이 중복되지 않음)
+    return {ok: true, reason: null, element: el, click: spec.action === 'click' || (spec.action === 'check' && !el.checked)};
+}
+
+var finished = false, observer = null, timer = null, last = {ok: false, reason: 'not_checked'};
+
+function finish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    document.removeEventListener('readystatechange', evaluate);
+    if (result.ok && spec.action) {
+        try {
+            result = act(result.element);
+        } catch (e) {
+            result = {ok: false, reason: 'action_failed: ' + e.message};
+        }
+    }
+    done(result);
+}
+
+function evaluate() {
+    if (finished) return;
+    try {
+        last = check();
+    } catch (e) {
+        last = {ok: false, reason: 'error: ' + e.message};
+    }
+    if (last.ok) finish(last);
+}
+
+function onFrame() {
+    evaluate();
+    if (!finished) requestAnimationFrame(onFrame);
+}
+
+evaluate();
+if (!finished) {
+    timer = setTimeout(function () { finish({ok: false, reason: last.reason, timeout: true}); }, timeoutMs);
+    observer = new MutationObserver(evaluate);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    document.addEventListener('readystatechange', evaluate);
+    requestAnimationFrame(onFrame);
+}
+"""
+
+# 대기 중 페이지 이동으로 스크립트 실행 컨텍스트가 사라진 경우의 오류 메시지
+NAVIGATION_ERRORS = ("document unloaded", "execution context was destroyed", "cannot find context", "target frame detached")
+
+
+class BrowserWait:
+    """
+    WebDriverWait을 대체하는 브라우저 내 대기 엔진
+
+    - 조건(present, visible, clickable, url_contains, readyState 등)을 브라우저 안에서 감시하여
+      충족되는 즉시 반환하므로, 대기 한 번에 브라우저 호출도 한 번.
+    - core.expected_conditions의 조건과 함께 사용하며, 일반 callable을 넘기면 WebDriverWait으로 처리.
+    """
+
+    SCRIPT_TIMEOUT_MARGIN = 5  # 세션 스크립트 타임아웃 여유 시간 (초)
+
+    def __init__(self, driver, timeout=10):
+        """
+        BrowserWait 클래스의 생성자.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값 10초.
+        """
+        self.driver = driver
+        self.timeout = timeout
+
+    def until(self, condition, message=""):
+        """
+        조건이 충족될 때까지 대기.
+
+        Args:
+            condition (Condition or callable): core.expected_conditions의 조건 또는 driver를 인자로 받는 함수.
+            message (str, optional): 시간 초과 시 예외 메시지.
+
+        Returns:
+            WebElement or bool: 요소 조건이면 해당 요소, 그 외에는 True.
+
+        Raises:
+            TimeoutException: 시간 내에 조건이 충족되지 않은 경우 발생.
+        """
+        with waiting():
+            if not isinstance(condition, Condition):
+                return WebDriverWait(self.driver, self.timeout).until(condition, message)
+
+            result = self._run(condition.spec(), message)
+            return result.get("element") or True
+
+    def perform(self, condition, action, value=None, message=""):
+        """
+        요소 조건이 충족될 때까지 브라우저 안에서 대기한 뒤, 반환된 요소로 동작을 수행.
+
+        - 클릭과 입력은 실제 입력 이벤트가 발생하도록 WebElement.click / send_keys로 수행 (대기 후 한 번의 추가 호출).
+
+        Args:
+            condition (Condition): 동작 전에 충족되어야 하는 요소 조건.
+            action (str): 수행할 동작 ("click", "type", "check", "scroll").
+            value (str, optional): 입력할 값 (action이 "type"인 경우).
+            message (str, optional): 시간 초과 시 예외 메시지.
+
+        Raises:
+            TimeoutException: 시간 내에 동작을 수행하지 못한 경우 발생.
+        """
+        spec = dict(condition.spec(), action=action, value=value if value is not None else condition.value)
+        with waiting():
+            result = self._run(spec, message)
+        # 봇 감지가 있는 페이지에서도 사람의 입력과 같도록 실제 마우스/키 이벤트로 수행 (실패하면 WebDriverException)
+        if result.get("click"):
+            result["element"].click()
+        if action == "type":
+            result["element"].send_keys(spec["value"])
+
+    def _run(self, spec, message):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            remaining = max(deadline - time.monotonic(), 0)
+            self._ensure_script_timeout(remaining)
+            try:
+                result = self.driver.execute_async_script(WAIT_SCRIPT, spec, int(remaining * 1000))
+            except WebDriverException as e:
+                # 대기 중 페이지가 이동하면 새 문서에서 남은 시간만큼 다시 대기
+                # (동작은 결과를 받은 뒤 호출자가 수행하므로, 여기서 재시도해도 동작이 중복되지 않음)
+                if any(error in str(e).lower() for error in NAVIGATION_ERRORS) and time.monotonic() < deadline:
+                    continue
+                raise
+
+            if result and result.get("ok"):
+                return result
+            reason = (result or {}).get("reason")
+            raise TimeoutException(message or f"{spec.get('kind')} {spec.get('selector') or spec.get('value')} 조건을 {self.timeout}초 안에 만족하지 못했습니다 ({reason})")
+
+    def _ensure_script_timeout(self, remaining):
+        # 세션 스크립트 타임아웃(기본 30초)이 대기 시간보다 짧으면 늘림 (드라이버별로 한 번만)
+        required = remaining + self.SCRIPT_TIMEOUT_MARGIN
+        if getattr(self.driver, "_wait_script_timeout", 30) < required:
+            self.driver.set_script_timeout(required)
+            self.driver._wait_script_timeout = required
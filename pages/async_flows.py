@@ -0,0 +1,60 @@
+import json
+import asyncio
+
+from core import utils
+from core import expected_conditions as EC
+from core.driver import Driver
+from pages.home_page import HomePage
+from pages.signup.signup_page import SignUpPage
+from pages.signup.login_page import LoginPage
+from pages.profile_page import ProfilePage
+
+
+async def login_and_extract_wid(page, email, password):
+    """
+    로그인 → 프로필 페이지 → wid 추출을 하나의 탭(AsyncPage)에서 비동기로 수행하는 함수.
+
+    - pages.flows.login_via_ui와 같은 단계를 페이지 객체의 로케이터와 대기 조건 그대로 실행.
+
+    Args:
+        page (AsyncPage): core.async_cdp의 탭.
+        email (str): 로그인할 이메일 주소.
+        password (str): 비밀번호.
+
+    Returns:
+        str: 추출된 wid 값.
+
+    Raises:
+        Exception: wid 값을 찾을 수 없는 경우 발생.
+    """
+    await page.goto(Driver.BASE_URL)
+
+    # 1. 홈 페이지에서 로그인/회원가입 클릭
+    await page.click(HomePage.sign_in_button, timeout=HomePage.TIMEOUT)
+
+    # 2. 회원가입 페이지 - 이메일 입력 및 계속하기 클릭
+    await page.type(SignUpPage.email_field, email, condition="present", ready=True, timeout=SignUpPage.TIMEOUT)
+    await asyncio.sleep(2 * utils.WAIT_SCALE)  # 봇 감지를 위해 이메일 입력 후 2초 대기
+    await page.click(SignUpPage.continue_button, timeout=SignUpPage.TIMEOUT)
+
+    # 3. 로그인 페이지 - 비밀번호 입력 후 로그인 클릭
+    await page.type(LoginPage.password_field, password, condition="visible", timeout=LoginPage.TIMEOUT)
+    await asyncio.sleep(4 * utils.WAIT_SCALE)  # 봇 감지를 위해 비밀번호 입력 후 4초 대기
+    await page.click(LoginPage.login_button, timeout=LoginPage.TIMEOUT)
+
+    # 4. 홈 페이지 - 프로필 버튼 클릭
+    await page.click(HomePage.profile_button, timeout=HomePage.TIMEOUT)
+
+    # 5. 프로필 페이지로 이동 확인 및 wid 값 추출
+    await page.wait(EC.url_contains(f"{Driver.BASE_URL}/more"), timeout=ProfilePage.TIMEOUT)
+    await page.wait(EC.visibility_of_element_located(ProfilePage.profile_button), timeout=ProfilePage.TIMEOUT)
+    body = await page.wait_for_response(f"{Driver.API_HOST}{ProfilePage.USERS_ME_PATH}", method="GET", timeout=10)
+
+    wid = json.loads(body or "{}").get("wid")
+    if wid is None:
+        raise Exception("wid 값을 찾을 수 없습니다.")
+    return wid
+
+
+# 오케스트레이터에서 이름으로 선택할 수 있는 비동기 플로우
+FLOWS = {"login_profile": login_and_extract_wid}
@@ -0,0 +1,84 @@
+from core.wait import BrowserWait
+from core.expected_conditions import Condition
+from core.timing import timed_step
+
+
+class BasePage:
+    """
+    페이지 객체 공통 기반 클래스
+
+    - 각 동작(클릭, 입력 등)을 요소 대기 → 노출/활성 확인 → 스크롤 → 동작 → 결과 반환까지
+      하나의 브라우저 스크립트로 실행하여 chromedriver 왕복 횟수를 줄임.
+    - 대기는 브라우저 안에서 DOM 변경을 감시하는 BrowserWait을 사용하므로 Python 측 폴링이 없음.
+    - 하위 클래스의 공개 메서드는 단계 시간 기록(core.timing) 대상으로 자동 등록됨.
+    """
+
+    TIMEOUT = 10  # 기본 대기 시간 (초)
+
+    def __init_subclass__(cls, **kwargs):
+        # 하위 클래스의 공개 메서드를 "클래스명.메서드명" 단계로 자동 기록
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if name.startswith("_") or not callable(attribute) or hasattr(attribute, "__timed_step__"):
+                continue
+            setattr(cls, name, timed_step(f"{cls.__name__}.{name}")(attribute))
+
+    def __init__(self, driver, timeout=None):
+        """
+        BasePage 클래스의 생성자.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+            timeout (float, optional): 동작별 최대 대기 시간 (초). 기본값은 클래스의 TIMEOUT.
+        """
+        self.driver = driver
+        self.timeout = timeout or self.TIMEOUT
+        self.wait = BrowserWait(driver, self.timeout)
+
+    def _perform(self, locator, action, value=None, condition="clickable", ready=False, timeout=None):
+        """
+        요소가 조건을 만족할 때까지 브라우저 안에서 대기한 뒤 동작을 수행.
+
+        - 대기와 스크롤은 한 번의 스크립트 호출, 클릭과 입력은 WebElement.click / send_keys로 한 번 더 호출.
+
+        Args:
+            locator (tuple): (By, 값) 형식의 요소 위치.
+            action (str): 수행할 동작 ("click", "type", "check", "scroll").
+            value (str, optional): 입력할 값 (action이 "type"인 경우).
+            condition (str, optional): 동작 전 요소 조건 ("present", "visible", "clickable"). 기본값 "clickable".
+            ready (bool, optional): True이면 문서 로드가 완료된 후에만 동작.
+            timeout (float, optional): 최대 대기 시간 (초). 기본값은 self.timeout.
+
+        Raises:
+            TimeoutException: 시간 내에 동작을 수행하지 못한 경우 발생.
+        """
+        wait = self.wait if timeout is None else BrowserWait(self.driver, timeout)
+        wait.perform(Condition(condition, locator, ready=ready), action, value)
+
+    def _click(self, locator, **options):
+        """
+        요소를 클릭.
+
+        Args:
+            locator (tuple): (By, 값) 형식의 요소 위치.
+        """
+        self._perform(locator, "click", **options)
+
+    def _type(self, locator, text, **options):
+        """
+        요소를 클릭한 뒤 텍스트를 입력.
+
+        Args:
+            locator (tuple): (By, 값) 형식의 요소 위치.
+            text (str): 입력할 텍스트.
+        """
+        self._perform(locator, "type", text, **options)
+
+    def _check(self, locator, **options):
+        """
+        체크박스가 선택되어 있지 않으면 클릭하여 선택.
+
+        Args:
+            locator (tuple): (By, 값) 형식의 요소 위치.
+        """
+        self._perform(locator, "check", **options)
@@ -0,0 +1,135 @@
+import logging
+
+from core.driver import Driver
+from core.utils import wait
+from core.timing import timed_step
+from core.session_cache import SessionCache
+from pages.home_page import HomePage
+from pages.signup.signup_page import SignUpPage
+from pages.signup.login_page import LoginPage
+from pages.signup.password_page import PasswordPage
+from pages.signup.nickname_page import NicknamePage
+from pages.signup.agreement_page import AgreementPage
+from pages.profile_page import ProfilePage
+
+logger = logging.getLogger(__name__)
+
+
+@timed_step("flows.login_via_ui")
+def login_via_ui(driver, email, password):
+    """
+    UI를 통해 로그인하는 함수 (홈 → 이메일 입력 → 비밀번호 입력 → 로그인).
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+        email (str): 로그인할 이메일 주소.
+        password (str): 비밀번호.
+    """
+    home_page = HomePage(driver)
+    signup_page = SignUpPage(driver)
+    login_page = LoginPage(driver)
+
+    # 1. 홈 페이지에서 로그인/회원가입 클릭
+    home_page.click_sign_in()
+
+    # 2. 회원가입 페이지 - 이메일 입력 및 계속하기 클릭
+    signup_page.enter_email(email)
+    wait(2)  # 봇 감지를 위해 이메일 입력 후 2초 대기
+    signup_page.click_continue()
+
+    # 3. 로그인 페이지 - 비밀번호 입력 후 로그인 클릭
+    login_page.enter_password(password)
+    wait(4)  # 봇 감지를 위해 비밀번호 입력 후 4초 대기
+    login_page.click_login()
+
+
+@timed_step("flows.login")
+def login(driver, email, password, cache=None, use_cache=True):
+    """
+    로그인 상태로 만드는 함수. 유효한 세션 스냅샷이 있으면 복원하고, 없거나 거부되면 UI로 로그인.
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+        email (str): 로그인할 이메일 주소.
+        password (str): 비밀번호.
+        cache (SessionCache, optional): 사용할 세션 캐시. 기본값은 SESSION_CACHE=true 인 경우 새 SessionCache.
+        use_cache (bool, optional): False이면 세션 캐시를 사용하지 않고 항상 UI로 로그인 (로그인 UI 검증용).
+
+    Returns:
+        str: 로그인 방식 ("snapshot" 또는 "ui").
+    """
+    home_page = HomePage(driver)
+    if not use_cache:
+        cache = None
+    else:
+        cache = cache or (SessionCache() if SessionCache.ENABLED else None)
+
+    snapshot = cache.load(email) if cache else None
+    if snapshot:
+        cache.restore(driver, snapshot, url=Driver.BASE_URL)
+        if home_page.is_logged_in():
+            return "snapshot"
+        # 서버에서 세션이 거부된 경우 스냅샷을 폐기하고 UI 로그인으로 대체
+        logger.info(f"세션 스냅샷이 거부되어 UI로 로그인합니다: {email}")
+        cache.invalidate(email)
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.get(Driver.BASE_URL)
+
+    login_via_ui(driver, email, password)
+
+    if cache and home_page.is_logged_in(timeout=20):
+        cache.save(driver, email)
+    return "ui"
+
+
+@timed_step("flows.signup_and_verify")
+def signup_and_verify(driver, email, password, nickname, verification_source, timeout=30):
+    """
+    회원가입부터 이메일 인증, wid 추출까지 수행하는 함수.
+
+    - 홈 → 이메일 입력 → 가입하기 → 비밀번호 → 닉네임 → 약관 동의 → 인증 URL 대기 → 인증 → 프로필 페이지.
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+        email (str): 가입할 이메일 주소.
+        password (str): 비밀번호.
+        nickname (str): 닉네임.
+        verification_source: 인증 URL 조회 객체 (Slack, SlackPollerClient 등 wait_for_verification_url 제공).
+        timeout (float, optional): 인증 URL 대기 시간 (초). 기본값 30초.
+
+    Returns:
+        str: 가입한 계정의 wid.
+
+    Raises:
+        Exception: 인증 URL을 받지 못했거나 wid를 추출하지 못한 경우 발생.
+    """
+    home_page = HomePage(driver)
+    signup_page = SignUpPage(driver)
+    password_page = PasswordPage(driver)
+    nickname_page = NicknamePage(driver)
+    agreement_page = AgreementPage(driver)
+    profile_page = ProfilePage(driver)
+
+    home_page.click_sign_in()
+    signup_page.enter_email(email)
+    signup_page.click_continue()
+    signup_page.click_signup()
+
+    password_page.enter_password(password)
+    password_page.click_next()
+
+    nickname_page.enter_nickname(nickname)
+    nickname_page.click_next()
+
+    agreement_page.click_agree_all()
+    agreement_page.click_next()
+
+    verification_url = verification_source.wait_for_verification_url(email, timeout=timeout)
+    if not verification_url:
+        raise Exception(f"인증 URL을 가져오지 못했습니다: {email}")
+    driver.get(verification_url)
+
+    home_page.click_profile_button()
+    profile_page.verify_profile_page()
+    return profile_page.extract_wid()
@@ -1,34 +1,27 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from core.wait import BrowserWait
+from core import expected_conditions as EC
+from pages.base_page import BasePage
 
-class HomePage:
+class HomePage(BasePage):
     """
     메인 홈 페이지
     """
 
-    def __init__(self, driver):
-        """
-        HomePage 클래스의 생성자.
+    TIMEOUT = 20
 
-        Args:
-            driver: Selenium WebDriver 인스턴스.
-        """
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 20)
-        # 로그인 버튼 위치 (XPath)
-        self.sign_in_button = (By.XPATH, "//button[contains(text(), 'Sign in')]")
-        # 프로필 버튼 위치 (XPath)
-        self.profile_button = (By.XPATH, "//button[@type='button' and contains(@class, 'HeaderView_profile_button')]")
+    # 로그인 버튼 위치 (XPath)
+    sign_in_button = (By.XPATH, "//button[contains(text(), 'Sign in')]")
+    # 프로필 버튼 위치 (XPath)
+    profile_button = (By.XPATH, "//button[@type='button' and contains(@class, 'HeaderView_profile_button')]")
 
     def click_sign_in(self):
         """
         로그인 버튼 클릭..
         """
         try:
-            self.wait.until(EC.visibility_of_element_located(self.sign_in_button))
-
-            self.wait.until(EC.element_to_be_clickable(self.sign_in_button)).click()
+            self._click(self.sign_in_button)
         except Exception as e:
             raise Exception(f"로그인 버튼 클릭 중 오류가 발생했습니다: {str(e)}")
 
@@ -37,8 +30,22 @@ class HomePage:
         프로필 버튼을 클릭.
         """
         try:
-            self.wait.until(EC.visibility_of_element_located(self.profile_button))
-
-            self.wait.until(EC.element_to_be_clickable(self.profile_button)).click()
+            self._click(self.profile_button)
         except Exception as e:
             raise Exception(f"프로필 버튼 클릭 중 오류가 발생했습니다: {str(e)}")
+
+    def is_logged_in(self, timeout=5):
+        """
+        로그인 상태(프로필 버튼 노출)인지 확인.
+
+        Args:
+            timeout (float, optional): 프로필 버튼을 기다릴 시간 (초). 기본값 5초.
+
+        Returns:
+            bool: 프로필 버튼이 노출되면 True.
+        """
+        try:
+            BrowserWait(self.driver, timeout).until(EC.visibility_of_element_located(self.profile_button))
+            return True
+        except TimeoutException:
+            return False
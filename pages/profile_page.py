@@ -1,15 +1,18 @@
-import os
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import re
 import json
-import time
-from selenium.common.exceptions import WebDriverException
+from selenium.common.exceptions import TimeoutException
+from core import expected_conditions as EC
+from core.driver import Driver
+from core.network import NetworkMonitor
+from pages.base_page import BasePage
 
-BASE_URL = os.getenv("BASE_URL", "https://weverse.io")
-API_HOST = os.getenv("API_HOST", "https://global.apis.naver.com")
+class ProfilePage(BasePage):
 
-class ProfilePage:
+    # 프로필 버튼
+    profile_button = (By.XPATH, "//button[@type='button' and contains(@class, 'HeaderView_profile_button')]")
+    # wid를 반환하는 사용자 정보 API 경로
+    USERS_ME_PATH = "/weverse/wevweb/users/v1.0/users/me"
 
     def __init__(self, driver):
         """
@@ -18,32 +21,33 @@ class ProfilePage:
         Args:
             driver: Selenium WebDriver 인스턴스.
         """
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)  # 대기 시간 10초로 설정
-        # 프로필 버튼
-        self.profile_button = (By.XPATH, "//button[@type='button' and contains(@class, 'HeaderView_profile_button')]")
+        super().__init__(driver)  # 대기 시간 10초로 설정
         # wid 취득을 위한 API_ENDPOINT를 완성
-        self.api_endpoint = f"{API_HOST}/weverse/wevweb/users/v1.0/users/me"
+        self.api_endpoint = f"{Driver.API_HOST}{self.USERS_ME_PATH}"
 
     def verify_profile_page(self):
         """
         프로필 페이지가 정상적으로 로드(예상된URL 경로, 프로필 버튼 노출)되었는지 확인.
         """
         try:
-            self.wait.until(lambda d: d.execute_script('return document.readyState') == 'complete')
+            self.wait.until(EC.document_ready_state('complete'))
 
-            self.wait.until(EC.url_contains(f"{BASE_URL}/more"))
+            self.wait.until(EC.url_contains(f"{Driver.BASE_URL}/more"))
 
             self.wait.until(EC.visibility_of_element_located(self.profile_button))
         except Exception as e:
             # 페이지 로드 확인 중 오류 발생
             raise Exception(f"프로필 페이지 로딩 확인 중 오류가 발생했습니다: {str(e)}")
 
-    def extract_wid(self):
+    def extract_wid(self, timeout=10):
         """
         네트워크 트래픽에서 WID 값을 추출.
 
-        - 네트워크 트래픽을 활성화, 특정 요청을 통해 WID 값을 추출.
+        - 현재 탭(프로필이 새 탭이나 창에서 열린 경우 그 탭)에 사용자 정보 API의 GET 요청만 기록하는 모니터를 연결하고,
+          페이지를 다시 불러와 API 응답이 도착하는 즉시 WID 값을 추출.
+
+        Args:
+            timeout (float, optional): 응답 대기 시간 (초). 기본값 10초.
 
         Returns:
             str: 추출된 WID 값.
@@ -51,42 +55,25 @@ class ProfilePage:
         Raises:
             Exception: WID 값을 찾을 수 없는 경우 예외 발생.
         """
-        # Chrome DevTools Protocol
-        self.driver.execute_cdp_cmd('Network.enable', {})
-
-        # 네트워크 요청이 충분히 발생 하도록 대기
-        time.sleep(5)
-
-        logs = self.driver.get_log('performance')
-
-        for log in logs:
-            # 성능 로그 메시지를 파싱
-            log_message = json.loads(log['message'])
-            message = log_message['message']
-
-            # 'Network.responseReceived' 메시지를 찾기 위한 조건
-            if message['method'] == 'Network.responseReceived':
-                response_url = message['params']['response']['url']
-
-                #특정 API URL에 대한 응답인지 확인
-                if self.api_endpoint in response_url:
-                    request_id = message['params']['requestId']
-                    try:
-                        # 응답 본문을 요청
-                        response_data = self.driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
-
-                        # 응답 데이터 JSON으로 파싱하고 'wid' 값 추출
-                        response_body = json.loads(response_data['body'])
-                        if "wid" in response_body:
-                            return response_body["wid"]
-
-                    except WebDriverException as e:
-                        # 'No resource with given identifier found' 오류는 무시
-                        if "No resource with given identifier found" in str(e):
-                            pass
-                        else:
-                            # 그 외의 오류가 발생한 경우 출력
-                            print(f"Error getting response body for requestId {request_id}: {str(e)}")
-
-        # WID 값을 찾을 수 없는 경우 예외를 발생
-        raise Exception("wid 값을 찾을 수 없습니다.")
+        def has_wid(response):
+            # 로그인 전 익명 호출, 오류(401 등) 응답, JSON이 아닌 본문은 건너뛰고 다음 응답을 기다림
+            if not response.status or not 200 <= response.status < 300:
+                return False
+            try:
+                return "wid" in json.loads(response.body or "{}")
+            except ValueError:
+                return False
+
+        # CORS preflight(OPTIONS) 요청과 다른 API는 기록하지 않음
+        network = NetworkMonitor(
+            self.driver, max_entries=20, url_patterns=[re.escape(self.api_endpoint)], methods=["GET"])
+        try:
+            # 모니터를 연결하기 전에 받은 응답은 기록되지 않으므로 페이지를 다시 불러와 API 호출을 관찰
+            self.driver.refresh()
+            response = network.wait_for_response(self.api_endpoint, timeout=timeout, method="GET", predicate=has_wid)
+            # 본문은 탭 세션에서 분리하기 전에 읽음
+            return json.loads(response.body)["wid"]
+        except TimeoutException as e:
+            raise Exception(f"wid 값을 찾을 수 없습니다: {str(e)}")
+        finally:
+            network.close()
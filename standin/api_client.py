@@ -0,0 +1,193 @@
+import os
+import json
+from http.cookies import SimpleCookie
+from urllib.parse import urlparse, urlencode
+
+import urllib3
+
+from core.browser_state import restore_browser_state
+from core.timing import timed_step
+from standin.weverse_server import USERS_ME_PATH
+
+
+class StandInApiClient:
+    """
+    로컬 대역 서버(standin.weverse_server)의 회원가입/로그인 경로를 브라우저 없이 HTTP로 호출하는 클라이언트
+
+    - 화면 조작이 테스트 대상이 아닌 준비 단계(계정 생성, 로그인)를 HTTP로 처리하고,
+      결과 쿠키를 브라우저에 주입하여 이후 단계만 UI로 진행하기 위한 용도.
+    - 대역 서버의 폼 POST와 303 리다이렉트 쿠키 방식을 사용하므로 실제 Weverse 백엔드에는 사용할 수 없음.
+    - 연결은 프로세스 공용 urllib3 PoolManager로 재사용하고, 쿠키는 클라이언트별로 관리.
+    """
+
+    # 프로세스 내에서 HTTP 연결을 재사용
+    _http = urllib3.PoolManager(maxsize=int(os.getenv("API_CLIENT_POOL_SIZE", "10")))
+
+    SIGNIN_PATH = "/signin"
+    LOGIN_PATH = "/signin/password"
+    PASSWORD_PATH = "/signup/password"
+    NICKNAME_PATH = "/signup/nickname"
+    AGREEMENT_PATH = "/signup/agreement"
+    USERS_ME_PATH = USERS_ME_PATH
+
+    def __init__(self, base_url, api_host=None, timeout=10):
+        """
+        StandInApiClient 클래스의 생성자.
+
+        Args:
+            base_url (str): 대역 서버 주소 (예: --standin 실행 시의 Driver.BASE_URL).
+            api_host (str, optional): 사용자 정보 API 호스트. 기본값은 base_url.
+            timeout (float, optional): 요청별 타임아웃 (초). 기본값 10초.
+        """
+        self.base_url = base_url.rstrip("/")
+        self.api_host = (api_host or base_url).rstrip("/")
+        self.timeout = timeout
+        self.cookies = {}
+
+    def _request(self, method, url, fields=None):
+        headers = {}
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+        if fields is not None:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+            body = urlencode(fields)
+            response = StandInApiClient._http.request(
+                method, url, body=body, headers=headers, redirect=False, timeout=self.timeout, retries=False)
+        else:
+            response = StandInApiClient._http.request(
+                method, url, headers=headers, redirect=False, timeout=self.timeout, retries=False)
+
+        # 리다이렉트를 따라가지 않고 응답마다 Set-Cookie를 반영
+        for header in response.headers.getlist("Set-Cookie"):
+            cookie = SimpleCookie(header)
+            for name, morsel in cookie.items():
+                self.cookies[name] = morsel.value
+        if response.status >= 400:
+            raise Exception(f"{method} {url} 요청이 실패했습니다: HTTP {response.status}")
+        return response
+
+    def _post(self, path, fields):
+        return self._request("POST", f"{self.base_url}{path}", fields)
+
+    def signup(self, email, password, nickname):
+        """
+        이메일 입력 → 비밀번호 → 닉네임 → 약관 동의까지 회원가입 요청을 전송 (인증 메일 발송 단계까지).
+
+        Args:
+            email (str): 가입할 이메일 주소.
+            password (str): 비밀번호.
+            nickname (str): 닉네임.
+        """
+        try:
+            self._post(self.SIGNIN_PATH, {"userEmail": email})
+            self._post(self.PASSWORD_PATH, {"newPassword": password, "confirmPassword": password})
+            self._post(self.NICKNAME_PATH, {"nickname": nickname})
+            self._post(self.AGREEMENT_PATH, {"agree": "on"})
+        except Exception as e:
+            raise Exception(f"대역 서버 회원가입 중 오류가 발생했습니다: {str(e)}")
+
+    def verify(self, verification_url):
+        """
+        인증 URL을 호출하여 이메일 인증을 완료 (응답 쿠키로 로그인 상태가 됨).
+
+        Args:
+            verification_url (str): Slack 등에서 받은 인증 URL.
+        """
+        try:
+            self._request("GET", verification_url)
+        except Exception as e:
+            raise Exception(f"대역 서버 이메일 인증 중 오류가 발생했습니다: {str(e)}")
+
+    def login(self, email, password):
+        """
+        이메일/비밀번호로 로그인하여 세션 쿠키를 받음.
+
+        Args:
+            email (str): 이메일 주소.
+            password (str): 비밀번호.
+        """
+        try:
+            self._post(self.LOGIN_PATH, {"userEmail": email, "password": password})
+        except Exception as e:
+            raise Exception(f"대역 서버 로그인 중 오류가 발생했습니다: {str(e)}")
+
+    def users_me(self):
+        """
+        사용자 정보 API를 호출.
+
+        Returns:
+            dict: 사용자 정보 (wid 포함).
+        """
+        response = self._request("GET", f"{self.api_host}{self.USERS_ME_PATH}")
+        return json.loads(response.data.decode("utf-8"))
+
+    def browser_state(self):
+        """
+        클라이언트의 쿠키를 core.browser_state 형식으로 변환.
+
+        Returns:
+            dict: restore_browser_state에 전달할 수 있는 브라우저 상태.
+        """
+        domain = urlparse(self.base_url).hostname
+        secure = self.base_url.startswith("https://")
+        cookies = [
+            {"name": name, "value": value, "domain": domain, "path": "/", "secure": secure, "httpOnly": True}
+            for name, value in self.cookies.items()
+        ]
+        return {"url": self.base_url, "cookies": cookies, "storage": {}}
+
+    def inject_into(self, driver, url=None):
+        """
+        클라이언트의 쿠키를 브라우저에 주입하고 지정한 URL로 이동.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+            url (str, optional): 주입 후 이동할 URL. 기본값은 base_url.
+        """
+        restore_browser_state(driver, self.browser_state(), url=url or self.base_url)
+
+
+@timed_step("standin.reach_state")
+def reach_state(driver, state, email, password, nickname="아보카도", verification_source=None, url=None):
+    """
+    대역 서버에서 준비 단계를 UI 대신 HTTP로 수행하여 원하는 상태에 도달한 뒤, 결과 쿠키를 브라우저에 주입하는 함수.
+
+    - "registered": 회원가입 요청까지 완료 (이메일 인증 전).
+    - "verified": 회원가입과 이메일 인증 완료 (로그인 상태).
+    - "logged_in": 기존 계정으로 로그인.
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+        state (str): 도달할 상태 ("registered", "verified", "logged_in").
+        email (str): 이메일 주소.
+        password (str): 비밀번호.
+        nickname (str, optional): 닉네임 (회원가입 시 사용). 기본값 "아보카도".
+        verification_source: 인증 URL 조회 객체 ("verified" 상태에 필요).
+        url (str, optional): 쿠키 주입 후 이동할 URL. 기본값은 BASE_URL.
+
+    Returns:
+        StandInApiClient: 같은 세션의 클라이언트 (예: users_me()로 wid 조회).
+
+    Raises:
+        ValueError: 지원하지 않는 상태이거나 "verified"에 verification_source가 없는 경우 발생.
+    """
+    from core.driver import Driver
+
+    client = StandInApiClient(Driver.BASE_URL, Driver.API_HOST)
+
+    if state == "logged_in":
+        client.login(email, password)
+    elif state in ("registered", "verified"):
+        client.signup(email, password, nickname)
+        if state == "verified":
+            if verification_source is None:
+                raise ValueError("verified 상태에는 verification_source가 필요합니다.")
+            verification_url = verification_source.wait_for_verification_url(email)
+            if not verification_url:
+                raise Exception(f"인증 URL을 가져오지 못했습니다: {email}")
+            client.verify(verification_url)
+    else:
+        raise ValueError(f"지원하지 않는 상태입니다: {state}")
+
+    client.inject_into(driver, url=url or Driver.BASE_URL)
+    return client
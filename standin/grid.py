@@ -0,0 +1,104 @@
+import sys
+import time
+import logging
+import argparse
+
+from selenium.webdriver.chrome.service import Service
+
+logger = logging.getLogger(__name__)
+
+
+class LocalGrid:
+    """
+    원격 실행 경로(core.remote)를 로컬에서 검증하기 위한 다중 노드 대역
+
+    - 노드마다 별도의 chromedriver 프로세스를 임의 포트로 띄움. chromedriver는 W3C WebDriver 원격 엔드포인트와
+      /status를 제공하므로 webdriver.Remote와 SessionDistributor가 실제 노드와 같은 방식으로 동작.
+    - chromedriver 경로는 core.driver_service의 캐시된 경로 확인 결과를 사용.
+    """
+
+    def __init__(self, nodes=2, capacity=2, driver_path=None):
+        """
+        LocalGrid 클래스의 생성자.
+
+        Args:
+            nodes (int, optional): 노드 수. 기본값 2.
+            capacity (int, optional): 노드별 동시 세션 수. 기본값 2.
+            driver_path (str, optional): chromedriver 경로. 기본값은 DriverService로 확인한 경로.
+        """
+        self.node_count = nodes
+        self.capacity = capacity
+        self.driver_path = driver_path
+        self.services = []
+
+    @property
+    def urls(self):
+        return [service.service_url for service in self.services]
+
+    @property
+    def nodes_setting(self):
+        """
+        REMOTE_NODES 환경 변수 형식의 노드 설정 (예: "http://localhost:50001=2,http://localhost:50002=2").
+        """
+        return ",".join(f"{url}={self.capacity}" for url in self.urls)
+
+    def start(self):
+        """
+        노드(chromedriver 프로세스)를 시작.
+
+        Returns:
+            LocalGrid: 자기 자신.
+        """
+        if self.driver_path is None:
+            from core.driver import Driver
+            from core.driver_service import DriverService
+
+            self.driver_path = DriverService.get().resolve(Driver.get_options())["driver_path"]
+
+        for _ in range(self.node_count):
+            service = Service(executable_path=self.driver_path)
+            service.start()
+            self.services.append(service)
+        logger.info(f"로컬 그리드 노드를 시작했습니다: {self.nodes_setting}")
+        return self
+
+    def shutdown(self):
+        """
+        모든 노드를 종료.
+        """
+        for service in self.services:
+            try:
+                service.stop()
+            except Exception as e:
+                logger.info(f"노드 종료 중 오류를 무시합니다: {str(e)}")
+        self.services = []
+
+
+def main(argv=None):
+    """
+    로컬 그리드 실행 진입점.
+
+    Example:
+        python -m standin.grid --nodes 3 --capacity 2
+        REMOTE_NODES=<출력된 노드 설정> pytest
+    """
+    parser = argparse.ArgumentParser(description="chromedriver 노드 여러 개로 로컬 그리드 대역을 실행합니다.")
+    parser.add_argument("--nodes", type=int, default=2, help="노드 수")
+    parser.add_argument("--capacity", type=int, default=2, help="노드별 동시 세션 수")
+    parser.add_argument("--driver-path", help="chromedriver 경로 (기본값: Selenium Manager로 확인)")
+    args = parser.parse_args(argv)
+
+    grid = LocalGrid(args.nodes, args.capacity, args.driver_path).start()
+    print(f"REMOTE_NODES={grid.nodes_setting}")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        grid.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
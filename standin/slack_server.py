@@ -0,0 +1,356 @@
+import os
+import sys
+import json
+import time
+import heapq
+import base64
+import bisect
+import random
+import logging
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+logger = logging.getLogger(__name__)
+
+
+class SlackStandInServer(ThreadingHTTPServer):
+    """
+    Slack Web API 일부(conversations.history, chat.postMessage)를 흉내 내는 로컬 대역 서버
+
+    - conversations.history: 최신 메시지부터 반환하며 oldest/latest/limit/cursor 페이지네이션을 지원.
+    - 메서드별 분당 호출 한도를 넘으면 실제 Slack처럼 429 + Retry-After 헤더로 응답.
+    - 인증 메시지를 지정한 지연 후 채널에 배달하거나, 대량의 일반 메시지를 주입하여 부하 상황을 재현 가능.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, rate_limit=0):
+        """
+        SlackStandInServer 클래스의 생성자.
+
+        Args:
+            host (str, optional): 바인딩할 호스트. 기본값 "127.0.0.1".
+            port (int, optional): 바인딩할 포트. 기본값 0 (임의 포트).
+            rate_limit (int, optional): 메서드별 분당 최대 호출 수. 0이면 제한 없음.
+        """
+        super().__init__((host, port), _SlackRequestHandler)
+        self.rate_limit = rate_limit
+        self.channels = {}
+        self._keys = {}
+        self.stats = {"calls": 0, "ratelimited": 0, "delivered": 0}
+        self.lock = threading.Lock()
+        self._calls = {}
+        self._last_ts = 0.0
+        self._scheduled = []
+        self._schedule_changed = threading.Condition(self.lock)
+        self._stopped = threading.Event()
+        threading.Thread(target=self._deliver_scheduled, name="slack-standin-delivery", daemon=True).start()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        # slack_sdk WebClient의 base_url 형식
+        return f"{self.url}/api/"
+
+    def serve_in_background(self):
+        threading.Thread(target=self.serve_forever, name="slack-standin", daemon=True).start()
+        return self
+
+    def shutdown(self):
+        self._stopped.set()
+        with self.lock:
+            self._schedule_changed.notify_all()
+        super().shutdown()
+
+    def post_message(self, channel, text, delay=0):
+        """
+        채널에 메시지를 배달 (delay가 있으면 지연 후 배달).
+
+        Args:
+            channel (str): 채널 ID.
+            text (str): 메시지 본문.
+            delay (float, optional): 배달 지연 시간 (초). 기본값 0.
+
+        Returns:
+            str or None: 즉시 배달된 경우 메시지 ts, 지연 배달이면 None.
+        """
+        if delay <= 0:
+            return self._append(channel, text)
+        with self.lock:
+            heapq.heappush(self._scheduled, (time.monotonic() + delay, channel, text))
+            self._schedule_changed.notify()
+        return None
+
+    def inject_noise(self, channel, per_minute, duration, text_factory=None):
+        """
+        일정 속도로 일반 메시지를 주입하는 백그라운드 스레드를 시작.
+
+        Args:
+            channel (str): 채널 ID.
+            per_minute (float): 분당 메시지 수.
+            duration (float): 주입 시간 (초).
+            text_factory (callable, optional): 메시지 본문 생성 함수. 기본값은 다른 사용자의 인증 메시지.
+
+        Returns:
+            threading.Thread: 주입 스레드.
+        """
+        text_factory = text_factory or (
+            lambda n: f"noise-{n}@benx.com 인증 URL: https://example.invalid/verify?token=noise{n}"
+        )
+
+        def run():
+            interval = 60.0 / per_minute
+            deadline = time.monotonic() + duration
+            count = 0
+            next_at = time.monotonic()
+            while not self._stopped.is_set() and time.monotonic() < deadline:
+                self._append(channel, text_factory(count))
+                count += 1
+                next_at += interval
+                self._stopped.wait(max(0.0, next_at - time.monotonic()))
+
+        thread = threading.Thread(target=run, name="slack-standin-noise", daemon=True)
+        thread.start()
+        return thread
+
+    def history(self, channel, oldest=None, latest=None, limit=100, cursor=None, inclusive=False):
+        """
+        conversations.history 응답 본문을 생성 (최신 메시지부터).
+        """
+        limit = max(1, min(int(limit or 100), 999))
+        if cursor:
+            latest = base64.urlsafe_b64decode(cursor.encode()).decode()
+            inclusive_latest = False
+        else:
+            inclusive_latest = inclusive
+
+        with self.lock:
+            messages = self.channels.get(channel, [])
+            keys = self._keys.get(channel, [])
+            lower = 0
+            if oldest:
+                lower = (bisect.bisect_left if inclusive else bisect.bisect_right)(keys, float(oldest))
+            upper = len(messages)
+            if latest:
+                upper = (bisect.bisect_right if inclusive_latest else bisect.bisect_left)(keys, float(latest))
+            window = messages[lower:upper]
+
+        page = list(reversed(window[-limit:]))
+        has_more = len(window) > limit
+        body = {"ok": True, "messages": page, "has_more": has_more, "response_metadata": {"next_cursor": ""}}
+        if has_more:
+            body["response_metadata"]["next_cursor"] = base64.urlsafe_b64encode(page[-1]["ts"].encode()).decode()
+        return body
+
+    def check_rate_limit(self, method):
+        """
+        메서드별 분당 호출 수를 확인하고, 한도를 넘으면 Retry-After 초를 반환.
+        """
+        with self.lock:
+            self.stats["calls"] += 1
+            if not self.rate_limit:
+                return None
+            now = time.monotonic()
+            window = [t for t in self._calls.get(method, []) if now - t < 60]
+            if len(window) >= self.rate_limit:
+                self._calls[method] = window
+                self.stats["ratelimited"] += 1
+                return max(1, int(60 - (now - window[0])) + 1)
+            window.append(now)
+            self._calls[method] = window
+            return None
+
+    def _append(self, channel, text):
+        with self.lock:
+            # ts는 채널 내에서 증가하는 고유 값 (마이크로초 단위)
+            ts_value = max(time.time(), self._last_ts + 0.000001)
+            self._last_ts = ts_value
+            ts = f"{ts_value:.6f}"
+            self.channels.setdefault(channel, []).append({"type": "message", "ts": ts, "text": text})
+            self._keys.setdefault(channel, []).append(float(ts))
+            self.stats["delivered"] += 1
+            return ts
+
+    def _deliver_scheduled(self):
+        while not self._stopped.is_set():
+            with self.lock:
+                while not self._stopped.is_set() and (
+                        not self._scheduled or self._scheduled[0][0] > time.monotonic()):
+                    timeout = self._scheduled[0][0] - time.monotonic() if self._scheduled else None
+                    self._schedule_changed.wait(timeout)
+                if self._stopped.is_set():
+                    return
+                _, channel, text = heapq.heappop(self._scheduled)
+            self._append(channel, text)
+
+
+class _SlackRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        self._dispatch(parsed.path, {key: values[0] for key, values in parse_qs(parsed.query).items()})
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        raw = self.rfile.read(length).decode("utf-8")
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            params = json.loads(raw or "{}")
+        else:
+            params = {key: values[0] for key, values in parse_qs(raw).items()}
+        params.update({key: values[0] for key, values in parse_qs(parsed.query).items()})
+        self._dispatch(parsed.path, params)
+
+    def _dispatch(self, path, params):
+        method = path.rsplit("/", 1)[-1]
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._respond(200, {"ok": False, "error": "not_authed"})
+            return
+
+        retry_after = self.server.check_rate_limit(method)
+        if retry_after is not None:
+            self._respond(429, {"ok": False, "error": "ratelimited"}, {"Retry-After": str(retry_after)})
+            return
+
+        if method == "conversations.history":
+            if not params.get("channel"):
+                self._respond(200, {"ok": False, "error": "channel_not_found"})
+                return
+            body = self.server.history(
+                params["channel"],
+                oldest=params.get("oldest"),
+                latest=params.get("latest"),
+                limit=params.get("limit"),
+                cursor=params.get("cursor"),
+                inclusive=str(params.get("inclusive", "")).lower() in ("true", "1"),
+            )
+            self._respond(200, body)
+        elif method == "chat.postMessage":
+            ts = self.server.post_message(params.get("channel", ""), params.get("text", ""))
+            self._respond(200, {"ok": True, "channel": params.get("channel"), "ts": ts})
+        elif method == "auth.test":
+            self._respond(200, {"ok": True, "user_id": "USTANDIN", "team_id": "TSTANDIN"})
+        else:
+            self._respond(200, {"ok": False, "error": "unknown_method"})
+
+    def _respond(self, status, body, headers=None):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def verification_message(email, verification_url):
+    """
+    인증 메일 알림과 같은 형식의 Slack 메시지 본문을 생성하는 함수.
+    """
+    return f"[Weverse] {email} 이메일 인증 요청: <{verification_url}|이메일 인증하기>"
+
+
+def run_benchmark(args):
+    """
+    대량 메시지가 유입되는 채널에서 인증 URL 조회 지연 시간과 API 호출 수를 측정.
+    """
+    from core.slack import Slack
+    from core.slack_poller import SlackPoller
+    from core.timing import percentile
+    from concurrent.futures import ThreadPoolExecutor
+
+    server = SlackStandInServer(rate_limit=args.rate_limit).serve_in_background()
+    channel = f"CBENCH{int(time.time())}"
+    os.environ.update({"SLACK_API_TOKEN": "xoxb-standin", "SLACK_CHANNEL_ID": channel,
+                       "SLACK_API_BASE_URL": server.api_url})
+
+    duration = args.lookups * args.spacing + args.max_delay + 5
+    server.inject_noise(channel, args.noise_per_minute, duration)
+    poller = SlackPoller(Slack()).start() if args.mode == "poller" else None
+
+    def lookup(index):
+        time.sleep(index * args.spacing)
+        email = f"bench-{index}@benx.com"
+        delay = random.uniform(args.min_delay, args.max_delay)
+        server.post_message(channel, verification_message(email, f"https://standin.invalid/verify?token={index}"), delay)
+        expected_at = time.monotonic() + delay
+        source = poller or Slack()
+        url = source.wait_for_verification_url(email, timeout=args.max_delay + 30, poll_interval=args.poll_interval)
+        return (time.monotonic() - expected_at) * 1000 if url else None
+
+    with ThreadPoolExecutor(max_workers=args.lookups) as executor:
+        results = list(executor.map(lookup, range(args.lookups)))
+    if poller:
+        poller.stop()
+
+    latencies = [value for value in results if value is not None]
+    report = {
+        "mode": args.mode,
+        "lookups": args.lookups,
+        "found": len(latencies),
+        "noise_per_minute": args.noise_per_minute,
+        "messages_delivered": server.stats["delivered"],
+        "api_calls": server.stats["calls"],
+        "ratelimited": server.stats["ratelimited"],
+        "lag_ms": {f"p{p}": percentile(latencies, p) for p in (50, 95, 99)},
+    }
+    server.shutdown()
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0 if len(latencies) == args.lookups else 1
+
+
+def main(argv=None):
+    """
+    Slack 대역 서버 실행 및 벤치마크 진입점.
+
+    Example:
+        python -m standin.slack_server --port 8766 --rate-limit 50
+        SLACK_API_BASE_URL=http://127.0.0.1:8766/api/ pytest
+        python -m standin.slack_server bench --mode poller --lookups 20 --noise-per-minute 3000
+    """
+    parser = argparse.ArgumentParser(description="로컬 Slack Web API 대역 서버를 실행합니다.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--rate-limit", type=int, default=0, help="메서드별 분당 최대 호출 수 (0: 제한 없음)")
+    subparsers = parser.add_subparsers(dest="command")
+
+    bench = subparsers.add_parser("bench", help="인증 URL 조회 지연 시간을 측정합니다.")
+    bench.add_argument("--mode", choices=("direct", "poller"), default="direct",
+                       help="direct: 요청마다 Slack 조회, poller: 공유 SlackPoller")
+    bench.add_argument("--lookups", type=int, default=10, help="동시에 기다릴 인증 URL 수")
+    bench.add_argument("--spacing", type=float, default=0.5, help="인증 요청 간격 (초)")
+    bench.add_argument("--min-delay", type=float, default=0.5, help="최소 배달 지연 (초)")
+    bench.add_argument("--max-delay", type=float, default=3.0, help="최대 배달 지연 (초)")
+    bench.add_argument("--noise-per-minute", type=float, default=2000, help="분당 일반 메시지 수")
+    bench.add_argument("--poll-interval", type=float, default=2, help="direct 모드의 조회 간격 (초)")
+    bench.add_argument("--rate-limit", type=int, default=50, help="메서드별 분당 최대 호출 수 (0: 제한 없음)")
+    bench.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args(argv)
+
+    if args.command == "bench":
+        return run_benchmark(args)
+
+    server = SlackStandInServer(args.host, args.port, rate_limit=args.rate_limit)
+    print(f"Slack stand-in listening on {server.api_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
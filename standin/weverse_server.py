@@ -0,0 +1,373 @@
+import sys
+import json
+import uuid
+import html
+import logging
+import argparse
+import threading
+from http.cookies import SimpleCookie
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, urlencode
+
+logger = logging.getLogger(__name__)
+
+SESSION_COOKIE = "standin_session"
+SIGNUP_COOKIE = "standin_signup"
+USERS_ME_PATH = "/weverse/wevweb/users/v1.0/users/me"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head><meta charset="utf-8"><title>{title}</title></head>
+<body>
+<header>{header}</header>
+<main>{body}</main>
+</body>
+</html>"""
+
+SIGN_IN_HEADER = """<button type="button" onclick="location.href='/signin'">Sign in</button>"""
+PROFILE_HEADER = """<button type="button" class="HeaderView_profile_button" onclick="location.href='/more'">프로필</button>"""
+
+
+class WeverseStandInServer(ThreadingHTTPServer):
+    """
+    로컬에서 Weverse 회원가입/로그인 흐름을 흉내 내는 대역(stand-in) 서버
+
+    - 페이지 객체가 사용하는 로케이터(userEmail, newPassword, confirmPassword, nickname,
+      HeaderView_profile_button 등)를 그대로 가진 페이지를 제공.
+    - 사용자 정보 API(/weverse/wevweb/users/v1.0/users/me)가 wid를 반환하므로 프로필 검증까지 오프라인으로 수행 가능.
+    - 상태(사용자, 세션, 인증 토큰)는 메모리에만 저장됨.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, users=None, notify=None):
+        """
+        WeverseStandInServer 클래스의 생성자.
+
+        Args:
+            host (str, optional): 바인딩할 호스트. 기본값 "127.0.0.1".
+            port (int, optional): 바인딩할 포트. 기본값 0 (임의 포트).
+            users (dict, optional): 미리 등록할 사용자 {이메일: 비밀번호}. 인증 완료 상태로 등록됨.
+            notify (callable, optional): 인증 메일 대신 호출할 함수. (email, verification_url)을 인자로 받음.
+        """
+        super().__init__((host, port), _WeverseRequestHandler)
+        self.notify = notify
+        self.users = {}
+        self.sessions = {}
+        self.signups = {}
+        self.verifications = {}
+        self.lock = threading.Lock()
+        for email, password in (users or {}).items():
+            self.add_user(email, password, verified=True)
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_in_background(self):
+        threading.Thread(target=self.serve_forever, name="weverse-standin", daemon=True).start()
+        return self
+
+    def add_user(self, email, password, nickname="standin", verified=False):
+        """
+        사용자를 등록.
+
+        Args:
+            email (str): 이메일 주소.
+            password (str): 비밀번호.
+            nickname (str, optional): 닉네임.
+            verified (bool, optional): 이메일 인증 완료 여부.
+
+        Returns:
+            dict: 등록된 사용자 정보.
+        """
+        user = {
+            "email": email,
+            "password": password,
+            "nickname": nickname,
+            "verified": verified,
+            "wid": uuid.uuid4().hex[:16],
+        }
+        with self.lock:
+            self.users[email.lower()] = user
+        return user
+
+    def create_verification(self, email):
+        """
+        이메일 인증 토큰을 발급하고 인증 URL을 반환 (notify가 설정되어 있으면 전달).
+
+        Args:
+            email (str): 인증할 이메일 주소.
+
+        Returns:
+            str: 인증 URL.
+        """
+        token = uuid.uuid4().hex
+        with self.lock:
+            self.verifications[token] = email.lower()
+        verification_url = f"{self.url}/verify?{urlencode({'token': token})}"
+        if self.notify:
+            try:
+                self.notify(email, verification_url)
+            except Exception as e:
+                logger.warning(f"인증 URL 전달 중 오류가 발생했습니다: {str(e)}")
+        return verification_url
+
+    def verification_url_for(self, email):
+        """
+        이메일에 발급된 가장 최근 인증 URL을 반환.
+        """
+        with self.lock:
+            tokens = [token for token, owner in self.verifications.items() if owner == email.lower()]
+        return f"{self.url}/verify?{urlencode({'token': tokens[-1]})}" if tokens else None
+
+    def create_session(self, email):
+        token = uuid.uuid4().hex
+        with self.lock:
+            self.sessions[token] = email.lower()
+        return token
+
+
+class _WeverseRequestHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        routes = {
+            "/": self._home,
+            "/signin": self._signin,
+            "/signup/password": self._signup_password,
+            "/signup/nickname": self._signup_nickname,
+            "/signup/agreement": self._signup_agreement,
+            "/verify": self._verify,
+            "/more": self._more,
+            USERS_ME_PATH: self._users_me,
+            "/_standin/verification": self._verification_lookup,
+        }
+        handler = routes.get(parsed.path)
+        if handler is None:
+            self._respond(404, "text/plain", "not found")
+            return
+        handler(query)
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get("Content-Length", 0))
+        form = {key: values[0] for key, values in parse_qs(self.rfile.read(length).decode("utf-8")).items()}
+        routes = {
+            "/signin": self._submit_email,
+            "/signin/password": self._submit_login,
+            "/signup/password": self._submit_password,
+            "/signup/nickname": self._submit_nickname,
+            "/signup/agreement": self._submit_agreement,
+        }
+        handler = routes.get(parsed.path)
+        if handler is None:
+            self._respond(404, "text/plain", "not found")
+            return
+        handler(form)
+
+    # 페이지
+
+    def _home(self, query):
+        self._page("Weverse", "<h1>Weverse</h1>")
+
+    def _signin(self, query):
+        self._page("Sign in", """
+<form method="post" action="/signin">
+  <input type="email" name="userEmail" placeholder="your@email.com">
+  <button type="submit"><span>이메일로 계속하기</span></button>
+</form>""")
+
+    def _submit_email(self, form):
+        email = form.get("userEmail", "").strip()
+        with self.server.lock:
+            user = self.server.users.get(email.lower())
+
+        if user and user["verified"]:
+            self._page("Sign in", f"""
+<form method="post" action="/signin/password">
+  <input type="hidden" name="userEmail" value="{html.escape(email)}">
+  <input type="password" name="password">
+  <button type="submit" class="sc-cedf9b36-1"><span>로그인</span></button>
+</form>""")
+            return
+
+        signup_token = uuid.uuid4().hex
+        with self.server.lock:
+            self.server.signups[signup_token] = {"email": email}
+        self._page("Sign up", """
+<p>Weverse 계정이 없습니다.</p>
+<button type="button" onclick="location.href='/signup/password'"><span>가입하기</span></button>""",
+                   cookies={SIGNUP_COOKIE: signup_token})
+
+    def _submit_login(self, form):
+        email = form.get("userEmail", "")
+        with self.server.lock:
+            user = self.server.users.get(email.lower())
+        if not user or user["password"] != form.get("password"):
+            self._page("Sign in", "<p>이메일 또는 비밀번호가 올바르지 않습니다.</p>", status=401)
+            return
+        self._redirect("/", cookies={SESSION_COOKIE: self.server.create_session(email)})
+
+    def _signup_password(self, query):
+        self._page("Password", """
+<form method="post" action="/signup/password">
+  <input type="password" name="newPassword">
+  <input type="password" name="confirmPassword">
+  <button type="submit">다음</button>
+</form>""")
+
+    def _submit_password(self, form):
+        signup = self._signup()
+        if signup is None or not form.get("newPassword") or form.get("newPassword") != form.get("confirmPassword"):
+            self._page("Password", "<p>비밀번호가 일치하지 않습니다.</p>", status=400)
+            return
+        signup["password"] = form["newPassword"]
+        self._redirect("/signup/nickname")
+
+    def _signup_nickname(self, query):
+        self._page("Nickname", """
+<form method="post" action="/signup/nickname">
+  <input type="text" name="nickname">
+  <button type="submit">다음</button>
+</form>""")
+
+    def _submit_nickname(self, form):
+        signup = self._signup()
+        if signup is None or not form.get("nickname"):
+            self._page("Nickname", "<p>닉네임을 입력해주세요.</p>", status=400)
+            return
+        signup["nickname"] = form["nickname"]
+        self._redirect("/signup/agreement")
+
+    def _signup_agreement(self, query):
+        self._page("Agreement", """
+<form method="post" action="/signup/agreement">
+  <label><input type="checkbox" name="agree"> 전체 동의</label>
+  <button type="submit">다음</button>
+</form>""")
+
+    def _submit_agreement(self, form):
+        signup = self._signup()
+        if signup is None or "password" not in signup or not form.get("agree"):
+            self._page("Agreement", "<p>약관에 동의해주세요.</p>", status=400)
+            return
+        self.server.add_user(signup["email"], signup["password"], signup.get("nickname", "standin"))
+        self.server.create_verification(signup["email"])
+        self._page("Verify", "<h1>이제 이메일을 인증해주세요!</h1>")
+
+    def _verify(self, query):
+        with self.server.lock:
+            email = self.server.verifications.pop(query.get("token", ""), None)
+            user = self.server.users.get(email) if email else None
+            if user:
+                user["verified"] = True
+        if not user:
+            self._page("Verify", "<p>유효하지 않은 인증 링크입니다.</p>", status=400)
+            return
+        self._page("Welcome", "<h1>환영합니다!</h1>", cookies={SESSION_COOKIE: self.server.create_session(email)},
+                   logged_in=True)
+
+    def _more(self, query):
+        if self._user() is None:
+            self._redirect("/signin")
+            return
+        self._page("More", f"""
+<h1>더보기</h1>
+<script>fetch('{USERS_ME_PATH}', {{credentials: 'include'}});</script>""")
+
+    # API
+
+    def _users_me(self, query):
+        user = self._user()
+        if user is None:
+            self._respond(401, "application/json", json.dumps({"error": "unauthorized"}))
+            return
+        body = {"wid": user["wid"], "email": user["email"], "nickname": user["nickname"]}
+        self._respond(200, "application/json", json.dumps(body, ensure_ascii=False))
+
+    def _verification_lookup(self, query):
+        verification_url = self.server.verification_url_for(query.get("email", ""))
+        if verification_url is None:
+            self._respond(404, "application/json", json.dumps({"error": "not_found"}))
+            return
+        self._respond(200, "application/json", json.dumps({"url": verification_url}))
+
+    # 공통
+
+    def _cookie(self, name):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie[name].value if name in cookie else None
+
+    def _user(self):
+        with self.server.lock:
+            email = self.server.sessions.get(self._cookie(SESSION_COOKIE) or "")
+            return self.server.users.get(email) if email else None
+
+    def _signup(self):
+        with self.server.lock:
+            return self.server.signups.get(self._cookie(SIGNUP_COOKIE) or "")
+
+    def _page(self, title, body, status=200, cookies=None, logged_in=None):
+        if logged_in is None:
+            logged_in = self._user() is not None
+        document = PAGE_TEMPLATE.format(
+            title=title,
+            header=PROFILE_HEADER if logged_in else SIGN_IN_HEADER,
+            body=body,
+        )
+        self._respond(status, "text/html; charset=utf-8", document, cookies)
+
+    def _redirect(self, location, cookies=None):
+        self.send_response(303)
+        self.send_header("Location", location)
+        self._send_cookies(cookies)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _respond(self, status, content_type, body, cookies=None):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Cache-Control", "no-store")
+        self._send_cookies(cookies)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _send_cookies(self, cookies):
+        for name, value in (cookies or {}).items():
+            self.send_header("Set-Cookie", f"{name}={value}; Path=/; HttpOnly; SameSite=Lax")
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def main(argv=None):
+    """
+    대역 서버 실행 진입점.
+
+    Example:
+        python -m standin.weverse_server --port 8000 --user test@benx.com:password
+        BASE_URL=http://127.0.0.1:8000 API_HOST=http://127.0.0.1:8000 WAIT_SCALE=0 pytest
+    """
+    parser = argparse.ArgumentParser(description="로컬 Weverse 대역 서버를 실행합니다.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--user", action="append", default=[], help="미리 등록할 사용자 (이메일:비밀번호)")
+    args = parser.parse_args(argv)
+
+    users = dict(user.split(":", 1) for user in args.user)
+    server = WeverseStandInServer(args.host, args.port, users=users)
+    print(f"Weverse stand-in listening on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,23 @@
+import os
+import tempfile
 import pytest
 from dotenv import load_dotenv
+
+# .env 파일을 로드 (core 모듈이 import 시점에 환경 변수를 읽으므로 가장 먼저 로드)
+load_dotenv()
+
 from core.driver import Driver
+from core.driver_pool import DriverPool
+from core.network import NetworkRecorder
+from core.artifacts import ArtifactWriter, capture_failure
+from core.profiler import CommandProfiler
+from core.timing import StepTimeline, start_timeline, stop_timeline, instrument_driver
+from core.utils import get_worker_id, safe_filename
+from core.session_cache import SessionCache
+from core.account_pool import AccountPool, get_provisioner
+from core.checkpoint import FlowCheckpoint
+from core.durations import DurationHistory, declared_steps
+from core import utils
 from pages.home_page import HomePage
 from pages.signup.login_page import LoginPage
 from pages.signup.signup_page import SignUpPage
@@ -9,14 +26,332 @@ from pages.signup.nickname_page import NicknamePage
 from pages.signup.agreement_page import AgreementPage
 from pages.profile_page import ProfilePage
 
-# .env 파일을 로드
-load_dotenv()
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--standin",
+        action="store_true",
+        default=os.getenv("STANDIN", "False").lower() in ("true", "1", "yes"),
+        help="실제 Weverse 대신 로컬 대역 서버(standin.weverse_server)를 대상으로 실행",
+    )
+    parser.addoption(
+        "--grid-nodes",
+        type=int,
+        default=int(os.getenv("GRID_NODES", "0")),
+        help="로컬 그리드 대역(standin.grid)의 노드 수. 0보다 크면 세션을 원격 실행 경로로 노드에 분배",
+    )
+
+
+def pytest_configure(config):
+    # 수집만 하는 경우(core.parallel의 테스트 분배 등)에는 서버/노드를 띄우지 않음
+    if config.getoption("--standin") and not config.option.collectonly:
+        _start_standin(config)
+    if config.getoption("--grid-nodes") > 0 and not config.option.collectonly:
+        _start_grid(config)
+
+    config.addinivalue_line(
+        "markers",
+        "network_capture(url_patterns=None, methods=None, max_entries=None): "
+        "테스트의 네트워크 트래픽을 기록하고 실패 시 HAR 파일로 저장",
+    )
+    config.addinivalue_line(
+        "markers",
+        "retire_account: 테스트가 대여한 계정의 상태를 바꾸므로 반환하지 않고 폐기",
+    )
+    config.addinivalue_line(
+        "markers",
+        "duration(seconds): 실행 기록이 없을 때 병렬 스케줄링에 사용할 예상 실행 시간 (초)",
+    )
+    config.addinivalue_line(
+        "markers",
+        "checkpoint(*steps): checkpoint 픽스처가 저장할 단계 이름 (플로우 진행 순서)",
+    )
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # 픽스처에서 테스트 결과를 확인할 수 있도록 단계별(setup/call/teardown) 리포트를 item에 저장
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+    # setup/call/teardown 시간을 합쳐 테스트가 끝나면 실행 기록에 저장 (병렬 실행 시 LPT 스케줄링에 사용)
+    item._duration = getattr(item, "_duration", 0.0) + report.duration
+    if report.when == "teardown" and DurationHistory.ENABLED:
+        _record_duration(item)
+
+    # 실패 시 아티팩트(스크린샷, DOM, 콘솔 로그, URL, HAR)를 수집하고 파일 쓰기는 백그라운드로 넘김
+    driver_instance = item.funcargs.get("driver") if hasattr(item, "funcargs") else None
+    if report.failed and report.when in ("setup", "call") and driver_instance is not None:
+        artifact_dir = capture_failure(driver_instance, item.nodeid, getattr(item, "_network_recorder", None))
+        report.sections.append(("failure artifacts", artifact_dir))
+
+
+def _record_duration(item):
+    """
+    테스트의 실행 시간을 대상(BASE_URL 또는 "standin")별 실행 기록에 저장.
+
+    - 체크포인트에서 이어서 실행한 경우는 전체 플로우 시간이 아니므로 기록하지 않음.
+    """
+    if getattr(item, "_checkpoint_resumed", False):
+        return
+
+    reports = [getattr(item, f"rep_{when}", None) for when in ("setup", "call", "teardown")]
+    if any(report is not None and report.failed for report in reports):
+        outcome = "failed"
+    elif any(report is not None and report.skipped for report in reports):
+        outcome = "skipped"
+    else:
+        outcome = "passed"
+
+    target = "standin" if item.config.getoption("--standin") else Driver.BASE_URL
+    try:
+        DurationHistory().record(item.nodeid, target, item._duration, outcome, declared_steps(item))
+    except Exception as e:
+        print(f"실행 시간 기록 중 오류가 발생했습니다: {str(e)}")
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # 백그라운드에서 기록 중인 아티팩트를 모두 저장한 뒤 종료
+    ArtifactWriter.get().flush(timeout=60)
+
+    pool = getattr(session.config, "_account_pool", None)
+    if pool is not None:
+        # 진행 중인 회원가입이 끝날 때까지 기다려 생산자의 브라우저가 남지 않도록 함
+        pool.stop()
+
+    for name in ("_weverse_standin", "_slack_standin", "_grid_standin"):
+        server = getattr(session.config, name, None)
+        if server is not None:
+            server.shutdown()
+
+
+def _start_standin(config):
+    """
+    로컬 Weverse/Slack 대역 서버를 시작하고 BASE_URL/API_HOST와 Slack API 주소를 대역 서버로 변경.
+
+    - 봇 감지가 없으므로 고정 대기(wait)는 생략하고, 서버가 매번 새로 뜨므로 세션 스냅샷은 사용하지 않음.
+    - 로그인 테스트 계정(TEST_EMAIL/TEST_USER_PASSWORD)은 인증 완료 상태로 미리 등록.
+    - 인증 메일은 SLACK_STANDIN_DELAY초 후 Slack 대역 서버의 채널 메시지로 배달됨.
+    """
+    from standin.weverse_server import WeverseStandInServer
+    from standin.slack_server import SlackStandInServer, verification_message
+
+    os.environ.setdefault("TEST_EMAIL", "standin@benx.com")
+    os.environ.setdefault("TEST_USER_PASSWORD", "standin-password")
+    os.environ.setdefault("USER_PASSWORD", "standin-password")
+
+    slack_server = SlackStandInServer().serve_in_background()
+    config._slack_standin = slack_server
+    os.environ.update({
+        "SLACK_API_BASE_URL": slack_server.api_url,
+        "SLACK_API_TOKEN": "xoxb-standin",
+        "SLACK_CHANNEL_ID": "CSTANDIN",
+    })
+    delivery_delay = float(os.getenv("SLACK_STANDIN_DELAY", "0"))
+
+    server = WeverseStandInServer(
+        users={os.environ["TEST_EMAIL"]: os.environ["TEST_USER_PASSWORD"]},
+        notify=lambda email, url: slack_server.post_message(
+            "CSTANDIN", verification_message(email, url), delay=delivery_delay),
+    )
+    server.serve_in_background()
+    config._weverse_standin = server
+
+    Driver.BASE_URL = server.url
+    Driver.API_HOST = server.url
+    utils.WAIT_SCALE = 0
+    SessionCache.ENABLED = False
+    # 대역 서버의 계정은 메모리에만 있으므로 실행마다 별도의 계정 저장소 사용
+    AccountPool.DB_PATH = os.path.join(tempfile.mkdtemp(prefix="standin-"), "accounts.sqlite3")
+    FlowCheckpoint.CHECKPOINT_DIR = tempfile.mkdtemp(prefix="standin-checkpoints-")
+
+
+def _start_grid(config):
+    """
+    로컬 그리드 대역(노드별 chromedriver)을 시작하고 세션 분배기가 그 노드를 사용하도록 설정.
+    """
+    from standin.grid import LocalGrid
+    from core.remote import SessionDistributor, parse_nodes
+
+    grid = LocalGrid(config.getoption("--grid-nodes"), int(os.getenv("GRID_NODE_CAPACITY", "2"))).start()
+    config._grid_standin = grid
+    SessionDistributor._instance = SessionDistributor(parse_nodes(grid.nodes_setting))
+    SessionDistributor.ENABLED = True
+
+
+def _start_network_capture(request, driver_instance):
+    """
+    network_capture 마커 또는 NETWORK_CAPTURE 환경 변수가 설정된 테스트에만 네트워크 레코더를 연결.
+
+    - 테스트가 실패하면 기록된 트래픽은 실패 아티팩트에 HAR 파일로 포함됨.
+    """
+    marker = request.node.get_closest_marker("network_capture")
+    if marker is None and not NetworkRecorder.ENABLED:
+        return None
+
+    options = marker.kwargs if marker else {}
+    recorder = NetworkRecorder(
+        driver_instance,
+        max_entries=options.get("max_entries") or NetworkRecorder.MAX_ENTRIES,
+        url_patterns=options.get("url_patterns") or NetworkRecorder.URL_PATTERNS,
+        methods=options.get("methods") or NetworkRecorder.METHODS,
+    )
+    request.node._network_recorder = recorder
+    return recorder
+
+
+def _finish_network_capture(request, recorder):
+    """
+    네트워크 레코더를 해제.
+
+    - 실패 아티팩트의 HAR 본문을 쓰기 스레드에서 가져오므로, 앞서 추가된 아티팩트 작업이 끝난 뒤 해제.
+    """
+    if recorder is not None:
+        request.node._network_recorder = None
+        ArtifactWriter.get().run_after(recorder.close)
+
+
+def _start_command_profile(driver_instance):
+    """
+    COMMAND_PROFILE=true 인 경우 드라이버의 명령 기록을 테스트 시작 시점부터 새로 시작.
+    """
+    if not CommandProfiler.ENABLED:
+        return None
+    profiler = CommandProfiler.for_driver(driver_instance)
+    profiler.reset()
+    return profiler
+
+
+def _finish_command_profile(request, profiler):
+    """
+    테스트의 명령 프로파일을 reports/profiles/<워커ID>/ 에 JSON 리포트와 folded stack 파일로 저장.
+    """
+    if profiler is None:
+        return
+    report = getattr(request.node, "rep_call", None) or getattr(request.node, "rep_setup", None)
+    profiler.save(
+        os.path.join(os.getenv("REPORT_DIR", "reports"), "profiles", get_worker_id()),
+        safe_filename(request.node.nodeid),
+        nodeid=request.node.nodeid,
+        outcome=report.outcome if report else None,
+    )
+
+
+@pytest.fixture(autouse=True)
+def step_timeline(request):
+    """
+    STEP_TIMING=true 인 경우 테스트별 단계 시간을 기록하여 reports/timings/<워커ID>/ 에 JSON으로 저장.
+
+    - COMMAND_PROFILE=true 인 경우에도 명령을 단계에 귀속시키기 위해 타임라인을 기록 (파일로는 저장하지 않음).
+    """
+    if not StepTimeline.ENABLED and not CommandProfiler.ENABLED:
+        yield None
+        return
+
+    timeline = start_timeline(request.node.nodeid)
+    yield timeline
+    stop_timeline()
+    if not StepTimeline.ENABLED:
+        return
+
+    report = getattr(request.node, "rep_call", None) or getattr(request.node, "rep_setup", None)
+    timings_dir = os.path.join(os.getenv("REPORT_DIR", "reports"), "timings", get_worker_id())
+    timeline.save(
+        os.path.join(timings_dir, f"{safe_filename(request.node.nodeid)}.json"),
+        outcome=report.outcome if report else None,
+    )
+
+
+@pytest.fixture(scope="session")
+def driver_pool():
+    """
+    세션 전체에서 재사용하는 Chrome 드라이버 풀 (DRIVER_POOL=true 인 경우에만 생성).
+    """
+    if not DriverPool.ENABLED:
+        yield None
+        return
+    pool = DriverPool()
+    yield pool
+    pool.close()
+
+@pytest.fixture(scope="session")
+def account_pool(request):
+    """
+    가입/인증이 끝난 계정을 제공하는 계정 풀.
+
+    - ACCOUNT_POOL=true 이면 계정을 처음 요청할 때 백그라운드 생산자를 시작하여 이후 테스트의 계정을 미리 만들어 두고,
+      아니면 대여 시점에 직접 가입. 계정을 쓰는 테스트가 없으면 계정을 만들지 않음.
+    """
+    if not AccountPool.ENABLED:
+        return AccountPool(get_provisioner(), Driver.BASE_URL, producers=0, owner=get_worker_id())
+    # 세션 종료 시(pytest_sessionfinish) 생산자를 정리하도록 config에 보관
+    request.config._account_pool = AccountPool(get_provisioner(), Driver.BASE_URL, owner=get_worker_id()).start()
+    return request.config._account_pool
+
+
+@pytest.fixture
+def account(request, account_pool):
+    """
+    계정 풀에서 계정을 대여하고 테스트 종료 후 반환 (retire_account 마커가 있으면 폐기).
+    """
+    leased = account_pool.lease()
+    yield leased
+    if request.node.get_closest_marker("retire_account"):
+        account_pool.retire(leased)
+    else:
+        account_pool.release(leased)
+
+
+@pytest.fixture
+def checkpoint(request):
+    """
+    테스트별 플로우 체크포인트 (단계 이름은 checkpoint 마커로 지정).
+
+    - 이전 실행이 중간에 실패했다면 테스트에서 resume()으로 마지막 체크포인트부터 이어서 실행.
+    - 테스트가 통과하면 체크포인트를 삭제.
+    """
+    marker = request.node.get_closest_marker("checkpoint")
+    flow_checkpoint = FlowCheckpoint(request.node.nodeid, marker.args if marker else ())
+    yield flow_checkpoint
+    # 이어서 실행한 테스트는 실행 시간 기록(core.durations)에서 제외
+    request.node._checkpoint_resumed = flow_checkpoint.step is not None
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.passed:
+        flow_checkpoint.clear()
+
 
 @pytest.fixture(scope="function")
-def driver():
-    driver_instance = Driver.get_driver()
+def driver(request, driver_pool):
+    if driver_pool is None:
+        # 원격 실행 시 같은 테스트의 재실행은 같은 노드에 배정
+        driver_instance = Driver.get_driver(affinity=request.node.nodeid)
+        if StepTimeline.ENABLED:
+            instrument_driver(driver_instance)
+        recorder = _start_network_capture(request, driver_instance)
+        profiler = _start_command_profile(driver_instance)
+        yield driver_instance
+        try:
+            _finish_command_profile(request, profiler)
+            _finish_network_capture(request, recorder)
+        finally:
+            # 프로파일/HAR 저장이 실패해도 Chrome 세션은 종료
+            driver_instance.quit()
+        return
+
+    # 풀 모드: 따뜻한 세션을 대여하고, 테스트 종료 후 상태를 초기화하여 반환
+    driver_instance = driver_pool.acquire()
+    if StepTimeline.ENABLED:
+        instrument_driver(driver_instance)
+    recorder = _start_network_capture(request, driver_instance)
+    profiler = _start_command_profile(driver_instance)
     yield driver_instance
-    driver_instance.quit()
+    try:
+        _finish_command_profile(request, profiler)
+        _finish_network_capture(request, recorder)
+    finally:
+        # 프로파일/HAR 저장이 실패해도 세션을 풀에 반환
+        driver_pool.release(driver_instance)
 
 # 페이지 객체 픽스처 정의
 @pytest.fixture
@@ -0,0 +1,56 @@
+import os
+import stat
+import pytest
+
+from core.account_pool import Account, AccountPool, AccountStore
+
+BASE_URL = "http://standin.test"
+
+
+@pytest.fixture
+def pool(tmp_path):
+    """
+    회원가입 대신 가짜 wid를 반환하는 생산 함수를 쓰는 계정 풀 (생산자 없음).
+    """
+    store = AccountStore(os.path.join(tmp_path, "accounts", "accounts.sqlite3"))
+    return AccountPool(lambda email, password, nickname: f"wid-{email}", BASE_URL, store=store, producers=0, owner="gw0")
+
+
+class TestAccountPool:
+    """
+    계정 대여/반환의 대여자 확인 테스트
+    """
+
+    def test_release_makes_account_available_again(self, pool):
+        account = pool.lease()
+        pool.release(account)
+
+        assert pool.store.count(BASE_URL, "available") == 1
+        assert pool.lease().email == account.email
+
+    def test_only_lease_holder_can_release_or_retire(self, pool):
+        account = pool.lease()
+        other = AccountPool(pool.provision, BASE_URL, store=pool.store, producers=0, owner="gw1")
+        stolen = Account(account.email, account.password, account.nickname, account.wid, lease_id="gw1:other")
+
+        other.release(stolen)
+        other.retire(stolen)
+        assert pool.store.count(BASE_URL, "leased") == 1
+
+        pool.retire(account)
+        assert pool.store.count(BASE_URL, "retired") == 1
+
+    def test_reclaimed_lease_cannot_be_returned_by_previous_holder(self, pool, monkeypatch):
+        first = pool.lease()
+        pool.release(first)
+        first = pool.lease()
+        # 대여 시간이 지나 다른 대여자가 회수
+        monkeypatch.setattr(AccountPool, "LEASE_TIMEOUT", -1)
+        second = AccountPool(pool.provision, BASE_URL, store=pool.store, producers=0, owner="gw1").lease()
+        assert second.email == first.email
+
+        pool.release(first)
+        assert pool.store.count(BASE_URL, "leased") == 1
+
+    def test_store_file_is_private(self, pool):
+        assert stat.S_IMODE(os.stat(pool.store.path).st_mode) == 0o600
@@ -0,0 +1,82 @@
+import shutil
+import asyncio
+import pytest
+from selenium.webdriver.common.by import By
+
+from core.async_cdp import AsyncBrowser, AsyncPage
+
+
+class _Connection:
+    """
+    AsyncPage가 사용하는 AsyncCdpConnection 메서드(send, on, off)만 가진 대역 (보낸 명령을 기록)
+    """
+
+    def __init__(self, results=None):
+        self.sent = []
+        self.results = results or {}
+
+    async def send(self, method, params=None, session_id=None, timeout=30):
+        self.sent.append((method, params))
+        return self.results.get(method, {})
+
+    def on(self, method, callback, session_id=None):
+        pass
+
+    def off(self, method, callback, session_id=None):
+        pass
+
+
+def has_chrome():
+    return AsyncBrowser.CHROME_BINARY or any(
+        map(shutil.which, ("google-chrome", "chromium", "chromium-browser", "chrome")))
+
+
+class TestAsyncPage:
+    """
+    AsyncPage의 입력, 응답 기록, 정리 테스트
+    """
+
+    def test_type_inserts_text_into_focused_field(self):
+        connection = _Connection({"Runtime.evaluate": {"result": {"value": {"ok": True, "click": False}}}})
+        page = AsyncPage(connection, "session", "target", "context")
+
+        asyncio.run(page.type((By.NAME, "userEmail"), "user@benx.com"))
+
+        methods = [method for method, _ in connection.sent]
+        assert methods == ["Runtime.evaluate", "Input.insertText"]
+        assert connection.sent[-1][1] == {"text": "user@benx.com"}
+
+    def test_responses_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(AsyncPage, "MAX_RESPONSES", 3)
+        page = AsyncPage(_Connection(), "session", "target", "context")
+        for index in range(5):
+            page._on_request({"requestId": str(index), "request": {"url": f"https://weverse.io/{index}", "method": "GET"}})
+
+        assert list(page._responses) == ["2", "3", "4"]
+
+    def test_close_closes_target_and_disposes_context(self):
+        connection = _Connection()
+        page = AsyncPage(connection, "session", "target", "context")
+
+        asyncio.run(page.close())
+
+        assert connection.sent == [
+            ("Target.closeTarget", {"targetId": "target"}),
+            ("Target.disposeBrowserContext", {"browserContextId": "context"}),
+        ]
+
+    @pytest.mark.skipif(not has_chrome(), reason="Chrome 실행 파일이 없습니다.")
+    def test_type_sets_field_value_in_chrome(self):
+        async def run():
+            browser = await AsyncBrowser.launch(headless=True)
+            try:
+                page = await browser.new_page()
+                await page.goto("data:text/html,<input name='userEmail'>")
+                await page.type((By.NAME, "userEmail"), "user@benx.com", condition="visible")
+                value = await page.evaluate("document.getElementsByName('userEmail')[0].value")
+                await page.close()
+                return value
+            finally:
+                await browser.close()
+
+        assert asyncio.run(run()) == "user@benx.com"
@@ -0,0 +1,122 @@
+import os
+import pytest
+
+from core.durations import DurationHistory, declared_steps, lpt_schedule
+
+
+class _Marker:
+
+    def __init__(self, *args):
+        self.args = args
+
+
+class _Item:
+    """
+    estimate/declared_steps가 사용하는 pytest Item 속성(nodeid, obj, get_closest_marker)만 가진 대역
+    """
+
+    def __init__(self, nodeid, doc="", duration=None):
+        self.nodeid = nodeid
+        self.obj = lambda: None
+        self.obj.__doc__ = doc
+        self._duration = duration
+
+    def get_closest_marker(self, name):
+        return _Marker(self._duration) if name == "duration" and self._duration is not None else None
+
+
+STEPS_DOC = """
+    회원 가입.
+
+    Args:
+        driver: Selenium WebDriver 인스턴스.
+
+    Steps:
+        1. 이메일 생성.
+        2. 비밀번호 설정.
+        3. 닉네임 설정.
+
+    이전 실행이 실패했다면 이어서 실행.
+    """
+
+
+@pytest.fixture
+def history(tmp_path):
+    return DurationHistory(os.path.join(tmp_path, "history.sqlite3"))
+
+
+class TestLptSchedule:
+    """
+    LPT 스케줄링 테스트
+    """
+
+    def test_assigns_every_test_once_to_least_loaded_worker(self):
+        estimates = {"a": 7, "b": 6, "c": 5, "d": 4, "e": 3, "f": 2}
+        schedule = lpt_schedule(estimates, 2)
+
+        assigned = [nodeid for _, nodeids in schedule for nodeid in nodeids]
+        assert sorted(assigned) == sorted(estimates)
+        # 7+4+3 / 6+5+2 (LPT 결과), 각 워커 목록은 긴 테스트부터
+        assert schedule == [(14, ["a", "d", "e"]), (13, ["b", "c", "f"])]
+
+    def test_makespan_close_to_lower_bound(self):
+        estimates = {f"t{index}": seconds for index, seconds in enumerate([30, 25, 20, 18, 12, 9, 7, 5, 3, 1])}
+        workers = 3
+        makespan = max(load for load, _ in lpt_schedule(estimates, workers))
+        lower_bound = max(max(estimates.values()), sum(estimates.values()) / workers)
+        assert lower_bound <= makespan <= lower_bound * (4 / 3 - 1 / (3 * workers))
+
+    def test_drops_idle_workers(self):
+        schedule = lpt_schedule({"a": 1, "b": 2}, 4)
+        assert schedule == [(2, ["b"]), (1, ["a"])]
+
+    def test_ties_are_deterministic(self):
+        estimates = {"b": 5, "a": 5, "c": 5}
+        assert lpt_schedule(estimates, 2) == lpt_schedule(dict(reversed(list(estimates.items()))), 2)
+
+
+class TestDeclaredSteps:
+    """
+    docstring의 Steps: 섹션 해석 테스트
+    """
+
+    def test_counts_numbered_steps_only_in_steps_section(self):
+        assert declared_steps(_Item("t", STEPS_DOC)) == 3
+
+    def test_no_steps_section(self):
+        assert declared_steps(_Item("t", "로그인 테스트.\n\n    Args:\n        driver: 드라이버.\n")) == 0
+        assert declared_steps(_Item("t", None)) == 0
+
+
+class TestDurationHistory:
+    """
+    실행 기록 기반 시간 추정 테스트
+    """
+
+    def test_uses_median_of_recent_passed_runs(self, history):
+        for seconds in (10, 12, 50):
+            history.record("a", "standin", seconds, "passed", 3)
+        history.record("a", "standin", 1, "failed", 3)
+        history.record("a", "other", 99, "passed", 3)
+
+        assert history.estimate([_Item("a")], "standin") == {"a": (12, "history")}
+
+    def test_keeps_only_latest_samples(self, history, monkeypatch):
+        monkeypatch.setattr(DurationHistory, "SAMPLES", 2)
+        for seconds in (100, 10, 20):
+            history.record("a", "standin", seconds, "passed")
+        assert history.recent("standin")["a"]["seconds"] == [20, 10]
+
+    def test_fallback_order(self, history):
+        # 단계당 시간은 기록된 테스트(30초 / 3단계)로 보정
+        history.record("known", "standin", 30, "passed", 3)
+        items = [_Item("marked", STEPS_DOC, duration=42), _Item("steps", STEPS_DOC), _Item("unknown")]
+
+        estimates = history.estimate(items, "standin")
+        assert estimates["marked"] == (42.0, "marker")
+        assert estimates["steps"] == (30.0, "steps")
+        assert estimates["unknown"] == (DurationHistory.DEFAULT_SECONDS, "default")
+
+    def test_steps_without_history_use_default_seconds_per_step(self, history):
+        estimates = history.estimate([_Item("steps", STEPS_DOC)], "standin")
+        assert estimates["steps"] == (3 * DurationHistory.SECONDS_PER_STEP, "steps")
@@ -0,0 +1,101 @@
+import math
+import random
+import pytest
+
+from core.loadgen import LatencyHistogram, arrival_times
+
+
+def exact_percentile(values, percent):
+    ordered = sorted(values)
+    return ordered[max(math.ceil(len(ordered) * percent / 100), 1) - 1]
+
+
+class TestLatencyHistogram:
+    """
+    HDR 히스토그램의 구간 계산과 백분위 정확도 테스트
+    """
+
+    def test_small_values_are_exact(self):
+        histogram = LatencyHistogram()
+        for value_us in range(LatencyHistogram.SUB_BUCKETS):
+            assert LatencyHistogram._index(value_us) == value_us
+            assert LatencyHistogram._highest_value(value_us) == value_us
+            histogram.record(value_us / 1000)
+        assert histogram.percentile(50) == exact_percentile(range(LatencyHistogram.SUB_BUCKETS), 50) / 1000
+
+    def test_bucket_bounds_contain_value_within_relative_error(self):
+        # 구간의 최댓값은 값 이상이고, 상대 오차는 1 / HALF (약 1.6%) 이내
+        for value_us in [128, 129, 255, 256, 1000, 65_535, 65_536, 1_234_567, 3_600_000_000]:
+            highest = LatencyHistogram._highest_value(LatencyHistogram._index(value_us))
+            assert value_us <= highest
+            assert (highest - value_us) / value_us < 1 / LatencyHistogram.HALF
+
+    def test_indexes_are_monotonic(self):
+        indexes = [LatencyHistogram._index(value_us) for value_us in range(0, 200_000, 37)]
+        assert indexes == sorted(indexes)
+
+    def test_percentiles_match_exact_values(self):
+        rng = random.Random(7)
+        values_ms = [rng.lognormvariate(5, 1) for _ in range(20_000)]
+        histogram = LatencyHistogram()
+        for value in values_ms:
+            histogram.record(value)
+
+        for percent in (50, 90, 99, 99.9):
+            exact = exact_percentile(values_ms, percent)
+            assert histogram.percentile(percent) == pytest.approx(exact, rel=1 / LatencyHistogram.HALF)
+        assert histogram.percentile(100) == pytest.approx(max(values_ms), abs=0.001)
+
+    def test_merge_equals_recording_everything(self):
+        values_ms = [random.Random(1).uniform(1, 5_000) for _ in range(1_000)]
+        combined, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for index, value in enumerate(values_ms):
+            combined.record(value)
+            (first if index % 2 else second).record(value)
+
+        merged = first.merge(second)
+        assert merged.counts == combined.counts
+        assert (merged.count, merged.min_us, merged.max_us) == (combined.count, combined.min_us, combined.max_us)
+
+    def test_dict_round_trip_keeps_percentiles(self):
+        histogram = LatencyHistogram()
+        for value in (1, 5, 20, 250, 1_000, 30_000):
+            histogram.record(value)
+
+        restored = LatencyHistogram.from_dict(histogram.to_dict())
+        assert restored.counts == histogram.counts
+        assert restored.to_dict()["percentiles_ms"] == histogram.to_dict()["percentiles_ms"]
+
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram()
+        assert histogram.percentile(99) == 0.0
+        assert histogram.to_dict()["count"] == 0
+
+
+class TestArrivalTimes:
+    """
+    도착 시각 생성(선형 증가 후 일정) 테스트
+    """
+
+    def test_constant_rate(self):
+        arrivals = list(arrival_times(10, 5))
+        assert len(arrivals) == 50
+        assert arrivals[:3] == pytest.approx([0.0, 0.1, 0.2])
+
+    def test_ramp_up_then_constant(self):
+        rate, duration, ramp_up = 4, 30, 10
+        arrivals = list(arrival_times(rate, duration, ramp_up))
+
+        assert arrivals == sorted(arrivals)
+        assert all(0 <= at < duration for at in arrivals)
+        # 증가 구간에는 rate * ramp_up / 2명, 이후에는 초당 rate명
+        assert len([at for at in arrivals if at < ramp_up]) == rate * ramp_up // 2
+        assert len(arrivals) == rate * ramp_up // 2 + rate * (duration - ramp_up)
+        # 증가 구간의 도착 간격은 점점 짧아지고, 이후에는 1 / rate로 일정
+        ramp_gaps = [b - a for a, b in zip(arrivals, arrivals[1:]) if b < ramp_up]
+        assert ramp_gaps == sorted(ramp_gaps, reverse=True)
+        steady = [at for at in arrivals if at >= ramp_up]
+        assert [b - a for a, b in zip(steady, steady[1:])] == pytest.approx([1 / rate] * (len(steady) - 1))
+
+    def test_zero_rate(self):
+        assert list(arrival_times(0, 10)) == []
@@ -1,5 +1,7 @@
 import os
-from core.utils import wait, save_screenshot
+from core.driver import Driver
+from core.session_cache import SessionCache
+from pages.flows import login
 
 class TestLoginProfile:
     @staticmethod
@@ -19,15 +21,15 @@ class TestLoginProfile:
             raise EnvironmentError(f"환경 변수 '{key}'가 설정 되지 않았습니다.")
         return value
 
-    def test_login_and_go_to_profile(self, driver, home_page, signup_page, login_page, profile_page):
+    def test_login_and_go_to_profile(self, driver, home_page, profile_page):
         """
         로그인 후 프로필 페이지로 이동하는 테스트.
 
+        - 로그인 UI를 검증하는 테스트이므로 세션 스냅샷(SESSION_CACHE)과 관계없이 항상 UI로 로그인.
+
         Args:
             driver: Selenium WebDriver 인스턴스.
             home_page: HomePage 인스턴스.
-            signup_page: SignUpPage 인스턴스.
-            login_page: LoginPage 인스턴스.
             profile_page: ProfilePage 인스턴스.
         """
         email = None
@@ -39,18 +41,9 @@ class TestLoginProfile:
             email = self.get_env_variable("TEST_EMAIL")
             password = self.get_env_variable("TEST_USER_PASSWORD")
 
-            # 1. 홈 페이지에서 로그인/회원가입 클릭
-            home_page.click_sign_in()
-
-            # 2. 회원가입 페이지 - 이메일 입력 및 계속하기 클릭
-            signup_page.enter_email(email)
-            wait(2)  # 봇 감지를 위해 이메일 입력 후 2초 대기
-            signup_page.click_continue()
-
-            # 3. 로그인 페이지 - 비밀번호 입력 후 로그인 클릭
-            login_page.enter_password(password)
-            wait(4)  # 봇 감지를 위해 비밀번호 입력 후 4초 대기
-            login_page.click_login()
+            # 1~3. 로그인 (홈 → 이메일 입력 → 비밀번호 입력 → 로그인)
+            login_method = login(driver, email, password, use_cache=False)
+            print(f"Logged in via {login_method}")
 
             # 4. 홈 페이지 - 프로필 버튼 클릭
             home_page.click_profile_button()
@@ -62,13 +55,42 @@ class TestLoginProfile:
 
             # 추가적인 검증 로직을 추가할 수 있습니다.
             assert wid is not None, "wid 값을 추출하지 못했습니다."
-
-        except Exception as e:
-            # 에러 발생 시 스크린샷 저장
-            test_name = os.path.splitext(os.path.basename(__file__))[0]
-            save_screenshot(driver, test_name)
-            raise e
         finally:
             # 테스트 종료 시 이메일(ID), 비밀번호(PWD), WID를 출력 (비밀번호는 보안을 위해 일부 마스킹)
             masked_password = password[:2] + "****" + password[-2:] if len(password) > 4 else "****"
             print(f"Test completed with email: {email}, password: {masked_password}, wid: {wid}")
+
+    def test_profile_with_cached_session(self, driver, home_page, profile_page, tmp_path):
+        """
+        세션 스냅샷으로 로그인한 뒤 프로필 페이지로 이동하는 테스트.
+
+        Steps:
+            1. UI로 로그인하고 세션 스냅샷 저장 (임시 디렉토리의 SessionCache).
+            2. 쿠키와 스토리지를 지워 로그아웃 상태로 만든 뒤, 스냅샷으로 다시 로그인.
+            3. 프로필 페이지로 이동하여 wid 추출.
+
+        Args:
+            driver: Selenium WebDriver 인스턴스.
+            home_page: HomePage 인스턴스.
+            profile_page: ProfilePage 인스턴스.
+            tmp_path: 스냅샷을 저장할 임시 디렉토리.
+        """
+        email = self.get_env_variable("TEST_EMAIL")
+        password = self.get_env_variable("TEST_USER_PASSWORD")
+        cache = SessionCache(cache_dir=str(tmp_path))
+
+        # 1. UI 로그인 후 스냅샷 저장
+        assert login(driver, email, password, cache=cache) == "ui"
+        assert cache.load(email) is not None, "세션 스냅샷이 저장되지 않았습니다."
+
+        # 2. 로그아웃 상태에서 스냅샷으로 로그인
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.get(Driver.BASE_URL)
+        assert login(driver, email, password, cache=cache) == "snapshot", "세션 스냅샷으로 로그인하지 못했습니다."
+
+        # 3. 프로필 페이지로 이동 및 wid 추출
+        home_page.click_profile_button()
+        profile_page.verify_profile_page()
+        wid = profile_page.extract_wid()
+        assert wid is not None, "wid 값을 추출하지 못했습니다."
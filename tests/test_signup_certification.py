@@ -1,9 +1,22 @@
 import os
-import time
-from core.slack import Slack
-from core.utils import generate_random_email, save_screenshot
+import pytest
+from core.driver import Driver
+from core.assertions import PageAssert
+from core.slack_poller import create_verification_source
+from core.utils import generate_random_email
 
-slack_helper = Slack()
+# 인증 URL 조회 객체 (수집 단계에서는 Slack 설정이 없을 수 있으므로 처음 사용할 때 생성)
+_slack_helper = None
+
+
+def get_slack_helper():
+    """
+    SLACK_POLLER_URL이 설정되어 있으면 머신 공유 폴러를, 아니면 프로세스 내 Slack 인덱스를 반환.
+    """
+    global _slack_helper
+    if _slack_helper is None:
+        _slack_helper = create_verification_source()
+    return _slack_helper
 
 
 class TestSignUpCertification:
@@ -33,25 +46,19 @@ class TestSignUpCertification:
         return value
 
     @staticmethod
-    def get_slack_verification_url(email, retries=3, wait_time=10):
+    def get_slack_verification_url(email, timeout=30, poll_interval=2):
         """
         Slack에서 인증 URL을 가져오는 메서드. 특정 이메일 주소에 해당하는 인증 링크를 Slack 메시지 찾기
 
         Args:
             email (str): Slack에서 찾을 이메일 주소.
-            retries (int, optional): 재시도 횟수. 기본값은 3회.
-            wait_time (int, optional): 각 재시도 사이의 대기 시간 (초). 기본값 10초.
+            timeout (int, optional): 최대 대기 시간 (초). 기본값 30초.
+            poll_interval (int, optional): 새 메시지 조회 간격 (초). 기본값 2초.
 
         Returns:
             str: 찾은 인증 URL이 없을 경우 None.
         """
-        verification_url = None
-        for _ in range(retries):  # 최대 3번(retries) 번 시도
-            verification_url = slack_helper.find_verification_url_by_email(email)
-            if verification_url:
-                break
-            time.sleep(wait_time)
-        return verification_url
+        return get_slack_helper().wait_for_verification_url(email, timeout=timeout, poll_interval=poll_interval)
 
     @staticmethod
     def agree_all_terms(agreement_page):
@@ -64,9 +71,11 @@ class TestSignUpCertification:
         agreement_page.click_agree_all()
         agreement_page.click_next()
 
+    @pytest.mark.checkpoint("agreed", "verification_url", "verified")
     def test_signup_and_verify_profile(
             self,
             driver,
+            checkpoint,
             home_page,
             signup_page,
             password_page,
@@ -89,8 +98,12 @@ class TestSignUpCertification:
             9. 홈 페이지 - 프로필 버튼 클릭
             10. 프로필 페이지로 이동 확인 및 wid 값 추출
 
+        CHECKPOINT=true 이고 이전 실행이 중간에 실패했다면 마지막 체크포인트(6, 7, 8단계 이후)의 브라우저 상태와
+        이메일/인증 URL을 복원하여 다음 단계부터 이어서 실행 (비밀번호는 환경 변수에서 다시 읽음).
+
         Args:
             driver: Selenium WebDriver 인스턴스.
+            checkpoint: FlowCheckpoint 인스턴스.
             home_page: HomePage 인스턴스.
             signup_page: SignUpPage 인스턴스.
             password_page: PasswordPage 인스턴스.
@@ -103,39 +116,52 @@ class TestSignUpCertification:
         wid = None
 
         try:
-            # 환경 변수에서 비밀번호 가져오기
+            # 이전 실행의 체크포인트가 있으면 복원
+            context = checkpoint.resume(driver)
+            email = context.get("email")
+            verification_url = context.get("verification_url")
+
+            # 환경 변수에서 비밀번호 가져오기 (체크포인트에는 저장하지 않음)
             password = self.get_env_variable("USER_PASSWORD")
 
-            # 1. 이메일 생성
-            email = generate_random_email()  # 랜덤 이메일 생성
-            print(f"Generated email: {email}")
+            if not checkpoint.reached("agreed"):
+
+                # 1. 이메일 생성
+                email = generate_random_email()  # 랜덤 이메일 생성
+                print(f"Generated email: {email}")
 
-            # 2.홈 페이지 - 로그인(sign_in) 클릭.
-            home_page.click_sign_in()
+                # 2.홈 페이지 - 로그인(sign_in) 클릭.
+                home_page.click_sign_in()
 
-            # 3. 회원가입 페이지 - 이메일 입력 및 계속하기 클릭
-            signup_page.enter_email(email)
-            signup_page.click_continue()
-            signup_page.click_signup()
+                # 3. 회원가입 페이지 - 이메일 입력 및 계속하기 클릭
+                signup_page.enter_email(email)
+                signup_page.click_continue()
+                signup_page.click_signup()
 
-            # 4. 비밀번호 설정 페이지
-            password_page.enter_password(password)
-            password_page.click_next()
+                # 4. 비밀번호 설정 페이지
+                password_page.enter_password(password)
+                password_page.click_next()
 
-            # 5. 닉네임 설정 페이지
-            nickname_page.enter_nickname("아보카도")  # 테스트 닉네임으로 "아보카도" 사용
-            nickname_page.click_next()
+                # 5. 닉네임 설정 페이지
+                nickname_page.enter_nickname("아보카도")  # 테스트 닉네임으로 "아보카도" 사용
+                nickname_page.click_next()
 
-            # 6. 이용 약관 동의 페이지
-            self.agree_all_terms(agreement_page)
+                # 6. 이용 약관 동의 페이지
+                self.agree_all_terms(agreement_page)
+                checkpoint.save(driver, "agreed", email=email)
 
-            # 7. Slack에서 이메일 인증 URL 가져오기
-            verification_url = self.get_slack_verification_url(email)
-            assert verification_url is not None, "인증 URL을 가져오지 못했습니다."
+            if not checkpoint.reached("verification_url"):
+                # 7. Slack에서 이메일 인증 URL 가져오기
+                verification_url = self.get_slack_verification_url(email)
+                assert verification_url is not None, "인증 URL을 가져오지 못했습니다."
+                checkpoint.save(driver, "verification_url", verification_url=verification_url)
 
-            # 8. 인증 URL을 사용하여 이메일 인증 완료
-            driver.get(verification_url)
-            assert "환영합니다!" in driver.page_source, "가입 완료 단계에 도달하지 못했습니다."
+            if not checkpoint.reached("verified"):
+                # 8. 인증 URL을 사용하여 이메일 인증 완료
+                driver.get(verification_url)
+                PageAssert(driver).shows_text("환영합니다!", message="가입 완료 단계에 도달하지 못했습니다.")
+                # 인증 URL은 다시 사용할 수 없으므로 홈 페이지로 복원
+                checkpoint.save(driver, "verified", url=Driver.BASE_URL)
 
             # 9. 홈 페이지 - 프로필 버튼 클릭
             home_page.click_profile_button()
@@ -145,16 +171,9 @@ class TestSignUpCertification:
             wid = profile_page.extract_wid()  # wid 값 추출
             assert wid is not None, "wid 값을 추출하지 못했습니다."
             print(f"Extracted wid: {wid}")
-
-        except Exception as e:
-            # 에러 발생 시 스크린샷 저장
-            test_name = os.path.splitext(os.path.basename(__file__))[0]
-            save_screenshot(driver, test_name)
-            raise e
         finally:
             # 테스트 종료 시 이메일(ID), 비밀번호(PWD), WID를 출력 (비밀번호는 보안을 위해 일부 마스킹)
             masked_password = (
                 password[:2] + "****" + password[-2:] if password and len(password) > 4 else "****"
             )
             print(f"Test completed with email: {email}, password: {masked_password}, wid: {wid}")
-
@@ -0,0 +1,70 @@
+import uuid
+import pytest
+
+from core.slack import Slack
+from standin.slack_server import SlackStandInServer, verification_message
+
+
+@pytest.fixture
+def slack_standin(monkeypatch):
+    """
+    호출 한도가 없는 Slack 대역 서버와, 그 서버를 바라보는 Slack 인스턴스 (테스트마다 새 채널 사용).
+    """
+    server = SlackStandInServer().serve_in_background()
+    channel = f"C{uuid.uuid4().hex[:8].upper()}"
+    monkeypatch.setenv("SLACK_API_BASE_URL", server.api_url)
+    monkeypatch.setenv("SLACK_API_TOKEN", "xoxb-standin")
+    monkeypatch.setenv("SLACK_CHANNEL_ID", channel)
+    yield server, channel, Slack()
+    server.shutdown()
+
+
+class TestSlackIndex:
+    """
+    Slack 메시지 증분 조회(워터마크)와 이메일 인덱스 테스트
+    """
+
+    def test_sync_indexes_messages_and_moves_watermark(self, slack_standin):
+        server, channel, slack = slack_standin
+        server.post_message(channel, "배포 알림 (인증 메일 아님)")
+        server.post_message(channel, verification_message("a@benx.com", "https://verify.test/a"))
+        newest = server.post_message(channel, verification_message("b@benx.com", "https://verify.test/b"))
+
+        assert slack.sync() == 3
+        assert slack.lookup("a@benx.com") == "https://verify.test/a"
+        assert slack.lookup("b@benx.com") == "https://verify.test/b"
+        assert slack._state["oldest"] == newest
+
+        # 워터마크 이후 새 메시지가 없으면 다시 가져오지 않음
+        assert slack.sync() == 0
+        server.post_message(channel, verification_message("c@benx.com", "https://verify.test/c"))
+        assert slack.sync() == 1
+        assert slack.lookup("c@benx.com") == "https://verify.test/c"
+
+    def test_sync_follows_every_page(self, slack_standin, monkeypatch):
+        server, channel, slack = slack_standin
+        monkeypatch.setattr(Slack, "PAGE_SIZE", 2)
+        for index in range(5):
+            server.post_message(channel, verification_message(f"user{index}@benx.com", f"https://verify.test/{index}"))
+        calls = server.stats["calls"]
+
+        assert slack.sync() == 5
+        assert server.stats["calls"] - calls == 3
+        assert all(slack.lookup(f"user{index}@benx.com") == f"https://verify.test/{index}" for index in range(5))
+
+    def test_latest_message_wins_and_lookup_ignores_case(self, slack_standin):
+        server, channel, slack = slack_standin
+        server.post_message(channel, verification_message("Retry@Benx.com", "https://verify.test/old"))
+        server.post_message(channel, verification_message("retry@benx.com", "https://verify.test/new"))
+
+        slack.sync()
+        assert slack.lookup("RETRY@benx.com") == "https://verify.test/new"
+
+    def test_index_is_shared_across_instances(self, slack_standin):
+        server, channel, slack = slack_standin
+        server.post_message(channel, verification_message("shared@benx.com", "https://verify.test/shared"))
+        slack.sync()
+        calls = server.stats["calls"]
+
+        assert Slack().find_verification_url_by_email("shared@benx.com") == "https://verify.test/shared"
+        assert server.stats["calls"] == calls
@@ -0,0 +1,77 @@
+import time
+import uuid
+import pytest
+from urllib.error import URLError
+
+from core.slack import Slack
+from core.slack_poller import SlackPoller
+from standin.slack_server import SlackStandInServer, verification_message
+
+
+@pytest.fixture
+def slack_standin(monkeypatch):
+    """
+    분당 호출 한도가 2인 Slack 대역 서버와, 그 서버를 바라보는 Slack 인스턴스 (테스트마다 새 채널 사용).
+    """
+    server = SlackStandInServer(rate_limit=2).serve_in_background()
+    monkeypatch.setenv("SLACK_API_BASE_URL", server.api_url)
+    monkeypatch.setenv("SLACK_API_TOKEN", "xoxb-standin")
+    monkeypatch.setenv("SLACK_CHANNEL_ID", f"C{uuid.uuid4().hex[:8].upper()}")
+    yield server, Slack()
+    server.shutdown()
+
+
+class TestSlackPoller:
+    """
+    SlackPoller의 rate limit 처리 테스트
+    """
+
+    def test_subscribe_does_not_bypass_retry_after(self, slack_standin):
+        """
+        Retry-After 대기 중에 새 구독이 생겨도 API를 다시 호출하지 않음.
+
+        Steps:
+            1. 구독을 0.3초 간격으로 10개 추가 (한도 2회를 넘겨 429 발생).
+            2. 호출 수가 한도 + 429 응답 1회에서 더 늘지 않는지 확인.
+        """
+        server, slack = slack_standin
+        poller = SlackPoller(slack).start()
+        try:
+            for index in range(10):
+                poller.subscribe(f"user{index}@benx.com")
+                time.sleep(0.3)
+
+            assert server.stats["ratelimited"] == 1, f"Retry-After 대기 중 API를 호출했습니다: {server.stats}"
+            assert server.stats["calls"] == 3, f"Retry-After 대기 중 API를 호출했습니다: {server.stats}"
+            assert poller._not_before > time.monotonic()
+        finally:
+            poller.stop()
+
+    def test_transport_error_does_not_stop_polling(self, slack_standin, monkeypatch):
+        """
+        Slack 호출이 연결 오류로 실패해도 폴링 스레드가 계속 동작함.
+
+        Steps:
+            1. 첫 번째 sync 호출에서 URLError 발생.
+            2. 인증 메시지를 보낸 뒤, 다음 폴링에서 구독이 완료되는지 확인.
+        """
+        server, slack = slack_standin
+        monkeypatch.setattr(SlackPoller, "MIN_INTERVAL", 0.1)
+        sync = slack.sync
+        calls = []
+
+        def flaky_sync():
+            calls.append(time.monotonic())
+            if len(calls) == 1:
+                raise URLError("connection refused")
+            return sync()
+
+        monkeypatch.setattr(slack, "sync", flaky_sync)
+        server.post_message(slack.channel_id, verification_message("flaky@benx.com", "https://verify.test/flaky"))
+        poller = SlackPoller(slack).start()
+        try:
+            assert poller.wait_for_verification_url("flaky@benx.com", timeout=5) == "https://verify.test/flaky"
+            assert len(calls) >= 2
+            assert poller._thread.is_alive()
+        finally:
+            poller.stop()
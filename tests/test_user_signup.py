@@ -4,7 +4,8 @@ from pages.signup.signup_page import SignUpPage
 from pages.signup.password_page import PasswordPage
 from pages.signup.nickname_page import NicknamePage
 from pages.signup.agreement_page import AgreementPage
-from core.utils import generate_random_email, save_screenshot
+from core.utils import generate_random_email
+from core.assertions import PageAssert
 
 
 class TestUserSignUp:
@@ -84,13 +85,7 @@ class TestUserSignUp:
             agreement_page.click_next()
 
             # 7. 이메일 인증 화면 확인 - 회원가입의 마지막 단계 확인
-            assert "이제 이메일을 인증해주세요!" in driver.page_source, "이메일 인증 안내 화면에 도달하지 못했습니다."
-
-        except Exception as e:
-            # 에러 발생 시 스크린샷을 저장하여 디버깅 정보를 제공
-            test_name = os.path.splitext(os.path.basename(__file__))[0]  # 현재 파일명에서 확장자 제거
-            save_screenshot(driver, test_name)
-            raise e
+            PageAssert(driver).shows_text("이제 이메일을 인증해주세요!", message="이메일 인증 안내 화면에 도달하지 못했습니다.")
         finally:
             # 테스트 종료 시 이메일(ID)과 비밀번호(PWD)를 출력 (비밀번호는 보안을 위해 일부 마스킹)
             masked_password = password[:2] + "****" + password[-2:] if len(password) > 4 else "****"